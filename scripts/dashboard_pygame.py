@@ -5,24 +5,47 @@ Live dashboard using pygame.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import os
 import atexit
 import threading
+from collections import deque
 import time
 import traceback
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 import subprocess
 from pathlib import Path
+from typing import Callable, NamedTuple
 
+import numpy as np
 import pygame
 import sys
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional speedup
+    FileSystemEventHandler = object
+    Observer = None
+
 sys.path.insert(0, "src")
 
-from oanda_autotrader.app import build_stream_client, load_account_client
-from oanda_autotrader.config import load_account_groups, resolve_account_credentials, select_account
-from oanda_autotrader.monitor import measure_account_latency
+from oanda_autotrader.app import build_stream_client, load_account_client_async
+from oanda_autotrader.async_http import close_shared_sessions
+from oanda_autotrader.config import (
+    account_groups_signature,
+    load_account_groups,
+    resolve_account_credentials,
+    select_account,
+)
 from oanda_autotrader.monitoring import monitor_loop
 from oanda_autotrader.stream_metrics import StreamMetrics
 from oanda_autotrader.trade_latency_gate import (
@@ -39,26 +62,109 @@ def _env(name: str, default: str) -> str:
 
 
 def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
+    # Whitespace-only values count as unset rather than failing int().
+    value = (os.getenv(name) or "").strip()
     return int(value) if value else default
 
 
 def _env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
-    if value is None or value == "":
+    value = (os.getenv(name) or "").strip()
+    if not value:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.lower() in {"1", "true", "yes", "on"}
 
 
 def _env_float(name: str, default: float) -> float:
-    value = os.getenv(name)
+    value = (os.getenv(name) or "").strip()
     return float(value) if value else default
 
 
+def _json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(payload) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=True)
+
+
+class FileChangeNotifier:
+    """Wakes file polling loops early when a watched file is written.
+
+    With watchdog installed, writes (including atomic replaces) to a watched
+    path set the events registered for it so loops read the new line
+    immediately; without it, wait() degrades to a fixed-interval sleep.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: dict[str, list[threading.Event]] = {}
+        self._watched_dirs: set[str] = set()
+        self._observer = None
+
+    def register(self, path: str, event: threading.Event) -> None:
+        key = os.path.abspath(path)
+        with self._lock:
+            events = self._events.setdefault(key, [])
+            if event not in events:
+                events.append(event)
+            directory = os.path.dirname(key)
+            if Observer is not None and directory not in self._watched_dirs and os.path.isdir(directory):
+                try:
+                    if self._observer is None:
+                        self._observer = Observer()
+                        self._observer.daemon = True
+                        self._observer.start()
+                    self._observer.schedule(_NotifierHandler(self), directory, recursive=False)
+                    self._watched_dirs.add(directory)
+                except Exception:
+                    pass
+
+    def notify(self, path: str) -> None:
+        for event in self._events.get(os.path.abspath(path), ()):
+            event.set()
+
+    def wait(self, paths: list[str], event: threading.Event, timeout: float) -> bool:
+        # Registering every time lets directories created after startup get watched.
+        for path in paths:
+            self.register(path, event)
+        woke = event.wait(timeout)
+        event.clear()
+        return woke
+
+
+class _NotifierHandler(FileSystemEventHandler):
+    def __init__(self, notifier: FileChangeNotifier) -> None:
+        super().__init__()
+        self._notifier = notifier
+
+    # Reads by the loops themselves emit opened/closed_no_write; ignore those.
+    _WRITE_EVENTS = {"created", "modified", "moved", "closed"}
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory or event.event_type not in self._WRITE_EVENTS:
+            return
+        self._notifier.notify(event.src_path)
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            self._notifier.notify(dest)
+
+
+_FILE_NOTIFIER = FileChangeNotifier()
+
+
+@lru_cache(maxsize=256)
 def _parse_timestamp(value: str | None) -> datetime | None:
+    # Called every frame with the same prediction/candle timestamps, hence the cache.
     if not value:
         return None
     raw = value.strip()
+    parsed = _parse_timestamp_fast(raw)
+    if parsed is not None:
+        return parsed
     if raw.endswith("Z"):
         raw = raw[:-1]
     if "." in raw:
@@ -71,6 +177,49 @@ def _parse_timestamp(value: str | None) -> datetime | None:
         return None
 
 
+@lru_cache(maxsize=16)
+def _clock_label(ts: float) -> str:
+    # The last-error time only changes when a new error arrives.
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%H:%M:%S")
+
+
+@lru_cache(maxsize=4)
+def _uptime_label(seconds: int) -> str:
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+def _parse_timestamp_fast(raw: str) -> datetime | None:
+    """Slice-parse YYYY-MM-DDTHH:MM:SS[.fff...][Z|+00:00]; None if not that shape."""
+    if len(raw) < 19 or raw[4] != "-" or raw[7] != "-" or raw[10] != "T" or raw[13] != ":" or raw[16] != ":":
+        return None
+    rest = raw[19:]
+    micros = 0
+    if rest.startswith("."):
+        end = 1
+        while end < len(rest) and rest[end].isdigit():
+            end += 1
+        digits = rest[1:end]
+        if not digits:
+            return None
+        micros = int(digits[:6].ljust(6, "0"))
+        rest = rest[end:]
+    if rest not in ("", "Z", "+00:00"):
+        return None
+    try:
+        return datetime(
+            int(raw[0:4]),
+            int(raw[5:7]),
+            int(raw[8:10]),
+            int(raw[11:13]),
+            int(raw[14:16]),
+            int(raw[17:19]),
+            micros,
+            timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
 def _fmt_float(value: float | None, precision: int = 5) -> str:
     if value is None:
         return "--"
@@ -88,16 +237,20 @@ def _last_json_line(path: str) -> dict | None:
                 return None
             chunk = min(size, 65536)
             handle.seek(-chunk, os.SEEK_END)
-            data = handle.read().decode("utf-8", errors="ignore")
-        lines = [line for line in data.splitlines() if line.strip()]
-        if not lines:
+            data = handle.read()
+        # Scan back from EOF for the last non-blank line instead of splitting
+        # the whole chunk; only that slice is decoded.
+        end = len(data.rstrip())
+        if end == 0:
             return None
-        return json.loads(lines[-1])
+        start = data.rfind(b"\n", 0, end) + 1
+        return _json_loads(data[start:end].decode("utf-8", errors="ignore"))
     except Exception:
         return None
 
 
-def _candle_file_age(candles_dir: str, pattern: str) -> tuple[float | None, str | None]:
+def _candle_file_time(candles_dir: str, pattern: str) -> tuple[float | None, str | None]:
+    """Return the epoch time of the newest candle on disk and its file."""
     path = None
     try:
         files = sorted(
@@ -111,195 +264,482 @@ def _candle_file_age(candles_dir: str, pattern: str) -> tuple[float | None, str
         ts = _parse_timestamp(line.get("time")) if line else None
         if not ts:
             return None, path
-        age = max(0.0, time.time() - ts.timestamp())
-        return age, path
+        return ts.timestamp(), path
     except Exception:
         return None, path
 
 
+# Column layout of SharedState.candles_arr rows.
+_O, _H, _L, _C, _V, _TS = range(6)
+
+
+class HistoryRing:
+    """Fixed-capacity float64 history stored in one preallocated array.
+
+    ``append`` writes in place at the head index, so samples are kept as
+    8-byte floats rather than boxed Python objects and nothing is allocated
+    per update. ``to_array`` returns an ordered copy for publishing.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._data = np.zeros(max(capacity, 1), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self._data.size
+        if self._count < self._data.size:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.to_array().tolist())
+
+    def to_array(self) -> np.ndarray:
+        if self._count < self._data.size:
+            return self._data[: self._count].copy()
+        return np.concatenate((self._data[self._head :], self._data[: self._head]))
+
+
+class DashboardSnapshot(NamedTuple):
+    """Immutable view of everything the render loop draws.
+
+    SharedState swaps in a new instance after every update, so the render
+    loop reads one attribute instead of copying fields under the lock.
+    """
+
+    practice_latency_ms: float | None = None
+    live_latency_ms: float | None = None
+    practice_history: np.ndarray = np.empty(0, dtype=np.float64)
+    live_history: np.ndarray = np.empty(0, dtype=np.float64)
+    live_pl: float | None = None
+    live_balance: float | None = None
+    candles: np.ndarray = np.empty((0, 6), dtype=np.float64)
+    instrument_last_close: float | None = None
+    instrument_last_volume: int | None = None
+    instrument_last_ts: str | None = None
+    autoencoder_status: dict | None = None
+    predictions: dict | None = None
+    pred_lows: np.ndarray = np.empty(0, dtype=np.float64)
+    pred_highs: np.ndarray = np.empty(0, dtype=np.float64)
+    pred_means: np.ndarray = np.empty(0, dtype=np.float64)
+    pred_low_min: float | None = None
+    pred_high_max: float | None = None
+    pred_step1_mean: float | None = None
+    pred_stepN_mean: float | None = None
+    recon: dict | None = None
+    recon_history: np.ndarray = np.empty(0, dtype=np.float64)
+    recon_min: float | None = None
+    recon_max: float | None = None
+    recon_std_error: float | None = None
+    recon_k: float = 1.5
+    pred_scores: dict | None = None
+    coverage_history: tuple[float, ...] = ()
+    retrain_history: tuple[bool, ...] = ()
+    candle_file_ts: float | None = None
+    pred_file_mtime: float | None = None
+    score_file_mtime: float | None = None
+
+
 class SharedState:
-    def __init__(self) -> None:
+    def __init__(self, max_points: int = 120, max_candles: int = 120) -> None:
+        # Serialises writers only; readers take `snapshot`, which writers
+        # replace wholesale (a single attribute store) while holding it.
         self.lock = threading.Lock()
+        self.snapshot = DashboardSnapshot()
+        # Set by every update that changes what the dashboard draws; the render
+        # loop sleeps on it instead of redrawing identical frames.
+        self.dirty = threading.Event()
         self.practice_latency_ms: float | None = None
         self.live_latency_ms: float | None = None
-        self.practice_history: list[float] = []
-        self.live_history: list[float] = []
+        self.practice_history = HistoryRing(max_points)
+        self.live_history = HistoryRing(max_points)
         self.live_pl: float | None = None
         self.live_balance: float | None = None
         self.last_summary_ts: float | None = None
-        self.instrument_candles: list[dict] = []
-        self.instrument_times: list[str] = []
+        # Closed candles as a (n, 6) float64 array; see the _O.._TS columns.
+        # Writers publish a new array instead of mutating, so readers can hold
+        # a reference outside the lock without copying.
+        self.candles_arr = np.empty((0, 6), dtype=np.float64)
         self.instrument_last_close: float | None = None
         self.instrument_last_volume: int | None = None
         self.instrument_last_ts: str | None = None
         self.autoencoder_status: dict | None = None
         self.predictions: dict | None = None
+        self.pred_lows = np.empty(0, dtype=np.float64)
+        self.pred_highs = np.empty(0, dtype=np.float64)
+        self.pred_means = np.empty(0, dtype=np.float64)
+        self.pred_low_min: float | None = None
+        self.pred_high_max: float | None = None
+        self.pred_step1_mean: float | None = None
+        self.pred_stepN_mean: float | None = None
         self.recon: dict | None = None
-        self.recon_history: list[float] = []
+        self.recon_history = HistoryRing(max_candles)
         self.recon_std_error: float | None = None
         self.recon_k: float = 1.5
         self.pred_scores: dict | None = None
-        self.coverage_history: list[float] = []
+        self.coverage_history: deque[float] = deque(maxlen=max_candles)
         self.retrain_gate: dict | None = None
-        self.retrain_history: list[bool] = []
+        self.retrain_history: deque[bool] = deque(maxlen=max_candles)
         self.stream_metrics = StreamMetrics(window_seconds=10)
         self.last_latency_log_ts: float | None = None
         self.trade_gate: TradeLatencyGate | None = None
         self.trade_gate_mode: str | None = None
         self.trade_gate_instrument: str | None = None
         self.candle_interval = 5
-        self.max_candles = 120
+        self.max_candles = max_candles
         self._bucket_start: float | None = None
-        self._bucket: dict | None = None
+        self._bucket_open = 0.0
+        self._bucket_high = 0.0
+        self._bucket_low = 0.0
+        self._bucket_close = 0.0
+        self._bucket_volume = 0
 
-    def update_latency(self, kind: str, value: float, max_points: int) -> None:
+    def update_latency(self, kind: str, value: float) -> None:
         with self.lock:
             if kind == "practice":
                 self.practice_latency_ms = value
                 self.practice_history.append(value)
-                self.practice_history = self.practice_history[-max_points:]
+                self.snapshot = self.snapshot._replace(
+                    practice_latency_ms=value, practice_history=self.practice_history.to_array()
+                )
             else:
                 self.live_latency_ms = value
                 self.live_history.append(value)
-                self.live_history = self.live_history[-max_points:]
+                self.snapshot = self.snapshot._replace(
+                    live_latency_ms=value, live_history=self.live_history.to_array()
+                )
+        self.dirty.set()
 
     def update_summary(self, pl: float | None, balance: float | None) -> None:
         with self.lock:
             self.live_pl = pl
             self.live_balance = balance
             self.last_summary_ts = time.time()
+            self.snapshot = self.snapshot._replace(live_pl=pl, live_balance=balance)
+        self.dirty.set()
 
     def update_instrument(
-        self, candles: list[dict], times: list[str], last_volume: int | None
+        self, candles: list[dict] | np.ndarray, times: list[str], last_volume: int | None
     ) -> None:
+        # Accepts either candle dicts or an (n, 6) array already in _O.._TS
+        # column order; candle times live in the _TS column.
+        if isinstance(candles, np.ndarray):
+            arr = np.asarray(candles, dtype=np.float64).reshape(-1, 6)
+        else:
+            arr = np.asarray(
+                [[c["o"], c["h"], c["l"], c["c"], c.get("v", 0), c.get("ts", 0.0)] for c in candles],
+                dtype=np.float64,
+            ).reshape(-1, 6)
         with self.lock:
-            self.instrument_candles = candles
-            self.instrument_times = times
-            if candles:
-                self.instrument_last_close = candles[-1]["c"]
+            self.candles_arr = arr[-self.max_candles :]
+            if len(arr):
+                self.instrument_last_close = float(arr[-1, _C])
             if times:
                 self.instrument_last_ts = times[-1]
             self.instrument_last_volume = last_volume
+            self.snapshot = self.snapshot._replace(
+                candles=self.candles_arr,
+                instrument_last_close=self.instrument_last_close,
+                instrument_last_volume=last_volume,
+                instrument_last_ts=self.instrument_last_ts,
+            )
+        self.dirty.set()
 
     def update_autoencoder_status(self, status: dict | None) -> None:
         with self.lock:
             self.autoencoder_status = status
+            self.snapshot = self.snapshot._replace(autoencoder_status=status)
+        self.dirty.set()
 
     def update_predictions(self, preds: dict | None) -> None:
+        # Extract the horizon once per prediction update so the render loop
+        # only reads arrays and scalars.
+        horizon = (preds.get("horizon") if preds else None) or []
+        try:
+            lows = np.asarray([item["low"] for item in horizon if item.get("low") is not None], dtype=np.float64)
+            highs = np.asarray([item["high"] for item in horizon if item.get("high") is not None], dtype=np.float64)
+            means = np.asarray([item["mean"] for item in horizon if item.get("mean") is not None], dtype=np.float64)
+        except (AttributeError, TypeError, ValueError):
+            lows = highs = means = np.empty(0, dtype=np.float64)
         with self.lock:
             self.predictions = preds
+            self.pred_lows = lows
+            self.pred_highs = highs
+            self.pred_means = means
+            self.pred_low_min = float(lows.min()) if lows.size else None
+            self.pred_high_max = float(highs.max()) if highs.size else None
+            self.pred_step1_mean = horizon[0].get("mean") if horizon else None
+            self.pred_stepN_mean = horizon[-1].get("mean") if horizon else None
+            self.snapshot = self.snapshot._replace(
+                predictions=preds,
+                pred_lows=lows,
+                pred_highs=highs,
+                pred_means=means,
+                pred_low_min=self.pred_low_min,
+                pred_high_max=self.pred_high_max,
+                pred_step1_mean=self.pred_step1_mean,
+                pred_stepN_mean=self.pred_stepN_mean,
+            )
+        self.dirty.set()
 
     def update_recon(self, recon: dict | None) -> None:
         with self.lock:
             self.recon = recon
             if recon and "recon" in recon:
                 self.recon_history.append(float(recon["recon"]))
-                self.recon_history = self.recon_history[-self.max_candles :]
                 if "std_error" in recon:
                     self.recon_std_error = float(recon["std_error"])
                 if "k" in recon:
                     self.recon_k = float(recon["k"])
+            # Reduce once per recon record here rather than once per frame.
+            history = self.recon_history.to_array()
+            self.snapshot = self.snapshot._replace(
+                recon=recon,
+                recon_history=history,
+                recon_min=float(history.min()) if history.size else None,
+                recon_max=float(history.max()) if history.size else None,
+                recon_std_error=self.recon_std_error,
+                recon_k=self.recon_k,
+            )
+        self.dirty.set()
 
     def update_scores(self, scores: dict | None) -> None:
         with self.lock:
             self.pred_scores = scores
             if scores and isinstance(scores.get("coverage"), (int, float)):
                 self.coverage_history.append(float(scores["coverage"]))
-                self.coverage_history = self.coverage_history[-self.max_candles :]
+            self.snapshot = self.snapshot._replace(
+                pred_scores=scores, coverage_history=tuple(self.coverage_history)
+            )
+        self.dirty.set()
 
     def update_retrain_gate(self, gate: dict | None) -> None:
         with self.lock:
             self.retrain_gate = gate
             if gate and isinstance(gate.get("allow"), bool):
                 self.retrain_history.append(bool(gate["allow"]))
-                self.retrain_history = self.retrain_history[-self.max_candles :]
+            self.snapshot = self.snapshot._replace(retrain_history=tuple(self.retrain_history))
+        self.dirty.set()
 
-    def update_tick(self, price: float, ts: float) -> None:
+    def update_file_times(
+        self, candle_file_ts: float | None, pred_mtime: float | None, score_mtime: float | None
+    ) -> None:
         with self.lock:
-            if self._bucket_start is None:
-                self._bucket_start = ts - (ts % self.candle_interval)
-                self._bucket = {"o": price, "h": price, "l": price, "c": price, "v": 1, "ts": self._bucket_start}
+            snap = self.snapshot
+            if (snap.candle_file_ts, snap.pred_file_mtime, snap.score_file_mtime) == (
+                candle_file_ts,
+                pred_mtime,
+                score_mtime,
+            ):
                 return
-            if ts >= self._bucket_start + self.candle_interval:
-                if self._bucket:
-                    self.instrument_candles.append(self._bucket)
-                    self.instrument_candles = self.instrument_candles[-self.max_candles :]
-                    self.instrument_last_close = self._bucket["c"]
-                    self.instrument_last_ts = datetime.fromtimestamp(self._bucket_start, tz=timezone.utc).isoformat()
-                    self.instrument_last_volume = self._bucket["v"]
-                self._bucket_start = ts - (ts % self.candle_interval)
-                self._bucket = {"o": price, "h": price, "l": price, "c": price, "v": 1, "ts": self._bucket_start}
+            self.snapshot = snap._replace(
+                candle_file_ts=candle_file_ts, pred_file_mtime=pred_mtime, score_file_mtime=score_mtime
+            )
+        self.dirty.set()
+
+    def update_tick(self, price: float, ts: float) -> None:
+        # Hot path: one call per PRICE message. The open bucket lives in plain
+        # float attributes; a candle dict is only built when the bucket rolls.
+        with self.lock:
+            start = self._bucket_start
+            if start is not None and ts < start + self.candle_interval:
+                self._bucket_close = price
+                if price > self._bucket_high:
+                    self._bucket_high = price
+                elif price < self._bucket_low:
+                    self._bucket_low = price
+                self._bucket_volume += 1
                 return
-            if self._bucket:
-                self._bucket["c"] = price
-                self._bucket["h"] = max(self._bucket["h"], price)
-                self._bucket["l"] = min(self._bucket["l"], price)
-                self._bucket["v"] += 1
+            if start is not None:
+                self._close_bucket(start)
+            self._bucket_start = ts - (ts % self.candle_interval)
+            self._bucket_open = price
+            self._bucket_high = price
+            self._bucket_low = price
+            self._bucket_close = price
+            self._bucket_volume = 1
+
+    def _close_bucket(self, start: float) -> None:
+        old = self.candles_arr
+        keep = min(old.shape[0], max(self.max_candles - 1, 0))
+        arr = np.empty((keep + 1, 6), dtype=np.float64)
+        arr[:keep] = old[old.shape[0] - keep :]
+        arr[keep] = (
+            self._bucket_open,
+            self._bucket_high,
+            self._bucket_low,
+            self._bucket_close,
+            self._bucket_volume,
+            start,
+        )
+        self.candles_arr = arr
+        self.instrument_last_close = self._bucket_close
+        self.instrument_last_ts = datetime.fromtimestamp(start, tz=timezone.utc).isoformat()
+        self.instrument_last_volume = self._bucket_volume
+        self.snapshot = self.snapshot._replace(
+            candles=arr,
+            instrument_last_close=self.instrument_last_close,
+            instrument_last_volume=self.instrument_last_volume,
+            instrument_last_ts=self.instrument_last_ts,
+        )
+        self.dirty.set()
+
+
+def _log_task_exit(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        _log_dashboard_event(f"task_failed {task.get_coro().__name__}: {error!r}")
+
+
+@lru_cache(maxsize=8)
+def _cached_account_client(group: str, account: str, signature: tuple[int, int]):
+    return load_account_client_async("accounts.yaml", group, account)
 
 
-def latency_loop(state: SharedState, interval: int, max_points: int) -> None:
+def _shared_account_client(group: str, account: str):
+    # One async client, and so one aiohttp session, per account: the latency
+    # probe and the summary poll for the same account share a connection.
+    # Keyed on the accounts.yaml signature so an edited token or account is
+    # picked up; failures are not cached, so a missing file is retried.
+    return _cached_account_client(group, account, account_groups_signature("accounts.yaml"))
+
+
+async def latency_loop(state: SharedState, interval: float) -> None:
+    """Sample practice/live REST latency on the stream's event loop."""
     while True:
         try:
-            _, ms = measure_account_latency("accounts.yaml", "demo", "Primary")
-            state.update_latency("practice", ms, max_points)
-            _, ms = measure_account_latency("accounts.yaml", "live", "Primary")
-            state.update_latency("live", ms, max_points)
+            for kind, group in (("practice", "demo"), ("live", "live")):
+                client = _shared_account_client(group, "Primary")
+                start = time.perf_counter()
+                await client.list_accounts()
+                state.update_latency(kind, (time.perf_counter() - start) * 1000.0)
         except Exception:
             pass
-        time.sleep(interval)
+        await asyncio.sleep(interval)
+
 
+_get_pl = itemgetter("pl")
+_get_balance = itemgetter("balance")
 
-def summary_loop(state: SharedState, interval: int, group: str, account: str) -> None:
+
+def _summary_float(getter: Callable[[dict], object], summary: dict) -> float | None:
+    # One lookup per field; a missing or null field reads as None.
+    try:
+        return float(getter(summary))
+    except (KeyError, TypeError):
+        return None
+
+
+async def summary_loop(state: SharedState, group: str, account: str, interval: float) -> None:
     while True:
         try:
-            client = load_account_client("accounts.yaml", group, account)
+            # load_account_groups is cached until the file changes, so this
+            # is one stat per poll and follows an edited account id.
             groups = load_account_groups("accounts.yaml")
-            group_obj, entry = select_account(groups, group, account)
-            payload = client.get_account_summary(entry.account_id)
-            account = payload.get("account", {})
-            pl = float(account.get("pl")) if account.get("pl") is not None else None
-            balance = (
-                float(account.get("balance")) if account.get("balance") is not None else None
-            )
-            state.update_summary(pl, balance)
+            _, entry = select_account(groups, group, account)
+            account_id = entry.account_id
+            payload = await _shared_account_client(group, account).get_account_summary(account_id)
+            summary = payload.get("account", {})
+            state.update_summary(_summary_float(_get_pl, summary), _summary_float(_get_balance, summary))
         except Exception:
             pass
-        time.sleep(interval)
+        await asyncio.sleep(interval)
 
 
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def tail_job(
+    path: str,
+    callback: Callable[[dict | None], None],
+    loader: Callable[[str], dict | None] = _last_json_line,
+) -> Callable[[], None]:
+    """Build a poll job that hands the latest record of ``path`` to ``callback``.
+
+    The file is only read when its size or mtime changed since the last run.
+    """
+    seen: list[object] = [object()]
+
+    def run() -> None:
+        signature = _file_signature(path)
+        if signature == seen[0]:
+            return
+        seen[0] = signature
+        callback(loader(path))
 
+    return run
 
-def autoencoder_status_loop(state: SharedState, interval: int, path: str) -> None:
+
+def poll_scheduler(jobs: list[tuple[float, Callable[[], None], list[str]]]) -> None:
+    """Run the dashboard's periodic jobs from a single thread.
+
+    Each job is (interval, fn, paths). A heap keyed on the next due time
+    picks the job to run; a filesystem event on any watched path makes
+    every job with paths due immediately.
+    """
+    if not jobs:
+        return
+    paths = [path for _, _, job_paths in jobs for path in job_paths]
+    wake = threading.Event()
+    now = time.monotonic()
+    queue = [(now, index) for index in range(len(jobs))]
+    heapq.heapify(queue)
     while True:
-        status = None
+        due, index = queue[0]
+        delay = due - time.monotonic()
+        if delay > 0:
+            if _FILE_NOTIFIER.wait(paths, wake, delay):
+                now = time.monotonic()
+                queue = [(now if jobs[i][2] else d, i) for d, i in queue]
+                heapq.heapify(queue)
+            continue
+        heapq.heappop(queue)
+        interval, fn, _ = jobs[index]
         try:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as handle:
-                    lines = handle.read().strip().splitlines()
-                    if lines:
-                        status = json.loads(lines[-1])
+            fn()
         except Exception:
-            status = None
-        state.update_autoencoder_status(status)
-        time.sleep(interval)
+            pass
+        heapq.heappush(queue, (time.monotonic() + interval, index))
 
 
 def load_latest_prediction(path: str) -> dict | None:
     if not os.path.exists(path):
         return None
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            lines = handle.read().strip().splitlines()
-            for line in reversed(lines):
-                if not line:
-                    continue
-                candidate = json.loads(line)
-                if "horizon_secs" not in candidate or "horizon" not in candidate:
-                    continue
-                return candidate
+        with open(path, "rb") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            chunk = 65536
+            while True:
+                # Scan the tail first and only widen the window when no
+                # forecast record is found in it.
+                start = max(0, size - chunk)
+                handle.seek(start)
+                lines = handle.read().splitlines()
+                if start:
+                    lines = lines[1:]
+                for line in reversed(lines):
+                    if not line.strip():
+                        continue
+                    candidate = _json_loads(line)
+                    if "horizon_secs" not in candidate or "horizon" not in candidate:
+                        continue
+                    return candidate
+                if start == 0:
+                    return None
+                chunk *= 4
     except Exception:
         return None
-    return None
 
 
 def _log_dashboard_event(message: str) -> None:
@@ -314,7 +754,7 @@ def _log_dashboard_json(event: str, payload: dict) -> None:
     path = os.getenv("OANDA_DASHBOARD_LOG_PATH", "data/dashboard.log")
     os.makedirs(os.path.dirname(path), exist_ok=True)
     stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    line = json.dumps({"ts": stamp, "event": event, **payload}, ensure_ascii=True)
+    line = _json_dumps({"ts": stamp, "event": event, **payload})
     with open(path, "a", encoding="utf-8") as handle:
         handle.write(line + "\n")
 
@@ -411,95 +851,96 @@ def stop_dashboard_processes(processes: list[subprocess.Popen]) -> None:
             continue
 
 
-def predictions_loop(state: SharedState, interval: int, path: str) -> None:
-    while True:
-        preds = load_latest_prediction(path)
-        state.update_predictions(preds)
-        time.sleep(interval)
+def stop_async_loop(
+    loop: asyncio.AbstractEventLoop, tasks: list[asyncio.Task], timeout: float = 5.0
+) -> None:
+    """Cancel the background tasks, close pooled HTTP sessions, stop the loop.
 
+    Runs from the pygame thread while the loop runs on its own thread.
+    """
 
-def recon_loop(state: SharedState, interval: int, path: str) -> None:
-    while True:
-        recon = None
-        try:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as handle:
-                    lines = handle.read().strip().splitlines()
-                    if lines:
-                        recon = json.loads(lines[-1])
-        except Exception:
-            recon = None
-        state.update_recon(recon)
-        time.sleep(interval)
+    async def shutdown() -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Account clients are not context-managed, so their requests share
+        # sessions that only this closes.
+        await close_shared_sessions()
 
+    try:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=timeout)
+    except Exception:
+        _log_dashboard_event("async_shutdown_incomplete")
+    loop.call_soon_threadsafe(loop.stop)
 
-def scores_loop(state: SharedState, interval: int, path: str) -> None:
-    while True:
-        scores = None
-        try:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as handle:
-                    lines = handle.read().strip().splitlines()
-                    if lines:
-                        scores = json.loads(lines[-1])
-        except Exception:
-            scores = None
-        state.update_scores(scores)
-        time.sleep(interval)
 
+def _file_mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
-def retrain_gate_loop(state: SharedState, interval: int, monitor_path: str) -> None:
-    while True:
-        gate = None
-        try:
-            latest = _last_json_line(monitor_path)
-            if latest:
-                gate = latest.get("retrain_gate")
-        except Exception:
-            gate = None
-        state.update_retrain_gate(gate)
-        time.sleep(interval)
+
+def poll_file_times(
+    state: SharedState, candles_dir: str, candles_pattern: str, preds_path: str, scores_path: str
+) -> None:
+    # Globbing the candle directory and stat'ing the outputs used to happen
+    # on the render thread; the frame now only subtracts from time.time().
+    candle_ts, _ = _candle_file_time(candles_dir, candles_pattern)
+    state.update_file_times(candle_ts, _file_mtime(preds_path), _file_mtime(scores_path))
+
+
+def _update_retrain_gate(state: SharedState, latest: dict | None) -> None:
+    state.update_retrain_gate(latest.get("retrain_gate") if latest else None)
 
 async def stream_loop(state: SharedState, group: str, account: str, instrument: str) -> None:
     groups = load_account_groups("accounts.yaml")
     group_obj, entry = select_account(groups, group, account)
     config = resolve_account_credentials(group_obj, entry)
+    events_log_path = os.getenv("OANDA_STREAM_EVENTS_LOG_PATH", "data/stream_events.jsonl")
+    log_path = os.getenv("OANDA_STREAM_LATENCY_LOG_PATH", "data/stream_latency.jsonl")
+    log_interval = _env_float("OANDA_STREAM_LATENCY_LOG_INTERVAL", 5.0)
+    gate_path = os.getenv(
+        "OANDA_TRADE_LATENCY_LOG_PATH",
+        f"data/trade_latency_gate_{group}_{instrument}.jsonl",
+    )
+    os.makedirs(os.path.dirname(events_log_path), exist_ok=True)
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    os.makedirs(os.path.dirname(gate_path), exist_ok=True)
+    metrics = state.stream_metrics
+
     def on_event(event: dict) -> None:
-        state.stream_metrics.on_event(event)
-        log_path = os.getenv("OANDA_STREAM_EVENTS_LOG_PATH", "data/stream_events.jsonl")
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
-        with open(log_path, "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event) + "\n")
+        metrics.on_event(event)
+        with open(events_log_path, "a", encoding="utf-8") as handle:
+            handle.write(_json_dumps(event) + "\n")
 
     async with build_stream_client(config, on_event=on_event) as stream:
         async for msg in stream.stream_pricing(entry.account_id, [instrument]):
             payload = msg.raw if hasattr(msg, "raw") else msg
             if payload.get("type") != "PRICE":
                 continue
-            bids = payload.get("bids") or []
-            asks = payload.get("asks") or []
-            if not bids or not asks:
+            # PRICE messages always carry bids/asks; index directly and only
+            # fall back to skipping the message when a field is missing.
+            try:
+                bid = float(payload["bids"][0]["price"])
+                ask = float(payload["asks"][0]["price"])
+            except (KeyError, IndexError, TypeError, ValueError):
                 continue
-            bid = float(bids[0].get("price"))
-            ask = float(asks[0].get("price"))
             mid = (bid + ask) / 2.0
             ts = time.time()
             state.update_tick(mid, ts)
-            state.stream_metrics.record_latency(payload.get("time"), ts)
-            if state.trade_gate is not None:
-                state.trade_gate.update(
-                    state.stream_metrics.last_latency_raw_ms,
-                    effective_ms=state.stream_metrics.last_effective_ms,
-                    backlog=bool(state.stream_metrics.last_backlog),
-                    outlier=bool(
-                        state.stream_metrics.last_latency_raw_ms is not None
-                        and abs(state.stream_metrics.last_latency_raw_ms)
-                        > state.trade_gate.config.outlier_high_ms
-                    ),
-                    skew_ms=state.stream_metrics.last_skew_ms,
+            server_time = payload.get("time")
+            metrics.record_latency(server_time, ts)
+            trade_gate = state.trade_gate
+            if trade_gate is not None:
+                raw_ms = metrics.last_latency_raw_ms
+                trade_gate.update(
+                    raw_ms,
+                    effective_ms=metrics.last_effective_ms,
+                    backlog=bool(metrics.last_backlog),
+                    outlier=bool(raw_ms is not None and abs(raw_ms) > trade_gate.config.outlier_high_ms),
+                    skew_ms=metrics.last_skew_ms,
                 )
-            log_path = os.getenv("OANDA_STREAM_LATENCY_LOG_PATH", "data/stream_latency.jsonl")
-            log_interval = _env_float("OANDA_STREAM_LATENCY_LOG_INTERVAL", 5.0)
             if state.last_latency_log_ts is None or ts - state.last_latency_log_ts >= log_interval:
                 state.last_latency_log_ts = ts
                 sample = {
@@ -507,54 +948,123 @@ async def stream_loop(state: SharedState, group: str, account: str, instrument:
                     "mode": group,
                     "instrument": instrument,
                     "received_ts": ts,
-                    "server_time": payload.get("time"),
-                    "latency_ms_raw": state.stream_metrics.last_latency_raw_ms,
-                    "latency_ms_clamped": state.stream_metrics.last_latency_ms,
-                    "effective_ms": state.stream_metrics.last_effective_ms,
-                    "clock_offset_ms": state.stream_metrics.clock_offset_ms,
-                    "skew_ms": state.stream_metrics.last_skew_ms,
-                    "is_backlog": state.stream_metrics.last_backlog,
-                    "is_outlier": state.stream_metrics.last_outlier,
+                    "server_time": server_time,
+                    "latency_ms_raw": metrics.last_latency_raw_ms,
+                    "latency_ms_clamped": metrics.last_latency_ms,
+                    "effective_ms": metrics.last_effective_ms,
+                    "clock_offset_ms": metrics.clock_offset_ms,
+                    "skew_ms": metrics.last_skew_ms,
+                    "is_backlog": metrics.last_backlog,
+                    "is_outlier": metrics.last_outlier,
                 }
-                os.makedirs(os.path.dirname(log_path), exist_ok=True)
                 with open(log_path, "a", encoding="utf-8") as handle:
-                    handle.write(json.dumps(sample) + "\n")
-                if state.trade_gate is not None:
-                    gate_path = os.getenv(
-                        "OANDA_TRADE_LATENCY_LOG_PATH",
-                        f"data/trade_latency_gate_{group}_{instrument}.jsonl",
-                    )
-                    os.makedirs(os.path.dirname(gate_path), exist_ok=True)
+                    handle.write(_json_dumps(sample) + "\n")
+                if trade_gate is not None:
                     with open(gate_path, "a", encoding="utf-8") as gate_handle:
-                        gate_handle.write(json.dumps(state.trade_gate.snapshot()) + "\n")
+                        gate_handle.write(_json_dumps(trade_gate.snapshot()) + "\n")
+
+
+async def supervise_stream_loop(
+    state: SharedState,
+    group: str,
+    account: str,
+    instrument: str,
+    *,
+    backoff_base_seconds: float = 1.0,
+    backoff_max_seconds: float = 60.0,
+) -> None:
+    """Keep stream_loop running, restarting it with exponential backoff.
+
+    The stream client already reconnects on network errors; this covers
+    everything else that ends the loop (bad config, an unexpected error, a
+    clean stream end) so the stream metrics never silently stop.
+    """
+    metrics = state.stream_metrics
+    attempt = 0
+    while True:
+        started = time.monotonic()
+        try:
+            await stream_loop(state, group, account, instrument)
+        except Exception as exc:
+            metrics.on_event({"event": "stream_error", "error": str(exc), "received_ts": time.time()})
+            _log_dashboard_event(f"stream_loop_failed {exc!r}")
+        # A run that outlived the longest backoff was healthy; start over.
+        attempt = 1 if time.monotonic() - started > backoff_max_seconds else attempt + 1
+        delay = min(backoff_base_seconds * (2 ** (attempt - 1)), backoff_max_seconds)
+        metrics.on_event({"event": "stream_reconnect_wait", "delay_seconds": delay, "received_ts": time.time()})
+        await asyncio.sleep(delay)
+
+
+# Both mappers fold the divisor into one scale factor so each point costs a
+# multiply rather than a divide, and work in place so a call allocates one
+# float buffer and one int result instead of a temporary per operator.
+def _screen_xs(indices, rect, x_divisor: float) -> np.ndarray:
+    scaled = np.multiply(indices, rect.width / x_divisor, dtype=np.float64)
+    out = scaled.astype(np.int64)
+    out += rect.left
+    return out
+
+
+def _screen_ys(values, rect, min_val: float, span: float) -> np.ndarray:
+    scaled = np.subtract(values, min_val, dtype=np.float64)
+    scaled *= rect.height / span
+    out = scaled.astype(np.int64)
+    np.subtract(rect.bottom, out, out=out)
+    return out
+
+
+def _screen_points(values, rect, *, min_val: float, span: float, x_divisor: float) -> list[list[int]]:
+    """Map a series to [x, y] pixel points in one vectorized pass."""
+    points = np.empty((len(values), 2), dtype=np.int64)
+    points[:, 0] = _screen_xs(np.arange(len(values)), rect, x_divisor)
+    points[:, 1] = _screen_ys(values, rect, min_val, span)
+    return points.tolist()
+
+
+def _prediction_band_geometry(lows, highs, means, rect, price_min: float, price_max: float):
+    """Return (band polygon in rect-local coords, mean line in screen coords)."""
+    # Draw prediction band as an expanding cloud.
+    step_px = max(8, int(rect.width / max(means.size + 2, 1)))
+    start_x = rect.right - (means.size * step_px) - 10
+    # Map to screen coords using full scale.
+    span = max(price_max - price_min, price_max * 0.002, 1e-6)
+    n = min(lows.size, highs.size, means.size)
+    xs = start_x + np.arange(n) * step_px
+    y_lows = _screen_ys(lows[:n], rect, price_min, span)
+    y_highs = _screen_ys(highs[:n], rect, price_min, span)
+    y_means = _screen_ys(means[:n], rect, price_min, span)
+    points_mean = np.column_stack([xs, y_means]).tolist()
+    if not n:
+        return None, points_mean
+    # Low edge left to right, then high edge back, in overlay coords.
+    band_poly = (
+        np.concatenate([np.column_stack([xs, y_lows]), np.column_stack([xs[::-1], y_highs[::-1]])]) - rect.topleft
+    ).tolist()
+    return band_poly, points_mean
 
 
 def draw_graph(screen, values, color, rect):
     if len(values) < 2:
         return
-    max_val = max(values) if max(values) > 0 else 1.0
-    min_val = min(values)
+    vals = np.asarray(values, dtype=np.float64)
+    max_val = float(vals.max()) if vals.max() > 0 else 1.0
+    min_val = float(vals.min())
     span = max(max_val - min_val, 1.0)
-    points = []
-    for i, value in enumerate(values):
-        x = rect.left + int(i * rect.width / max(len(values) - 1, 1))
-        y = rect.bottom - int(((value - min_val) / span) * rect.height)
-        points.append((x, y))
+    points = _screen_points(vals, rect, min_val=min_val, span=span, x_divisor=max(len(vals) - 1, 1))
     pygame.draw.lines(screen, color, False, points, 2)
 
 
 def draw_candles(screen, candles, rect, *, min_val: float, max_val: float, hit_map: dict | None = None):
     if len(candles) < 2:
         return
+    n = len(candles)
     span = max(max_val - min_val, max_val * 0.002, 1e-6)
-    candle_width = max(2, int(rect.width / max(len(candles), 1)) - 2)
-    for i, c in enumerate(candles):
-        x = rect.left + int(i * rect.width / max(len(candles), 1))
-        y_high = rect.bottom - int(((c["h"] - min_val) / span) * rect.height)
-        y_low = rect.bottom - int(((c["l"] - min_val) / span) * rect.height)
-        y_open = rect.bottom - int(((c["o"] - min_val) / span) * rect.height)
-        y_close = rect.bottom - int(((c["c"] - min_val) / span) * rect.height)
-        color = (80, 200, 120) if c["c"] >= c["o"] else (220, 80, 80)
+    candle_width = max(2, int(rect.width / n) - 2)
+    xs = _screen_xs(np.arange(n), rect, n).tolist()
+    ys = _screen_ys(candles[:, _O : _C + 1], rect, min_val, span).tolist()
+    ups = (candles[:, _C] >= candles[:, _O]).tolist()
+    for i, (x, (y_open, y_high, y_low, y_close), up) in enumerate(zip(xs, ys, ups)):
+        color = (80, 200, 120) if up else (220, 80, 80)
         pygame.draw.line(screen, color, (x + candle_width // 2, y_high), (x + candle_width // 2, y_low), 1)
         body_top = min(y_open, y_close)
         body_h = abs(y_close - y_open)
@@ -573,21 +1083,24 @@ def draw_candles(screen, candles, rect, *, min_val: float, max_val: float, hit_m
 def draw_dashed_line(screen, points, color, dash_length=6):
     if len(points) < 2:
         return
-    for i in range(len(points) - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + 1]
-        dx = x2 - x1
-        dy = y2 - y1
-        dist = max((dx * dx + dy * dy) ** 0.5, 1.0)
-        steps = int(dist // dash_length)
-        for s in range(0, steps, 2):
-            t1 = s / steps
-            t2 = min((s + 1) / steps, 1.0)
-            sx = x1 + dx * t1
-            sy = y1 + dy * t1
-            ex = x1 + dx * t2
-            ey = y1 + dy * t2
-            pygame.draw.line(screen, color, (sx, sy), (ex, ey), 1)
+    pts = np.asarray(points, dtype=np.float64)
+    deltas = np.diff(pts, axis=0)
+    dist = np.maximum(np.hypot(deltas[:, 0], deltas[:, 1]), 1.0)
+    steps = (dist // dash_length).astype(np.int64)
+    # Every other dash-length step of each segment is inked: ceil(steps / 2)
+    # dashes per segment, all endpoints computed in one pass.
+    counts = (steps + 1) // 2
+    seg = np.repeat(np.arange(len(steps)), counts)
+    if not seg.size:
+        return
+    step = 2 * (np.arange(seg.size) - np.repeat(np.cumsum(counts) - counts, counts))
+    origin = pts[seg]
+    delta = deltas[seg]
+    starts = origin + delta * (step / steps[seg])[:, None]
+    ends = origin + delta * ((step + 1) / steps[seg])[:, None]
+    draw_line = pygame.draw.line
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        draw_line(screen, color, start, end, 1)
 
 
 def draw_grid(screen, rect, rows=5, cols=5, color=(40, 46, 60)):
@@ -599,6 +1112,90 @@ def draw_grid(screen, rect, rows=5, cols=5, color=(40, 46, 60)):
         pygame.draw.line(screen, color, (x, rect.top), (x, rect.bottom), 1)
 
 
+class PriceChartLayers:
+    """Keeps the price chart background and candle layer between frames.
+
+    The fill + grid only change with the chart size and the candles only
+    change when a bucket closes or the autoscale moves, so both are drawn
+    to persistent surfaces and blitted each frame.
+    """
+
+    def __init__(self) -> None:
+        self._background: pygame.Surface | None = None
+        self._candles: pygame.Surface | None = None
+        self._candles_key: tuple | None = None
+
+    def background(self, size: tuple[int, int]) -> pygame.Surface:
+        if self._background is None or self._background.get_size() != size:
+            surface = pygame.Surface(size)
+            surface.fill((30, 36, 48))
+            draw_grid(surface, surface.get_rect())
+            self._background = surface
+        return self._background
+
+    def candles(
+        self,
+        size: tuple[int, int],
+        candles: np.ndarray,
+        *,
+        min_val: float,
+        max_val: float,
+        hit_map: dict | None = None,
+    ) -> pygame.Surface:
+        key = (
+            size,
+            len(candles),
+            float(candles[-1, _TS]) if len(candles) else None,
+            min_val,
+            max_val,
+            tuple(sorted(hit_map.items())) if hit_map else None,
+        )
+        if self._candles is None or key != self._candles_key:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw_candles(surface, candles, surface.get_rect(), min_val=min_val, max_val=max_val, hit_map=hit_map)
+            self._candles = surface
+            self._candles_key = key
+        return self._candles
+
+
+class OverlaySurface:
+    """Reusable SRCALPHA surface that only clears what was drawn on it last time.
+
+    begin() returns the surface, reallocating only when the size changes;
+    mark() records the bounding rect of each draw so the next begin() can
+    zero just that area instead of allocating and clearing a full surface.
+    An optional key passed to begin() lets holds() report that the surface
+    already contains that drawing, so callers can skip redrawing it.
+    """
+
+    def __init__(self) -> None:
+        self.surface: pygame.Surface | None = None
+        self._dirty: pygame.Rect | None = None
+        self._key = None
+
+    def holds(self, size: tuple[int, int], key) -> bool:
+        return self.surface is not None and self.surface.get_size() == size and key == self._key
+
+    def begin(self, size: tuple[int, int], key=None) -> pygame.Surface:
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        elif self._dirty is not None:
+            self.surface.fill((0, 0, 0, 0), self._dirty)
+        self._dirty = None
+        self._key = key
+        return self.surface
+
+    def mark(self, rect: pygame.Rect) -> None:
+        self._dirty = rect if self._dirty is None else self._dirty.union(rect)
+
+
+@lru_cache(maxsize=256)
+def _render_text(font, text: str, color) -> pygame.Surface:
+    # Axis labels, legend and footer repeat the same strings frame after
+    # frame; keep the rasterized surfaces instead of going through SDL_ttf.
+    return font.render(text, True, color)
+
+
 def draw_axis_labels(
     screen,
     rect,
@@ -614,36 +1211,68 @@ def draw_axis_labels(
 ):
     if not values:
         return
-    max_val = max(values)
-    min_val = min(values)
+    min_val = float(min(values))
+    max_val = float(max(values))
     span = max(max_val - min_val, 1.0)
     suffix = f" {unit}" if unit else ""
     fmt = f"{{:.{precision}f}}"
-    top_label = font.render(f"{fmt.format(max_val)}{suffix}", True, color)
-    mid_label = font.render(f"{fmt.format(min_val + span / 2)}{suffix}", True, color)
-    bot_label = font.render(f"{fmt.format(min_val)}{suffix}", True, color)
+    # Key the cache on the label text rather than the raw range so ticks that
+    # move the range below the displayed precision reuse the same surfaces.
+    blits = _axis_label_blits(
+        tuple(rect),
+        f"{fmt.format(max_val)}{suffix}",
+        f"{fmt.format(min_val + span / 2)}{suffix}",
+        f"{fmt.format(min_val)}{suffix}",
+        font,
+        span_seconds,
+        align_right,
+        show_time,
+        color,
+    )
+    screen.blits(blits, doreturn=False)
+
+
+@lru_cache(maxsize=32)
+def _axis_label_blits(
+    rect: tuple[int, int, int, int],
+    top_text: str,
+    mid_text: str,
+    bot_text: str,
+    font,
+    span_seconds: int,
+    align_right: bool,
+    show_time: bool,
+    color,
+) -> tuple[tuple[pygame.Surface, tuple[int, int]], ...]:
+    # The labels only change when the displayed text or layout does; between
+    # those frames the whole (surface, position) list is reused as-is.
+    rect = pygame.Rect(rect)
+    top_label = _render_text(font, top_text, color)
+    mid_label = _render_text(font, mid_text, color)
+    bot_label = _render_text(font, bot_text, color)
     inset = 6
     if align_right:
-        screen.blit(top_label, (rect.right - top_label.get_width() - inset, rect.top + inset))
-        screen.blit(mid_label, (rect.right - mid_label.get_width() - inset, rect.centery - 10))
-        screen.blit(bot_label, (rect.right - bot_label.get_width() - inset, rect.bottom - 25))
+        blits = [
+            (top_label, (rect.right - top_label.get_width() - inset, rect.top + inset)),
+            (mid_label, (rect.right - mid_label.get_width() - inset, rect.centery - 10)),
+            (bot_label, (rect.right - bot_label.get_width() - inset, rect.bottom - 25)),
+        ]
     else:
-        screen.blit(top_label, (rect.left + inset, rect.top + inset))
-        screen.blit(mid_label, (rect.left + inset, rect.centery - 10))
-        screen.blit(bot_label, (rect.left + inset, rect.bottom - 25))
+        blits = [
+            (top_label, (rect.left + inset, rect.top + inset)),
+            (mid_label, (rect.left + inset, rect.centery - 10)),
+            (bot_label, (rect.left + inset, rect.bottom - 25)),
+        ]
 
     if show_time:
-        left_label = font.render("0s", True, color)
-        right_label = font.render(f"{span_seconds}s", True, color)
-        screen.blit(left_label, (rect.left + inset, rect.bottom - 20))
-        screen.blit(right_label, (rect.right - right_label.get_width() - inset, rect.bottom - 20))
+        left_label = _render_text(font, "0s", color)
+        right_label = _render_text(font, f"{span_seconds}s", color)
+        blits.append((left_label, (rect.left + inset, rect.bottom - 20)))
+        blits.append((right_label, (rect.right - right_label.get_width() - inset, rect.bottom - 20)))
+    return tuple(blits)
 
 
-def draw_text_wrapped(screen, font, text, x, y, max_width, color=(200, 200, 200), line_height: int | None = None):
-    if max_width <= 0:
-        return 0
-    if line_height is None:
-        line_height = font.get_linesize()
+def _wrap_text(font, text, max_width) -> list[str]:
     words = text.split()
     lines = []
     current = ""
@@ -657,9 +1286,17 @@ def draw_text_wrapped(screen, font, text, x, y, max_width, color=(200, 200, 200)
             current = word
     if current:
         lines.append(current)
+    return lines
+
+
+def draw_text_wrapped(screen, font, text, x, y, max_width, color=(200, 200, 200), line_height: int | None = None):
+    if max_width <= 0:
+        return 0
+    if line_height is None:
+        line_height = font.get_linesize()
+    lines = _wrap_text(font, text, max_width)
     for i, line in enumerate(lines):
-        rendered = font.render(line, True, color)
-        screen.blit(rendered, (x, y + i * line_height))
+        screen.blit(_render_text(font, line, color), (x, y + i * line_height))
     return len(lines)
 
 
@@ -680,7 +1317,7 @@ def draw_kv_table(
     value_width = max(total_width - key_width, 60)
     for key, value in items:
         key_text = f"{key}:"
-        key_render = font.render(key_text, True, key_color)
+        key_render = _render_text(font, key_text, key_color)
         screen.blit(key_render, (x, y_cursor))
         lines = draw_text_wrapped(
             screen,
@@ -696,6 +1333,72 @@ def draw_kv_table(
     return y_cursor
 
 
+class KVPanel:
+    """Prerendered key/value table; only rows whose text changed are re-rendered.
+
+    Each row is cached as its own strip surface keyed by (key, value). The
+    composed panel is rebuilt from strips only when some row changed, so a
+    steady-state frame is a single blit with no font rendering.
+    """
+
+    def __init__(
+        self,
+        font,
+        *,
+        key_width=180,
+        line_height=24,
+        key_color=(170, 170, 170),
+        value_color=(200, 200, 200),
+    ) -> None:
+        self.font = font
+        self.key_width = key_width
+        self.line_height = line_height
+        self.key_color = key_color
+        self.value_color = value_color
+        self._width: int | None = None
+        self._strips: dict[tuple[str, str], pygame.Surface] = {}
+        self._rows: list[tuple[str, str]] = []
+        self._surface: pygame.Surface | None = None
+
+    def _render_strip(self, key: str, value: str, total_width: int) -> pygame.Surface:
+        value_width = max(total_width - self.key_width, 60)
+        lines = _wrap_text(self.font, value, value_width)
+        strip = pygame.Surface((total_width, self.line_height * max(len(lines), 1)), pygame.SRCALPHA)
+        draw_kv_table(
+            strip,
+            self.font,
+            [(key, value)],
+            0,
+            0,
+            total_width,
+            key_width=self.key_width,
+            line_height=self.line_height,
+            key_color=self.key_color,
+            value_color=self.value_color,
+        )
+        return strip
+
+    def render(self, items, total_width: int) -> pygame.Surface:
+        rows = [(key, str(value)) for key, value in items]
+        if total_width != self._width:
+            self._width = total_width
+            self._strips = {}
+            self._surface = None
+        if self._surface is not None and rows == self._rows:
+            return self._surface
+        strips = {row: self._strips.get(row) or self._render_strip(*row, total_width) for row in rows}
+        height = sum(strips[row].get_height() for row in rows)
+        panel = pygame.Surface((total_width, max(height, 1)), pygame.SRCALPHA)
+        y_cursor = 0
+        for row in rows:
+            panel.blit(strips[row], (0, y_cursor))
+            y_cursor += strips[row].get_height()
+        self._strips = strips
+        self._rows = rows
+        self._surface = panel
+        return panel
+
+
 def main() -> None:
     interval = _env_int("OANDA_DASHBOARD_LATENCY_INTERVAL", 5)
     max_points = _env_int("OANDA_DASHBOARD_HISTORY", 120)
@@ -738,44 +1441,32 @@ def main() -> None:
             "stale_candle_s": _env_float("OANDA_RETRAIN_STALE_CANDLE_S", 120.0),
         }
 
-    state = SharedState()
+    state = SharedState(max_points=max_points, max_candles=instrument_points)
     start_ts = time.time()
-    t = threading.Thread(
-        target=latency_loop, args=(state, interval, max_points), daemon=True
-    )
-    t.start()
-    threading.Thread(
-        target=summary_loop,
-        args=(state, summary_interval, stream_group, stream_account),
-        daemon=True,
-    ).start()
     state.candle_interval = instrument_interval
-    state.max_candles = instrument_points
-    threading.Thread(
-        target=autoencoder_status_loop,
-        args=(state, autoencoder_status_interval, autoencoder_status_path),
-        daemon=True,
-    ).start()
-    threading.Thread(
-        target=predictions_loop,
-        args=(state, preds_interval, preds_path),
-        daemon=True,
-    ).start()
-    threading.Thread(
-        target=recon_loop,
-        args=(state, recon_interval, recon_path),
-        daemon=True,
-    ).start()
-    threading.Thread(
-        target=scores_loop,
-        args=(state, scores_interval, scores_path),
-        daemon=True,
-    ).start()
-    threading.Thread(
-        target=retrain_gate_loop,
-        args=(state, retrain_interval, monitor_path),
-        daemon=True,
-    ).start()
+    # One scheduler thread drives the file polls; the REST polls run as
+    # tasks on the stream's event loop below.
+    jobs = [
+        (preds_interval, tail_job(preds_path, state.update_predictions, load_latest_prediction), [preds_path]),
+        (
+            autoencoder_status_interval,
+            tail_job(autoencoder_status_path, state.update_autoencoder_status),
+            [autoencoder_status_path],
+        ),
+        (recon_interval, tail_job(recon_path, state.update_recon), [recon_path]),
+        (scores_interval, tail_job(scores_path, state.update_scores), [scores_path]),
+        (
+            retrain_interval,
+            tail_job(monitor_path, lambda latest: _update_retrain_gate(state, latest)),
+            [monitor_path],
+        ),
+        (
+            5.0,
+            lambda: poll_file_times(state, candles_dir, candles_pattern, preds_path, scores_path),
+            [preds_path, scores_path],
+        ),
+    ]
+    threading.Thread(target=poll_scheduler, args=(jobs,), daemon=True).start()
 
     thresholds_dir = os.getenv("OANDA_LATENCY_THRESHOLDS_DIR", "data")
     gate_config, gate_meta = load_thresholds(stream_group, instrument, base_dir=thresholds_dir)
@@ -786,21 +1477,27 @@ def main() -> None:
 
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
-    loop.create_task(
-        monitor_loop(
-            accounts_path="accounts.yaml",
-            interval_seconds=monitor_interval,
-            output_path=monitor_path,
-            stream_metrics=state.stream_metrics,
-            trade_gate=state.trade_gate,
-            retrain_gate_kwargs=retrain_gate_kwargs,
-        )
-    )
-    threading.Thread(
-        target=loop.run_until_complete,
-        args=(stream_loop(state, stream_group, stream_account, instrument),),
-        daemon=True,
-    ).start()
+    # Keep references: the loop only holds tasks weakly.
+    background_tasks = [
+        loop.create_task(latency_loop(state, interval)),
+        loop.create_task(summary_loop(state, stream_group, stream_account, summary_interval)),
+        loop.create_task(
+            monitor_loop(
+                accounts_path="accounts.yaml",
+                interval_seconds=monitor_interval,
+                output_path=monitor_path,
+                stream_metrics=state.stream_metrics,
+                trade_gate=state.trade_gate,
+                retrain_gate_kwargs=retrain_gate_kwargs,
+            )
+        ),
+        # The loop runs forever rather than until the stream returns, so a
+        # stream that fails does not also stop the other tasks.
+        loop.create_task(supervise_stream_loop(state, stream_group, stream_account, instrument)),
+    ]
+    for task in background_tasks:
+        task.add_done_callback(_log_task_exit)
+    threading.Thread(target=loop.run_forever, daemon=True).start()
 
     pygame.init()
     screen = pygame.display.set_mode((1100, 680), pygame.RESIZABLE)
@@ -809,14 +1506,25 @@ def main() -> None:
     font = pygame.font.SysFont("Consolas", 20)
 
     clock = pygame.time.Clock()
+    chart_layers = PriceChartLayers()
+    band_overlay = OverlaySurface()
+    coverage_overlay = OverlaySurface()
+    left_table = KVPanel(font, key_width=180, line_height=26)
+    right_table = KVPanel(font, key_width=160, line_height=26)
     running = True
     event_log_until = time.time() + 10
     ignore_quit = _env_bool("OANDA_DASHBOARD_IGNORE_QUIT", False)
+    pred_autoscale = _env_bool("OANDA_DASHBOARD_PRED_AUTOSCALE", False)
     last_tick_log = time.time()
     processes = start_dashboard_processes()
-    last_candle_check = 0.0
-    candle_file_age = None
-    candle_file_path = None
+    padding = 20
+    line_h = 26
+    # Static header lives on a screen-sized background; each frame restores
+    # last frame's dirty rects from it and only those rects are pushed.
+    background = None
+    prev_dirty: list[pygame.Rect] = []
+    pred_geom = None
+    wake_events = (pygame.QUIT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE)
     while running:
         for event in pygame.event.get():
             if time.time() < event_log_until:
@@ -838,52 +1546,51 @@ def main() -> None:
             if event.type == pygame.VIDEORESIZE:
                 screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
 
-        screen.fill((10, 12, 16))
         width, height = screen.get_size()
-        with state.lock:
-            practice = state.practice_latency_ms
-            live = state.live_latency_ms
-            practice_hist = list(state.practice_history)
-            live_hist = list(state.live_history)
-            metrics = state.stream_metrics.snapshot()
-            candles = list(state.instrument_candles)
-            last_close = state.instrument_last_close
-            last_vol = state.instrument_last_volume
-            last_candle_ts = state.instrument_last_ts
-            ae_status = state.autoencoder_status
-            preds = state.predictions
-            recon = state.recon
-            scores = state.pred_scores
-            coverage_hist = list(state.coverage_history)
-            retrain_hist = list(state.retrain_history)
-
-        if time.time() - last_candle_check >= 5.0:
-            last_candle_check = time.time()
-            candle_file_age, candle_file_path = _candle_file_age(candles_dir, candles_pattern)
-
-        padding = 20
-        line_h = 26
-        header = font.render("OANDA Live Dashboard", True, (230, 230, 230))
-        screen.blit(header, (padding, padding))
-
-        y = padding
-        title = font.render(
-            f"{instrument} | {instrument_interval}s candles   AE mode: reconstruction   Anomaly sigma: 2.0",
-            True,
-            (220, 220, 220),
-        )
-        screen.blit(title, (padding, y))
-        y += line_h
-
-        uptime_seconds = int(time.time() - start_ts)
-        uptime_label = f"{uptime_seconds // 3600:02d}:{(uptime_seconds % 3600) // 60:02d}:{uptime_seconds % 60:02d}"
-        last_err = (
-            datetime.fromtimestamp(metrics.last_error_ts, tz=timezone.utc).strftime("%H:%M:%S")
-            if metrics.last_error_ts
-            else "--"
-        )
-        pl_text = f"{state.live_pl:.2f}" if state.live_pl is not None else "--"
-        bal_text = f"{state.live_balance:.2f}" if state.live_balance is not None else "--"
+        full_redraw = background is None or background.get_size() != (width, height)
+        if full_redraw:
+            background = pygame.Surface((width, height))
+            background.fill((10, 12, 16))
+            header = font.render("OANDA Live Dashboard", True, (230, 230, 230))
+            background.blit(header, (padding, padding))
+            title = font.render(
+                f"{instrument} | {instrument_interval}s candles   AE mode: reconstruction   Anomaly sigma: 2.0",
+                True,
+                (220, 220, 220),
+            )
+            background.blit(title, (padding, padding))
+            screen.blit(background, (0, 0))
+        else:
+            screen.blits([(background, rect, rect) for rect in prev_dirty], doreturn=False)
+        snap = state.snapshot
+        metrics = state.stream_metrics.snapshot()
+        practice = snap.practice_latency_ms
+        live = snap.live_latency_ms
+        candles = snap.candles
+        last_close = snap.instrument_last_close
+        last_vol = snap.instrument_last_volume
+        last_candle_ts = snap.instrument_last_ts
+        ae_status = snap.autoencoder_status
+        preds = snap.predictions
+        pred_lows = snap.pred_lows
+        pred_highs = snap.pred_highs
+        pred_means = snap.pred_means
+        pred_low_min = snap.pred_low_min
+        pred_high_max = snap.pred_high_max
+        pred_step1_mean = snap.pred_step1_mean
+        pred_stepN_mean = snap.pred_stepN_mean
+        recon = snap.recon
+        scores = snap.pred_scores
+        coverage_hist = snap.coverage_history
+        retrain_hist = snap.retrain_history
+        ae_vals = snap.recon_history
+
+        y = padding + line_h
+
+        uptime_label = _uptime_label(int(time.time() - start_ts))
+        last_err = _clock_label(metrics.last_error_ts) if metrics.last_error_ts else "--"
+        pl_text = f"{snap.live_pl:.2f}" if snap.live_pl is not None else "--"
+        bal_text = f"{snap.live_balance:.2f}" if snap.live_balance is not None else "--"
         coverage = "--"
         mae = "--"
         if scores:
@@ -928,12 +1635,10 @@ def main() -> None:
         pred_high = None
         pred_recent = False
         pred_record = preds if preds and "horizon" in preds else None
-        pred_file_age = None
-        if os.path.exists(preds_path):
-            pred_file_age = max(0.0, time.time() - os.path.getmtime(preds_path))
-        score_file_age = None
-        if os.path.exists(scores_path):
-            score_file_age = max(0.0, time.time() - os.path.getmtime(scores_path))
+        now = time.time()
+        pred_file_age = max(0.0, now - snap.pred_file_mtime) if snap.pred_file_mtime is not None else None
+        score_file_age = max(0.0, now - snap.score_file_mtime) if snap.score_file_mtime is not None else None
+        candle_file_age = max(0.0, now - snap.candle_file_ts) if snap.candle_file_ts is not None else None
         pred_dt = _parse_timestamp(pred_record.get("ts")) if pred_record else None
         last_candle_dt = _parse_timestamp(last_candle_ts) if last_candle_ts else None
         candle_stream_age = None
@@ -947,40 +1652,31 @@ def main() -> None:
                 pred_recent = drift <= max(instrument_interval * 2, 10)
             else:
                 pred_recent = pred_age <= 120
-        if pred_record and pred_recent:
-            horizon = pred_record.get("horizon") or []
-            if horizon:
-                pred_base = pred_record.get("base_close")
-                pred_step1 = horizon[0].get("mean")
-                pred_stepN = horizon[-1].get("mean")
-                pred_low = min(item.get("low") for item in horizon if item.get("low") is not None)
-                pred_high = max(item.get("high") for item in horizon if item.get("high") is not None)
+        if pred_record and pred_recent and pred_record.get("horizon"):
+            pred_base = pred_record.get("base_close")
+            pred_step1 = pred_step1_mean
+            pred_stepN = pred_stepN_mean
+            pred_low = pred_low_min
+            pred_high = pred_high_max
 
         price_vals = []
-        for c in candles:
-            price_vals.extend([c["l"], c["h"]])
         pred_points = []
-        if price_vals:
-            price_min = min(price_vals)
-            price_max = max(price_vals)
+        if len(candles):
+            price_vals = [float(candles[:, _L].min()), float(candles[:, _H].max())]
+            price_min, price_max = price_vals
             pad = max((price_max - price_min) * 0.10, price_max * 0.001)
             price_min -= pad
             price_max += pad
         else:
             price_min = 0.0
             price_max = 1.0
-        pred_autoscale = _env_bool("OANDA_DASHBOARD_PRED_AUTOSCALE", False)
         if pred_record:
             if not pred_recent:
                 pred_status = "PRED: stale"
             else:
-                horizon = pred_record.get("horizon") or []
-                lows = [item.get("low") for item in horizon if item.get("low") is not None]
-                highs = [item.get("high") for item in horizon if item.get("high") is not None]
-                mean_vals = [item.get("mean") for item in horizon if item.get("mean") is not None]
-                if lows and highs and mean_vals:
-                    pred_low = min(lows)
-                    pred_high = max(highs)
+                if pred_lows.size and pred_highs.size and pred_means.size:
+                    pred_low = pred_low_min
+                    pred_high = pred_high_max
                     if pred_autoscale:
                         price_min = min(price_min, pred_low)
                         price_max = max(price_max, pred_high)
@@ -989,7 +1685,7 @@ def main() -> None:
                         price_max += pad
                     pred_in_view = pred_low <= price_max and pred_high >= price_min
                     pred_status = "PRED: ok" if pred_in_view else "PRED: offscale"
-                    pred_points = mean_vals if pred_in_view else []
+                    pred_points = pred_means if pred_in_view else []
 
         pred_hint = ""
         if pred_status == "PRED: stale":
@@ -1047,42 +1743,39 @@ def main() -> None:
             right_items.insert(4, ("Pred hint", pred_hint))
 
         table_width = max(320, (width - padding * 3) // 2)
-        left_end = draw_kv_table(
-            screen,
-            font,
-            left_items,
-            padding,
-            y + line_h,
-            table_width,
-            key_width=180,
-            line_height=line_h,
-        )
-        right_end = draw_kv_table(
-            screen,
-            font,
-            right_items,
-            padding * 2 + table_width,
-            y + line_h,
-            table_width,
-            key_width=160,
-            line_height=line_h,
+        tables_top = y + line_h
+        left_panel = left_table.render(left_items, table_width)
+        right_panel = right_table.render(right_items, table_width)
+        screen.blits(
+            [(left_panel, (padding, tables_top)), (right_panel, (padding * 2 + table_width, tables_top))],
+            doreturn=False,
         )
+        left_end = tables_top + left_panel.get_height()
+        right_end = tables_top + right_panel.get_height()
+        dirty = [
+            left_panel.get_rect(topleft=(padding, tables_top)),
+            right_panel.get_rect(topleft=(padding * 2 + table_width, tables_top)),
+        ]
 
-        draw_text_wrapped(
+        legend_top = max(left_end, right_end) + 4
+        legend_lines = draw_text_wrapped(
             screen,
             font,
             "accuracy markers: green=hit red=miss",
             padding,
-            max(left_end, right_end) + 4,
+            legend_top,
             width - padding * 2,
             (160, 160, 160),
         )
+        dirty.append(pygame.Rect(padding, legend_top, width - padding * 2, legend_lines * font.get_linesize()))
 
         charts_top = max(left_end, right_end) + line_h * 2
         chart_height = max(220, height - charts_top - padding - 80)
         price_rect = pygame.Rect(padding, charts_top, width - padding * 2, chart_height)
-        pygame.draw.rect(screen, (30, 36, 48), price_rect)
-        draw_grid(screen, price_rect)
+        screen.blit(chart_layers.background(price_rect.size), price_rect.topleft)
+        # Hit/miss markers sit a few pixels above their close, so the chart's
+        # dirty rect extends past the top edge.
+        dirty.append(price_rect.inflate(0, 24))
         # Coverage split band (hit vs miss) behind candles.
         if coverage_hist:
             band_height = max(18, int(price_rect.height * 0.12))
@@ -1092,40 +1785,49 @@ def main() -> None:
                 price_rect.width,
                 band_height,
             )
-            band_surface = pygame.Surface((band_rect.width, band_rect.height), pygame.SRCALPHA)
-            span = max(len(coverage_hist), 1)
-            step_px = max(2, int(band_rect.width / span))
-            start_x = band_rect.right - (len(coverage_hist) * step_px)
-            for i, cov in enumerate(coverage_hist[-span:]):
-                cov = min(max(cov, 0.0), 1.0)
-                x = start_x + i * step_px
-                red_h = int(band_rect.height * (1.0 - cov))
-                green_h = band_rect.height - red_h
-                if red_h > 0:
-                    pygame.draw.rect(
-                        band_surface,
-                        (200, 80, 80, 80),
-                        pygame.Rect(x - band_rect.left, band_rect.height - red_h, step_px, red_h),
-                    )
-                if green_h > 0:
-                    pygame.draw.rect(
-                        band_surface,
-                        (80, 200, 120, 90),
-                        pygame.Rect(x - band_rect.left, band_rect.height - red_h - green_h, step_px, green_h),
-                    )
-            screen.blit(band_surface, (band_rect.left, band_rect.top))
+            if not coverage_overlay.holds(band_rect.size, coverage_hist):
+                band_surface = coverage_overlay.begin(band_rect.size, coverage_hist)
+                step_px = max(2, int(band_rect.width / len(coverage_hist)))
+                band_h = band_rect.height
+                # Column x positions are local to the band surface.
+                x = band_rect.width - len(coverage_hist) * step_px
+                red_hs = (band_h * (1.0 - np.clip(coverage_hist, 0.0, 1.0))).astype(np.int64).tolist()
+                mark = coverage_overlay.mark
+                draw_rect = pygame.draw.rect
+                for red_h in red_hs:
+                    green_h = band_h - red_h
+                    if red_h > 0:
+                        mark(draw_rect(band_surface, (200, 80, 80, 80), pygame.Rect(x, green_h, step_px, red_h)))
+                    if green_h > 0:
+                        mark(draw_rect(band_surface, (80, 200, 120, 90), pygame.Rect(x, 0, step_px, green_h)))
+                    x += step_px
+            screen.blit(coverage_overlay.surface, band_rect.topleft)
+        # One pass over the scored steps feeds both the candle tint and the
+        # hit/miss markers drawn later.
         hit_map = {}
-        if scores and candles:
-            results = scores.get("results") or []
-            for item in results:
+        marker_idx = []
+        marker_hit = []
+        n_candles = len(candles)
+        if scores and n_candles:
+            for item in scores.get("results") or []:
                 step = item.get("step")
-                hit = item.get("hit")
-                if step is None or hit is None:
+                if step is None:
                     continue
-                idx = len(candles) - step
-                if 0 <= idx < len(candles):
+                idx = n_candles - step
+                if not 0 <= idx < n_candles:
+                    continue
+                hit = item.get("hit")
+                if hit is not None:
                     hit_map[idx] = bool(hit)
-        draw_candles(screen, candles, price_rect, min_val=price_min, max_val=price_max, hit_map=hit_map or None)
+                if item.get("actual") is not None:
+                    marker_idx.append(idx)
+                    marker_hit.append(hit)
+        screen.blit(
+            chart_layers.candles(
+                price_rect.size, candles, min_val=price_min, max_val=price_max, hit_map=hit_map or None
+            ),
+            price_rect.topleft,
+        )
         draw_axis_labels(
             screen,
             price_rect,
@@ -1153,51 +1855,70 @@ def main() -> None:
                 color = (80, 200, 120) if allow else (160, 160, 160)
                 pygame.draw.circle(screen, color, (x, y), 5)
 
-        if pred_points and pred_record:
-            # Draw prediction band as an expanding cloud.
-            lows = [item["low"] for item in pred_record["horizon"]]
-            highs = [item["high"] for item in pred_record["horizon"]]
-            mean_vals = [item["mean"] for item in pred_record["horizon"]]
-            step_px = max(8, int(price_rect.width / max(len(pred_points) + 2, 1)))
-            start_x = price_rect.right - (len(pred_points) * step_px) - 10
-            # Map to screen coords using full scale.
-            span = max(price_max - price_min, price_max * 0.002, 1e-6)
-            points_low = []
-            points_high = []
-            points_mean = []
-            for i, (low, high, mean) in enumerate(zip(lows, highs, mean_vals)):
-                x = start_x + i * step_px
-                y_low = price_rect.bottom - int(((low - price_min) / span) * price_rect.height)
-                y_high = price_rect.bottom - int(((high - price_min) / span) * price_rect.height)
-                y_mean = price_rect.bottom - int(((mean - price_min) / span) * price_rect.height)
-                points_low.append((x, y_low))
-                points_high.append((x, y_high))
-                points_mean.append((x, y_mean))
-            if points_low and points_high:
-                band_surface = pygame.Surface((price_rect.width, price_rect.height), pygame.SRCALPHA)
-                shifted_low = [(x - price_rect.left, y - price_rect.top) for x, y in points_low]
-                shifted_high = [(x - price_rect.left, y - price_rect.top) for x, y in points_high]
-                pygame.draw.polygon(
-                    band_surface, (80, 120, 200, 60), shifted_low + list(reversed(shifted_high))
+        # Both translucent bands (prediction cloud + AE error band) share one
+        # overlay surface and a single blit; the lines are drawn on top after.
+        band_poly = None
+        ae_band_rect = None
+        points_mean = []
+        if len(pred_points) and pred_record:
+            # A new forecast record always arrives as a new dict, so identity
+            # plus the scale and layout decide whether the geometry can be reused.
+            geom_key = (price_min, price_max, tuple(price_rect))
+            if pred_geom is None or pred_geom[0] is not preds or pred_geom[1] != geom_key:
+                pred_geom = (
+                    preds,
+                    geom_key,
+                    _prediction_band_geometry(pred_lows, pred_highs, pred_means, price_rect, price_min, price_max),
                 )
-                screen.blit(band_surface, (price_rect.left, price_rect.top))
-            if points_mean:
-                pygame.draw.lines(screen, (120, 180, 255), False, points_mean, 2)
+            band_poly, points_mean = pred_geom[2]
 
         # AE reconstruction band + line on right axis (separate scale)
-        ae_vals = list(state.recon_history)
-        if recon and ae_vals:
-            ae_min = min(ae_vals)
-            ae_max = max(ae_vals)
-            ae_std = state.recon_std_error or 0.0
-            k = state.recon_k
+        ae_points = []
+        if recon and ae_vals.size:
+            ae_min = snap.recon_min
+            ae_max = snap.recon_max
+            ae_std = snap.recon_std_error or 0.0
+            k = snap.recon_k
             ae_min -= k * ae_std
             ae_max += k * ae_std
             ae_pad = max((ae_max - ae_min) * 0.10, abs(ae_max) * 0.01, 1e-6)
             ae_min -= ae_pad
             ae_max += ae_pad
             ae_span = max(ae_max - ae_min, 1e-6)
+            ae_points = _screen_points(
+                ae_vals[-instrument_points:],
+                price_rect,
+                min_val=ae_min,
+                span=ae_span,
+                x_divisor=max(len(ae_vals) - 1, 1),
+            )
 
+            # AE error band around latest recon
+            if "recon" in recon:
+                recon_val = float(recon["recon"])
+                band = k * ae_std
+                ae_scale = price_rect.height / ae_span
+                y_low = price_rect.bottom - int((recon_val - band - ae_min) * ae_scale)
+                y_high = price_rect.bottom - int((recon_val + band - ae_min) * ae_scale)
+                ae_band_rect = (0, min(y_high, y_low) - price_rect.top, price_rect.width, abs(y_high - y_low))
+
+        if band_poly is not None or ae_band_rect is not None:
+            # The bands only move when a prediction/recon lands or the scale
+            # shifts; otherwise the overlay from the last frame is reused.
+            band_key = (band_poly, ae_band_rect)
+            if not band_overlay.holds(price_rect.size, band_key):
+                overlay = band_overlay.begin(price_rect.size, band_key)
+                if band_poly is not None:
+                    band_overlay.mark(pygame.draw.polygon(overlay, (80, 120, 200, 60), band_poly))
+                if ae_band_rect is not None:
+                    band_overlay.mark(pygame.draw.rect(overlay, (70, 120, 200, 60), ae_band_rect))
+            screen.blit(band_overlay.surface, price_rect.topleft)
+        if points_mean:
+            # The forecast only has to overlap the chart to be drawn, so the
+            # mean line can run past price_rect; its own rect goes on the
+            # dirty list so those pixels are restored next frame.
+            dirty.append(pygame.draw.lines(screen, (120, 180, 255), False, points_mean, 2))
+        if ae_points:
             # AE axis labels on right
             draw_axis_labels(
                 screen,
@@ -1210,31 +1931,11 @@ def main() -> None:
                 align_right=True,
                 show_time=False,
             )
-
             # AE recon line (dashed)
-            points = []
-            for i, val in enumerate(ae_vals[-instrument_points:]):
-                x = price_rect.left + int(i * price_rect.width / max(len(ae_vals) - 1, 1))
-                y = price_rect.bottom - int(((val - ae_min) / ae_span) * price_rect.height)
-                points.append((x, y))
-            draw_dashed_line(screen, points, (120, 180, 255))
-
-            # AE error band around latest recon
-            if recon and "recon" in recon:
-                recon_val = float(recon["recon"])
-                band = k * ae_std
-                y_low = price_rect.bottom - int(((recon_val - band - ae_min) / ae_span) * price_rect.height)
-                y_high = price_rect.bottom - int(((recon_val + band - ae_min) / ae_span) * price_rect.height)
-                band_surface = pygame.Surface((price_rect.width, price_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(
-                    band_surface,
-                    (70, 120, 200, 60),
-                    pygame.Rect(0, min(y_high, y_low), price_rect.width, abs(y_high - y_low)),
-                )
-                screen.blit(band_surface, (price_rect.left, price_rect.top))
+            draw_dashed_line(screen, ae_points, (120, 180, 255))
 
         # Anomaly highlight on last candle
-        if recon and candles:
+        if recon and len(candles):
             err = recon.get("error")
             mean_err = recon.get("mean_error", 0.0)
             std_err = recon.get("std_error", 0.0)
@@ -1251,24 +1952,14 @@ def main() -> None:
                     pygame.draw.rect(screen, border_color, pygame.Rect(x, y, candle_width, h), 2)
 
         # Prediction hit/miss markers on recent candles
-        if scores and candles:
-            results = scores.get("results") or []
-            for item in results:
-                step = item.get("step")
-                hit = item.get("hit")
-                actual = item.get("actual")
-                if step is None or actual is None:
-                    continue
-                idx = len(candles) - step
-                if idx < 0 or idx >= len(candles):
-                    continue
-                c = candles[idx]
-                y = price_rect.bottom - int(((c["c"] - price_min) / max(price_max - price_min, 1e-6)) * price_rect.height)
-                x = price_rect.left + int(idx * price_rect.width / max(len(candles), 1))
+        if marker_idx:
+            xs = _screen_xs(marker_idx, price_rect, n_candles)
+            ys = _screen_ys(candles[marker_idx, _C], price_rect, price_min, max(price_max - price_min, 1e-6))
+            for x, y, hit in zip(xs.tolist(), ys.tolist(), marker_hit):
                 color = (80, 200, 120) if hit else (220, 80, 80)
                 pygame.draw.circle(screen, color, (x + 2, y - 6), 5)
 
-        draw_text_wrapped(
+        footer_lines = draw_text_wrapped(
             screen,
             font,
             f"{instrument} last: {last_close if last_close is not None else '--'}  vol: {last_vol if last_vol is not None else '--'}  ts: {last_candle_ts or '--'}",
@@ -1277,14 +1968,30 @@ def main() -> None:
             width - padding * 2,
             (200, 200, 200),
         )
+        dirty.append(pygame.Rect(padding, price_rect.bottom + 6, width - padding * 2, footer_lines * font.get_linesize()))
 
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            # Include last frame's rects so anything that shrank or moved is erased on screen too.
+            pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
         clock.tick(30)
+        # Sleep until a loop publishes new state or a window event needs a
+        # response; still redraw once a second so uptime and file ages move.
+        # The deadline is the next whole second of uptime, so the idle redraw
+        # lands when the label changes instead of drifting past it.
+        idle_deadline = start_ts + int(time.time() - start_ts) + 1
+        while not state.dirty.wait(timeout=0.05):
+            if time.time() >= idle_deadline or pygame.event.peek(wake_events):
+                break
+        state.dirty.clear()
         if time.time() - last_tick_log >= 5:
             _log_dashboard_event("dashboard_tick")
             last_tick_log = time.time()
 
     _log_dashboard_event("dashboard_exit")
+    stop_async_loop(loop, background_tasks)
     stop_dashboard_processes(processes)
     pygame.quit()
 
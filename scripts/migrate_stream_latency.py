@@ -2,6 +2,11 @@ import argparse
 import json
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 def parse_args():
     parser = argparse.ArgumentParser()
@@ -13,32 +18,59 @@ def parse_args():
     return parser.parse_args()
 
 
+# Records are collected into one buffer and written in chunks of this size,
+# so the output file sees one write per MiB rather than one per line.
+_FLUSH_BYTES = 1 << 20
+
+
+def _json_loads(data: bytes) -> tuple[dict, bool]:
+    """Parse one record; the flag says whether orjson can write it back."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data), True
+        except orjson.JSONDecodeError:
+            # NaN/Infinity from json.dumps: orjson rejects them on read and
+            # would write them as null, so the stdlib handles this record.
+            pass
+    return json.loads(data), False
+
+
+def _json_line(payload: dict, use_orjson: bool) -> bytes:
+    if use_orjson and orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
 def main() -> None:
     args = parse_args()
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
     count = 0
-    with open(args.input, "r", encoding="utf-8") as inp, open(
-        args.output, "w", encoding="utf-8"
-    ) as out:
+    buf = bytearray()
+    with open(args.input, "rb") as inp, open(args.output, "wb") as out:
         for line in inp:
+            if len(buf) >= _FLUSH_BYTES:
+                out.write(buf)
+                buf.clear()
             raw = line.strip()
             if not raw:
                 continue
-            payload = json.loads(raw)
+            payload, fast = _json_loads(raw)
             has_mode = "mode" in payload and payload.get("mode") is not None
             has_instrument = "instrument" in payload and payload.get("instrument") is not None
             if args.only_missing and has_mode and has_instrument:
-                out.write(json.dumps(payload) + "\n")
+                buf += _json_line(payload, fast)
                 count += 1
                 continue
             if not has_mode:
                 payload["mode"] = args.assume_mode
             if not has_instrument:
                 payload["instrument"] = args.instrument
-            out.write(json.dumps(payload) + "\n")
+            buf += _json_line(payload, fast)
             count += 1
+        if buf:
+            out.write(buf)
     print(json.dumps({"output": args.output, "records": count}, indent=2))
 
 
 if __name__ == "__main__":
-    main()
+    main()
@@ -1,12 +1,17 @@
 import argparse
+import asyncio
 import json
 import os
 import time
 from datetime import datetime, timezone
-from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-def parse_args():
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--monitor-path", default="data/monitor.jsonl")
     parser.add_argument("--pred-path", default="data/predictions_latest.jsonl")
@@ -19,50 +24,104 @@ def parse_args():
     parser.add_argument("--fresh-candle-s", type=float, default=120.0)
     parser.add_argument("--json", action="store_true")
     parser.add_argument("--warn-seconds", type=float, default=120.0)
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    return build_parser().parse_args()
 
 
 def _now_ts() -> float:
     return time.time()
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
 def _parse_iso(ts: str | None) -> float | None:
     if not ts:
         return None
     raw = ts.strip()
     if raw.endswith("Z"):
         raw = raw[:-1]
-    if "." in raw:
-        head, frac = raw.split(".", 1)
-        frac = frac[:6].ljust(6, "0")
-        raw = f"{head}.{frac}"
+    dot = raw.find(".")
+    if dot != -1:
+        # Trim nanoseconds to the microseconds fromisoformat accepts.
+        raw = raw[: dot + 1] + raw[dot + 1 : dot + 7].ljust(6, "0")
     try:
-        dt = datetime.fromisoformat(raw).replace(tzinfo=timezone.utc)
-        return dt.timestamp()
+        dt = datetime.fromisoformat(raw)
     except ValueError:
         return None
+    if dt.tzinfo is None:
+        # Same arithmetic as .replace(tzinfo=utc).timestamp(), minus the copy.
+        return (dt - _EPOCH).total_seconds()
+    return dt.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dumps writes.
+            pass
+    return json.loads(data)
 
 
 def _last_json_line(path: str) -> dict | None:
-    if not os.path.exists(path):
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
         return None
-    with open(path, "rb") as handle:
+    with handle:
         handle.seek(0, os.SEEK_END)
         size = handle.tell()
-        if size == 0:
-            return None
-        chunk = min(size, 65536)
-        handle.seek(-chunk, os.SEEK_END)
-        data = handle.read().decode("utf-8", errors="ignore")
-    lines = [line for line in data.splitlines() if line.strip()]
-    if not lines:
+        chunk = 65536
+        while True:
+            chunk = min(size, chunk)
+            handle.seek(size - chunk)
+            data = handle.read(chunk)
+            # Scan back from EOF for the last non-blank line instead of
+            # splitting the whole chunk; only that slice is decoded.
+            end = len(data.rstrip())
+            start = data.rfind(b"\n", 0, end) + 1
+            # A blank window, or a line longer than the window, has no
+            # complete line in it: widen it rather than give up or parse a
+            # truncated line.
+            if (end and start) or chunk == size:
+                break
+            chunk *= 4
+    if end == 0:
         return None
     try:
-        return json.loads(lines[-1])
-    except json.JSONDecodeError:
+        return _json_loads(data[start:end])
+    except ValueError:
         return None
 
 
+def _newest_file(directory: str, prefix: str, suffix: str) -> str | None:
+    # One scandir pass keeping the max mtime: DirEntry reuses the directory
+    # listing, and there is no list to build or sort.
+    newest = None
+    newest_mtime = float("-inf")
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                # is_file() answers from the directory entry type on most
+                # filesystems, so only regular files reach the stat below.
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime >= newest_mtime:
+                    newest, newest_mtime = entry.path, mtime
+    except OSError:
+        return None
+    return newest
+
+
 def _age_seconds(ts: float | None, now: float) -> float | None:
     if ts is None:
         return None
@@ -73,6 +132,31 @@ def _fresh(age: float | None, limit: float) -> bool:
     return age is not None and age <= limit
 
 
+def _mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _newest_json_line(directory: str, prefix: str) -> tuple[str | None, dict | None]:
+    path = _newest_file(directory, prefix, ".jsonl")
+    return path, (_last_json_line(path) if path else None)
+
+
+async def _read_sources(
+    monitor_path: str, pred_path: str, scores_path: str, candles_dir: str, candles_pattern: str
+) -> list:
+    # The four reads are independent; run them side by side so a slow disk
+    # or network mount costs the slowest read rather than the sum.
+    return await asyncio.gather(
+        asyncio.to_thread(_mtime, monitor_path),
+        asyncio.to_thread(_last_json_line, pred_path),
+        asyncio.to_thread(_last_json_line, scores_path),
+        asyncio.to_thread(_newest_json_line, candles_dir, candles_pattern),
+    )
+
+
 def main() -> None:
     args = parse_args()
     now = _now_ts()
@@ -81,29 +165,23 @@ def main() -> None:
     pred_path = args.pred_path
     scores_path = args.scores_path
 
-    monitor_exists = os.path.exists(monitor_path)
-    monitor_mtime = os.path.getmtime(monitor_path) if monitor_exists else None
+    monitor_mtime, pred_line, score_line, (candle_file, candle_line) = asyncio.run(
+        _read_sources(monitor_path, pred_path, scores_path, args.candles_dir, args.candles_pattern)
+    )
+
+    monitor_exists = monitor_mtime is not None
     monitor_age = _age_seconds(monitor_mtime, now)
 
     pred_exists = os.path.exists(pred_path)
-    pred_line = _last_json_line(pred_path) if pred_exists else None
     pred_ts = _parse_iso(pred_line.get("ts")) if pred_line else None
     pred_age = _age_seconds(pred_ts, now)
 
     scores_exists = os.path.exists(scores_path)
-    score_line = _last_json_line(scores_path) if scores_exists else None
     score_ts = None
     if score_line:
         score_ts = _parse_iso(score_line.get("scored_ts") or score_line.get("ts"))
     score_age = _age_seconds(score_ts, now)
 
-    candles_dir = Path(args.candles_dir)
-    candle_files = sorted(
-        [p for p in candles_dir.glob(f"{args.candles_pattern}*.jsonl")],
-        key=lambda p: p.stat().st_mtime,
-    )
-    candle_file = candle_files[-1] if candle_files else None
-    candle_line = _last_json_line(str(candle_file)) if candle_file else None
     candle_ts = _parse_iso(candle_line.get("time")) if candle_line else None
     candle_age = _age_seconds(candle_ts, now)
 
@@ -183,7 +261,7 @@ def main() -> None:
             "hint": score_hint,
         },
         "candles": {
-            "file": str(candle_file) if candle_file else None,
+            "file": candle_file,
             "ts": candle_line.get("time") if candle_line else None,
             "age_s": candle_age,
             "fresh": _fresh(candle_age, candle_limit),
@@ -221,4 +299,4 @@ if __name__ == "__main__":
     try:
         main()
     except Exception:
-        raise SystemExit(1)
+        raise SystemExit(1)
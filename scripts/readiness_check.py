@@ -2,7 +2,6 @@ import argparse
 import json
 import os
 import sys
-from pathlib import Path
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -15,12 +14,47 @@ def parse_args():
     parser.add_argument("--warn-seconds", type=float, default=120.0)
     parser.add_argument("--features-path", default="data/usd_cad_features.jsonl")
     parser.add_argument("--fresh-features-s", type=float, default=300.0)
-    return parser.parse_args()
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Print only READY/NOT_READY, stopping at the first stale signal.",
+    )
+    # Path and freshness flags belong to pipeline_status; they are left for
+    # its parser, which still rejects anything neither side knows.
+    args, rest = parser.parse_known_args()
+    return args, pipeline_status.build_parser().parse_args(rest)
+
+
+def _fresh_within(ts: float | None, now: float, limit: float) -> bool:
+    age = pipeline_status._age_seconds(ts, now)
+    return age is not None and age <= limit
+
+
+def _quick_ready(args, parsed, now: float, limits: dict) -> bool:
+    # Cheapest probes first (one stat each), then the tail reads, and the
+    # candle directory scan last; all() stops at the first stale signal.
+    def line_ts(path: str, *keys: str) -> float | None:
+        line = pipeline_status._last_json_line(path)
+        if not line:
+            return None
+        return pipeline_status._parse_iso(next((line.get(k) for k in keys if line.get(k)), None))
+
+    def candle_ts() -> float | None:
+        _, line = pipeline_status._newest_json_line(parsed.candles_dir, parsed.candles_pattern)
+        return pipeline_status._parse_iso(line.get("time")) if line else None
+
+    checks = (
+        ("monitor", lambda: pipeline_status._mtime(parsed.monitor_path)),
+        ("features", lambda: pipeline_status._mtime(args.features_path)),
+        ("predictions", lambda: line_ts(parsed.pred_path, "ts")),
+        ("scores", lambda: line_ts(parsed.scores_path, "scored_ts", "ts")),
+        ("candles", candle_ts),
+    )
+    return all(_fresh_within(probe(), now, limits[name]) for name, probe in checks)
 
 
 def main() -> None:
-    args = parse_args()
-    parsed = pipeline_status.parse_args()
+    args, parsed = parse_args()
     parsed.json = True
     parsed.warn_seconds = args.warn_seconds
 
@@ -28,48 +62,60 @@ def main() -> None:
     # We'll emulate by running main() and capturing exit code isn't necessary here.
     # Instead, call pipeline_status main by reconstructing outputs.
     now = pipeline_status._now_ts()
+
+    warn_limit = args.warn_seconds
+    monitor_limit = warn_limit if warn_limit is not None else parsed.fresh_monitor_s
+    pred_limit = warn_limit if warn_limit is not None else parsed.fresh_pred_s
+    score_limit = warn_limit if warn_limit is not None else parsed.fresh_score_s
+    candle_limit = warn_limit if warn_limit is not None else parsed.fresh_candle_s
+    features_limit = warn_limit if warn_limit is not None else args.fresh_features_s
+
+    if args.quiet and not args.json:
+        limits = {
+            "monitor": monitor_limit,
+            "predictions": pred_limit,
+            "scores": score_limit,
+            "candles": candle_limit,
+            "features": features_limit,
+        }
+        ready = _quick_ready(args, parsed, now, limits)
+        print("READY" if ready else "NOT_READY")
+        raise SystemExit(0 if ready else 2)
+
     monitor_path = parsed.monitor_path
     pred_path = parsed.pred_path
     scores_path = parsed.scores_path
 
-    monitor_exists = os.path.exists(monitor_path)
-    monitor_mtime = os.path.getmtime(monitor_path) if monitor_exists else None
+    # One stat per file: a missing file comes back as None rather than being
+    # probed with exists() first.
+    monitor_mtime = pipeline_status._mtime(monitor_path)
+    monitor_exists = monitor_mtime is not None
     monitor_age = pipeline_status._age_seconds(monitor_mtime, now)
 
-    pred_exists = os.path.exists(pred_path)
-    pred_line = pipeline_status._last_json_line(pred_path) if pred_exists else None
+    # _last_json_line returns None for a missing file; an unreadable line
+    # reports "missing" through reason_and_hint either way.
+    pred_line = pipeline_status._last_json_line(pred_path)
+    pred_exists = pred_line is not None
     pred_ts = pipeline_status._parse_iso(pred_line.get("ts")) if pred_line else None
     pred_age = pipeline_status._age_seconds(pred_ts, now)
 
-    scores_exists = os.path.exists(scores_path)
-    score_line = pipeline_status._last_json_line(scores_path) if scores_exists else None
+    score_line = pipeline_status._last_json_line(scores_path)
+    scores_exists = score_line is not None
     score_ts = None
     if score_line:
         score_ts = pipeline_status._parse_iso(score_line.get("scored_ts") or score_line.get("ts"))
     score_age = pipeline_status._age_seconds(score_ts, now)
 
-    candles_dir = Path(parsed.candles_dir)
-    candle_files = sorted(
-        [p for p in candles_dir.glob(f"{parsed.candles_pattern}*.jsonl")],
-        key=lambda p: p.stat().st_mtime,
-    )
-    candle_file = candle_files[-1] if candle_files else None
-    candle_line = pipeline_status._last_json_line(str(candle_file)) if candle_file else None
+    candle_file = pipeline_status._newest_file(parsed.candles_dir, parsed.candles_pattern, ".jsonl")
+    candle_line = pipeline_status._last_json_line(candle_file) if candle_file else None
     candle_ts = pipeline_status._parse_iso(candle_line.get("time")) if candle_line else None
     candle_age = pipeline_status._age_seconds(candle_ts, now)
 
     features_path = args.features_path
-    features_exists = os.path.exists(features_path)
-    features_mtime = os.path.getmtime(features_path) if features_exists else None
+    features_mtime = pipeline_status._mtime(features_path)
+    features_exists = features_mtime is not None
     features_age = pipeline_status._age_seconds(features_mtime, now)
 
-    warn_limit = args.warn_seconds
-    monitor_limit = warn_limit if warn_limit is not None else parsed.fresh_monitor_s
-    pred_limit = warn_limit if warn_limit is not None else parsed.fresh_pred_s
-    score_limit = warn_limit if warn_limit is not None else parsed.fresh_score_s
-    candle_limit = warn_limit if warn_limit is not None else parsed.fresh_candle_s
-    features_limit = warn_limit if warn_limit is not None else args.fresh_features_s
-
     def reason_and_hint(exists: bool, age: float | None, limit: float, missing_hint: str, stale_hint: str):
         if not exists:
             return "missing", missing_hint
@@ -169,4 +215,4 @@ if __name__ == "__main__":
     try:
         main()
     except Exception:
-        raise SystemExit(1)
+        raise SystemExit(1)
@@ -16,6 +16,7 @@ import time
 sys.path.insert(0, "src")
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from oanda_autotrader.app import load_account_client
 from oanda_autotrader.config import load_account_groups, select_account
@@ -31,20 +32,27 @@ def timed(label: str, func):
 def run(group: str, account_name: str):
     client = load_account_client("accounts.yaml", group, account_name)
 
-    accounts_payload, accounts_ms = timed("accounts", client.list_accounts)
     groups = load_account_groups("accounts.yaml")
     selected_group, selected_entry = select_account(groups, group, account_name)
     account_id = selected_entry.account_id
 
-    details_payload, details_ms = timed(
-        "details", lambda: client.get_account(account_id)
-    )
-    summary_payload, summary_ms = timed(
-        "summary", lambda: client.get_account_summary(account_id)
-    )
-    instruments_payload, instruments_ms = timed(
-        "instruments", lambda: client.get_instruments(account_id)
-    )
+    # The four calls are independent, so they go out together over the
+    # client's session; each is still timed on its own.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        accounts_future = pool.submit(timed, "accounts", client.list_accounts)
+        details_future = pool.submit(
+            timed, "details", lambda: client.get_account(account_id)
+        )
+        summary_future = pool.submit(
+            timed, "summary", lambda: client.get_account_summary(account_id)
+        )
+        instruments_future = pool.submit(
+            timed, "instruments", lambda: client.get_instruments(account_id)
+        )
+        accounts_payload, accounts_ms = accounts_future.result()
+        details_payload, details_ms = details_future.result()
+        summary_payload, summary_ms = summary_future.result()
+        instruments_payload, instruments_ms = instruments_future.result()
 
     accounts_count = len(accounts_payload.get("accounts", []))
     instruments = instruments_payload.get("instruments", [])
@@ -76,10 +84,9 @@ def run(group: str, account_name: str):
 
 
 def main():
-    rows = [
-        run("demo", "Primary"),
-        run("live", "Primary"),
-    ]
+    targets = [("demo", "Primary"), ("live", "Primary")]
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        rows = list(pool.map(lambda target: run(*target), targets))
 
     header = (
         "group\taccount\tid\taccounts\tinstruments\torders\ttrades\tpositions\t"
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, "src")
 
@@ -33,8 +34,7 @@ def _summarize_candles(candles: list[dict]) -> dict[str, object]:
     }
 
 
-def run(group: str, account_name: str, instrument: str):
-    client = load_instruments_client("accounts.yaml", group, account_name)
+def run(client, group: str, account_name: str, instrument: str):
     payload, ms = timed(
         lambda: client.get_candles(
             instrument,
@@ -59,10 +59,21 @@ def run(group: str, account_name: str, instrument: str):
 
 def main():
     instruments = ["EUR_USD", "USD_CAD", "GBP_USD"]
-    rows = []
-    for instrument in instruments:
-        rows.append(run("demo", "Primary", instrument))
-        rows.append(run("live", "Primary", instrument))
+    accounts = [("demo", "Primary"), ("live", "Primary")]
+    # One client (and HTTP session) per account, shared by its instruments.
+    clients = {
+        account: load_instruments_client("accounts.yaml", *account)
+        for account in accounts
+    }
+    tasks = [
+        (clients[account], *account, instrument)
+        for instrument in instruments
+        for account in accounts
+    ]
+    # The candle requests are independent; issue them all at once and keep
+    # the rows in task order.
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        rows = list(pool.map(lambda task: run(*task), tasks))
 
     print("group\taccount\tinstrument\tcandles\tcomplete\tfirst_time\tlast_time\tms")
     for row in rows:
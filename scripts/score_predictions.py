@@ -11,137 +11,397 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _read_json_lines(path: str):
+    # One read() per file and a bytes split; lines are parsed without decoding
+    # to str first.
+    with open(path, "rb") as handle:
+        buf = handle.read()
+    for line in buf.splitlines():
+        line = line.strip()
+        if line:
+            yield _json_loads(line)
+
 
 def load_candles(paths: List[str]) -> Dict[str, float]:
     # Map ISO time -> close price (string keys for simplicity).
     data: Dict[str, float] = {}
     for path in paths:
-        with open(path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                candle = json.loads(line)
-                ts = candle.get("time")
-                close = (candle.get("mid") or {}).get("c")
-                if ts and close:
-                    data[ts] = float(close)
+        for candle in _read_json_lines(path):
+            ts = candle.get("time")
+            close = (candle.get("mid") or {}).get("c")
+            if ts and close:
+                data[ts] = float(close)
     return data
 
 
 def load_predictions(path: str) -> List[dict]:
     if not os.path.exists(path):
         return []
-    rows = []
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            payload = json.loads(line)
-            if "horizon" not in payload or "interval_secs" not in payload:
-                continue
-            rows.append(payload)
-    return rows
+    return [
+        payload
+        for payload in _read_json_lines(path)
+        if "horizon" in payload and "interval_secs" in payload
+    ]
 
 
 def load_scores(path: str) -> List[dict]:
     if not os.path.exists(path):
         return []
-    rows = []
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
+    return list(_read_json_lines(path))
+
+
+# score_once writes "ts" as the first key, so its value can be sliced out of
+# the line without parsing the results and buckets that follow. orjson output
+# is compact; stdlib json (and older files) put a space after the colon.
+_SCORE_TS_PREFIXES = (b'{"ts":"', b'{"ts": "')
+
+
+def load_scored_ts(path: str) -> set:
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb") as handle:
+        buf = handle.read()
+    scored = set()
+    for line in buf.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(_SCORE_TS_PREFIXES):
+            start = line.index(b'"', 6) + 1
+            end = line.find(b'"', start)
+            if end != -1 and b"\\" not in line[start:end]:
+                scored.add(line[start:end].decode("utf-8"))
                 continue
-            rows.append(json.loads(line))
-    return rows
+        # Any other layout (or an escaped ts) takes the full parse.
+        scored.add(_json_loads(line).get("ts"))
+    return scored
+
+
+def load_scored_ts_index(score_path: str, index_path: str) -> set:
+    """
+    Scored timestamps from the sidecar index, rebuilt when it is stale.
+
+    The index holds one ts per line and is appended after the scores file,
+    so it is trusted only while that file exists and is no newer than it.
+    A missing scores file means nothing is scored; its old index is dropped.
+    """
+
+    try:
+        score_mtime = os.stat(score_path).st_mtime_ns
+    except FileNotFoundError:
+        try:
+            os.remove(index_path)
+        except FileNotFoundError:
+            pass
+        return set()
+    try:
+        index_mtime = os.stat(index_path).st_mtime_ns
+    except FileNotFoundError:
+        index_mtime = None
+    if index_mtime is not None and index_mtime >= score_mtime:
+        with open(index_path, "r", encoding="utf-8") as handle:
+            return set(handle.read().splitlines())
+    scored = load_scored_ts(score_path)
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.writelines(f"{ts}\n" for ts in scored if ts)
+    os.replace(tmp_path, index_path)
+    return scored
+
+
+_BUCKETS = (("1-3", 1, 3), ("4-8", 4, 8), ("9-12", 9, 12))
+# Candle keys are looked up as "%Y-%m-%dT%H:%M:%S" + this suffix.
+_CANDLE_TS_SUFFIX = ".000000000Z"
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _candle_second(key: str) -> int | None:
+    """Epoch second of a candle key a step can match, else None."""
+    if len(key) != 30 or not key.endswith(_CANDLE_TS_SUFFIX):
+        return None
+    try:
+        dt = datetime.fromisoformat(key[:19])
+    except ValueError:
+        return None
+    # fromisoformat also takes other separators and week dates; only the
+    # exact layout the step keys were formatted with can match.
+    if dt.isoformat() != key[:19]:
+        return None
+    return (dt - _EPOCH) // _ONE_SECOND
+
+
+class CandleCache:
+    """
+    Candle closes for a directory, kept across watch ticks.
+
+    Each refresh stats the candle files in one scandir pass and parses only
+    the complete lines appended since the previous refresh. Closes are held
+    as two sorted arrays (epoch second, close) rather than a dict of strings.
+    """
+
+    def __init__(self, candle_dir: str) -> None:
+        self.candle_dir = candle_dir
+        self._secs = np.empty(0, dtype=np.int64)
+        self._closes = np.empty(0, dtype=np.float64)
+        # name -> (inode, mtime_ns, size, bytes consumed, last consumed line)
+        self._tails: Dict[str, tuple[int, int, int, int, bytes]] = {}
+
+    def refresh(self) -> None:
+        with os.scandir(self.candle_dir) as entries:
+            files = sorted(
+                (entry.name, entry.path, entry.stat())
+                for entry in entries
+                if entry.name.startswith("usd_cad_candles_") and entry.name.endswith(".jsonl")
+            )
+        for name, path, st in files:
+            inode, mtime_ns, size, offset, last_line = self._tails.get(name, (0, 0, 0, 0, b""))
+            if (st.st_ino, st.st_mtime_ns, st.st_size) == (inode, mtime_ns, size):
+                continue
+            if st.st_ino != inode or st.st_size < offset:
+                # Replaced or truncated: read it again from the start.
+                offset, last_line = 0, b""
+            # The last consumed line is re-read and compared, which catches a
+            # rewrite in place that left the file as long or longer; the saved
+            # offset could then fall mid-line.
+            start = offset - len(last_line)
+            with open(path, "rb") as handle:
+                handle.seek(start)
+                chunk = handle.read()
+                if not chunk.startswith(last_line):
+                    start, last_line = 0, b""
+                    handle.seek(0)
+                    chunk = handle.read()
+            skip = len(last_line)
+            end = chunk.rfind(b"\n") + 1
+            candles = [_json_loads(line) for line in chunk[skip:end].splitlines() if line.strip()]
+            tail = chunk[max(end, skip):].strip()
+            if tail:
+                # An unterminated last line is taken if it parses; otherwise
+                # it is still being written and is read on the next refresh.
+                try:
+                    candles.append(_json_loads(tail))
+                    end = len(chunk)
+                except ValueError:
+                    pass
+            end = max(end, skip)
+            if candles:
+                self._merge(candles)
+            if end > skip:
+                last_line = chunk[chunk.rfind(b"\n", 0, end - 1) + 1 : end]
+            self._tails[name] = (st.st_ino, st.st_mtime_ns, st.st_size, start + end, last_line)
+
+    def _merge(self, candles: List[dict]) -> None:
+        secs = []
+        closes = []
+        for candle in candles:
+            ts = candle.get("time")
+            close = (candle.get("mid") or {}).get("c")
+            if not (ts and close):
+                continue
+            # Keys no step can match are dropped here instead of stored.
+            second = _candle_second(ts)
+            if second is not None:
+                secs.append(second)
+                closes.append(float(close))
+        if not secs:
+            return
+        new_secs = np.array(secs, dtype=np.int64)
+        new_closes = np.array(closes, dtype=np.float64)
+        if (
+            not self._secs.size or new_secs[0] > self._secs[-1]
+        ) and np.all(new_secs[1:] > new_secs[:-1]):
+            # Usual capture case: strictly newer candles, append in place.
+            self._secs = np.concatenate((self._secs, new_secs))
+            self._closes = np.concatenate((self._closes, new_closes))
+            return
+        merged_secs = np.concatenate((self._secs, new_secs))
+        merged_closes = np.concatenate((self._closes, new_closes))
+        order = np.argsort(merged_secs, kind="stable")
+        merged_secs = merged_secs[order]
+        merged_closes = merged_closes[order]
+        # A repeated second keeps the close read last, as the dict did.
+        last = np.append(merged_secs[1:] != merged_secs[:-1], True)
+        self._secs = merged_secs[last]
+        self._closes = merged_closes[last]
+
+    def index(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted epoch seconds and their closes."""
+        return self._secs, self._closes
+
+
+def _base_micros(base_ts) -> int | None:
+    # Wall-clock microseconds of the prediction time; any offset is dropped,
+    # matching the strftime(... "Z") the step timestamps used to be built with.
+    if not base_ts:
+        return None
+    try:
+        if base_ts[-1] == "Z":
+            # Only the wall-clock fields are used, so a trailing Z is sliced
+            # off and parsed naive rather than rewritten to +00:00.
+            base_dt = datetime.fromisoformat(base_ts[:-1])
+        else:
+            base_dt = datetime.fromisoformat(base_ts)
+    except ValueError:
+        return None
+    return (base_dt.replace(tzinfo=None) - _EPOCH) // _ONE_MICROSECOND
+
+
+def _as_float(value) -> float:
+    return float(value) if value is not None else np.nan
 
 
 def score_once(
-    pred_path: str, score_path: str, candle_dir: str, scored_ts: set
+    pred_path: str,
+    score_path: str,
+    candle_dir: str,
+    scored_ts: set,
+    candles: CandleCache | None = None,
+    index_path: str | None = None,
 ) -> set:
-    candle_files = [
-        os.path.join(candle_dir, name)
-        for name in os.listdir(candle_dir)
-        if name.startswith("usd_cad_candles_") and name.endswith(".jsonl")
-    ]
-    candle_map = load_candles(sorted(candle_files))
+    if candles is None:
+        candles = CandleCache(candle_dir)
+    candles.refresh()
     preds = load_predictions(pred_path)
 
-    with open(score_path, "a", encoding="utf-8") as handle:
-        for pred in preds:
-            ts = pred.get("ts")
-            if not ts or ts in scored_ts:
-                continue
-            horizon = pred.get("horizon") or []
-            results = []
-            hits = 0
-            errors = []
-            resolved = 0
-            bucket_defs = [("1-3", 1, 3), ("4-8", 4, 8), ("9-12", 9, 12)]
-            bucket_hits = {label: 0 for label, _, _ in bucket_defs}
-            bucket_errors = {label: [] for label, _, _ in bucket_defs}
-            bucket_resolved = {label: 0 for label, _, _ in bucket_defs}
-            base_dt = None
-            base_ts = pred.get("ts")
-            try:
-                base_dt = (
-                    datetime.fromisoformat(base_ts.replace("Z", "+00:00"))
-                    if base_ts
-                    else None
-                )
-            except ValueError:
-                base_dt = None
-            interval_secs = pred.get("interval_secs", 5)
-            for item in horizon:
-                step = item.get("step")
-                mean = item.get("mean")
-                low = item.get("low")
-                high = item.get("high")
-                actual_ts = None
-                if base_dt and step is not None:
-                    actual_dt = base_dt + timedelta(seconds=step * interval_secs)
-                    actual_ts = actual_dt.strftime("%Y-%m-%dT%H:%M:%S.000000000Z")
-                actual = candle_map.get(actual_ts) if actual_ts else None
-                hit = None
-                if actual is not None and low is not None and high is not None:
-                    hit = low <= actual <= high
-                    hits += 1 if hit else 0
-                    errors.append(abs(actual - mean))
-                    resolved += 1
-                    for label, start, end in bucket_defs:
-                        if step is not None and start <= step <= end:
-                            bucket_hits[label] += 1 if hit else 0
-                            bucket_errors[label].append(abs(actual - mean))
-                            bucket_resolved[label] += 1
-                results.append({"step": step, "actual": actual, "hit": hit})
-
-            coverage = hits / resolved if resolved else None
-            mae = sum(errors) / len(errors) if errors else None
-            buckets = []
-            for label, _, _ in bucket_defs:
-                b_resolved = bucket_resolved[label]
-                b_hits = bucket_hits[label]
-                b_errors = bucket_errors[label]
-                buckets.append(
-                    {
-                        "label": label,
-                        "coverage": (b_hits / b_resolved) if b_resolved else None,
-                        "mae": (sum(b_errors) / len(b_errors)) if b_errors else None,
-                        "resolved": b_resolved,
-                    }
-                )
-            out = {
-                "ts": ts,
-                "coverage": coverage,
-                "mae": mae,
-                "results": results,
-                "buckets": buckets,
-                "scored_ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            }
-            handle.write(json.dumps(out) + "\n")
-            scored_ts.add(ts)
+    # Flatten every unscored prediction's horizon into parallel arrays so the
+    # candle lookup, hit test, error and bucket sums run once over the batch.
+    pending = []
+    pending_ts = set()
+    raw_steps = []
+    pred_rows = []
+    step_vals = []
+    means = []
+    lows = []
+    highs = []
+    base_us = []
+    intervals = []
+    for pred in preds:
+        ts = pred.get("ts")
+        if not ts or ts in scored_ts or ts in pending_ts:
+            continue
+        row = len(pending)
+        pending.append(ts)
+        pending_ts.add(ts)
+        base = _base_micros(pred.get("ts"))
+        base_us.append(base if base is not None else 0)
+        interval_secs = pred.get("interval_secs", 5)
+        intervals.append(_as_float(interval_secs) if base is not None else np.nan)
+        for item in pred.get("horizon") or []:
+            step = item.get("step")
+            raw_steps.append(step)
+            pred_rows.append(row)
+            step_vals.append(_as_float(step))
+            means.append(_as_float(item.get("mean")))
+            lows.append(_as_float(item.get("low")))
+            highs.append(_as_float(item.get("high")))
+
+    n_preds = len(pending)
+    pred_idx = np.array(pred_rows, dtype=np.intp)
+    steps = np.array(step_vals, dtype=np.float64)
+    mean = np.array(means, dtype=np.float64)
+    low = np.array(lows, dtype=np.float64)
+    high = np.array(highs, dtype=np.float64)
+
+    # Step time = base + step * interval, truncated to whole seconds.
+    offsets = steps * np.array(intervals, dtype=np.float64)[pred_idx]
+    lookup = ~np.isnan(offsets)
+    actual = np.full(steps.size, np.nan)
+    if lookup.any():
+        step_secs = (
+            np.array(base_us, dtype=np.int64)[pred_idx[lookup]]
+            + np.rint(offsets[lookup] * 1_000_000).astype(np.int64)
+        ) // 1_000_000
+        index_secs, index_close = candles.index()
+        if index_secs.size:
+            pos = np.minimum(np.searchsorted(index_secs, step_secs), index_secs.size - 1)
+            found = index_secs[pos] == step_secs
+            actual[lookup] = np.where(found, index_close[pos], np.nan)
+
+    resolved = ~np.isnan(actual) & ~np.isnan(low) & ~np.isnan(high)
+    hit = (low <= actual) & (actual <= high)
+    error = np.abs(actual - mean)
+    bucket = np.select(
+        [(steps >= start) & (steps <= end) for _, start, end in _BUCKETS],
+        np.arange(len(_BUCKETS)),
+        default=-1,
+    )
+
+    rows = pred_idx[resolved]
+    n_resolved = np.bincount(rows, minlength=n_preds).tolist()
+    n_hits = np.bincount(rows, weights=hit[resolved], minlength=n_preds).tolist()
+    error_sum = np.bincount(rows, weights=error[resolved], minlength=n_preds).tolist()
+    in_bucket = resolved & (bucket >= 0)
+    cells = pred_idx[in_bucket] * len(_BUCKETS) + bucket[in_bucket]
+    n_cells = n_preds * len(_BUCKETS)
+    b_resolved = np.bincount(cells, minlength=n_cells).tolist()
+    b_hits = np.bincount(cells, weights=hit[in_bucket], minlength=n_cells).tolist()
+    b_error_sum = np.bincount(cells, weights=error[in_bucket], minlength=n_cells).tolist()
+
+    actual_list = np.where(np.isnan(actual), None, actual).tolist()
+    hit_list = np.where(resolved, hit, None).tolist()
+    bounds = np.searchsorted(pred_idx, np.arange(n_preds + 1)).tolist()
+
+    # One stamp per batch: the records are written together.
+    scored_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    lines = []
+    for row, ts in enumerate(pending):
+        first, last = bounds[row], bounds[row + 1]
+        results = [
+            {"step": raw_steps[i], "actual": actual_list[i], "hit": hit_list[i]}
+            for i in range(first, last)
+        ]
+        resolved_count = n_resolved[row]
+        buckets = []
+        for b, (label, _, _) in enumerate(_BUCKETS):
+            cell = row * len(_BUCKETS) + b
+            count = b_resolved[cell]
+            buckets.append(
+                {
+                    "label": label,
+                    "coverage": (b_hits[cell] / count) if count else None,
+                    "mae": (b_error_sum[cell] / count) if count else None,
+                    "resolved": count,
+                }
+            )
+        out = {
+            "ts": ts,
+            "coverage": n_hits[row] / resolved_count if resolved_count else None,
+            "mae": error_sum[row] / resolved_count if resolved_count else None,
+            "results": results,
+            "buckets": buckets,
+            "scored_ts": scored_at,
+        }
+        lines.append(_json_dumps(out))
+    # The whole batch goes out in one write.
+    with open(score_path, "ab") as handle:
+        if lines:
+            handle.write(b"\n".join(lines) + b"\n")
+    scored_ts.update(pending)
+    if index_path and pending:
+        with open(index_path, "a", encoding="utf-8") as handle:
+            handle.writelines(f"{ts}\n" for ts in pending)
     return scored_ts
 
 
@@ -154,13 +414,22 @@ def main() -> None:
     parser.add_argument("--watch", action="store_true")
     args = parser.parse_args()
 
-    scored_ts = {row.get("ts") for row in load_scores(args.score_path)}
-    scored_ts = score_once(args.pred_path, args.score_path, args.candle_dir, scored_ts)
+    index_path = args.score_path + ".idx"
+    scored_ts = load_scored_ts_index(args.score_path, index_path)
+    candles = CandleCache(args.candle_dir)
+    scored_ts = score_once(
+        args.pred_path, args.score_path, args.candle_dir, scored_ts, candles, index_path
+    )
     if args.watch:
         while True:
             time.sleep(args.every)
             scored_ts = score_once(
-                args.pred_path, args.score_path, args.candle_dir, scored_ts
+                args.pred_path,
+                args.score_path,
+                args.candle_dir,
+                scored_ts,
+                candles,
+                index_path,
             )
 
 
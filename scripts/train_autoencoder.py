@@ -8,8 +8,6 @@ import argparse
 import json
 import os
 import time
-from typing import Iterable
-
 import numpy as np
 
 try:
@@ -20,24 +18,38 @@ except ImportError as exc:  # pragma: no cover - runtime dependency
         "PyTorch is required for training. Install with: pip install torch"
     ) from exc
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
-def iter_feature_rows(path: str) -> Iterable[dict]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            yield json.loads(line)
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def build_matrix(path: str, features: list[str]) -> np.ndarray:
-    rows = []
-    for row in iter_feature_rows(path):
-        values = [row.get(name) for name in features]
-        if any(v is None for v in values):
+    with open(path, "rb") as handle:
+        lines = handle.read().splitlines()
+    # The line count bounds the row count, so rows are written straight into
+    # one float32 block instead of a list of lists copied by np.array.
+    out = np.empty((len(lines), len(features)), dtype=np.float32)
+    features = tuple(features)
+    n = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
             continue
-        rows.append(values)
-    return np.array(rows, dtype=np.float32)
+        row = _json_loads(line)
+        get = row.get
+        values = [get(name) for name in features]
+        if None in values:
+            continue
+        out[n] = values
+        n += 1
+    return out[:n]
 
 
 class AutoEncoder(nn.Module):
@@ -74,6 +86,17 @@ def main() -> None:
     parser.add_argument("--lr", type=float, default=1e-3)
     parser.add_argument("--bottleneck", type=int, default=8)
     parser.add_argument("--use-cuda", action="store_true")
+    parser.add_argument(
+        "--precision",
+        choices=["fp32", "bf16", "fp16"],
+        default="fp32",
+        help="Autocast dtype for forward/loss; fp16 needs CUDA and uses a grad scaler.",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Wrap the model in torch.compile (fused kernels; pays a compile on the first batch).",
+    )
     parser.add_argument("--status-path", default="data/ae_status.jsonl")
     args = parser.parse_args()
 
@@ -108,35 +131,57 @@ def main() -> None:
     if data.size == 0:
         raise SystemExit("No feature rows found. Run build_features.py first.")
 
-    # Normalize per-feature.
+    # Normalize per-feature. Center once and reuse it for the variance and
+    # in place for the result; same values as data.std then (data - mean) / std.
     mean = data.mean(axis=0)
-    std = data.std(axis=0)
+    data -= mean
+    std = np.sqrt(np.multiply(data, data).sum(axis=0) / data.shape[0])
     std[std == 0] = 1.0
-    data = (data - mean) / std
+    data /= std
 
     device = torch.device("cuda" if args.use_cuda and torch.cuda.is_available() else "cpu")
     model = AutoEncoder(data.shape[1], args.bottleneck).to(device)
     optim = torch.optim.Adam(model.parameters(), lr=args.lr)
+    if args.compile:
+        # Every batch has the same shape (the index tile below drops the
+        # remainder), so the graph is compiled once; reduce-overhead also
+        # replays it as a CUDA graph.
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=True)
     loss_fn = nn.MSELoss()
-
-    tensor = torch.tensor(data, device=device)
+    if args.precision == "fp16" and device.type != "cuda":
+        raise SystemExit("--precision fp16 requires --use-cuda with a CUDA device.")
+    amp_dtype = {"bf16": torch.bfloat16, "fp16": torch.float16}.get(args.precision)
+    # Weights, optimizer state and the normalized inputs stay FP32; autocast
+    # only lowers the matmuls. FP16 gradients need loss scaling, BF16 do not.
+    scaler = torch.amp.GradScaler(device.type, enabled=args.precision == "fp16")
+
+    # The whole matrix stays resident on the device; from_numpy avoids an
+    # extra host copy before the transfer.
+    tensor = torch.from_numpy(data).to(device)
     n = tensor.shape[0]
     steps = max(1, n // args.batch_size)
 
     for epoch in range(1, args.epochs + 1):
         model.train()
-        perm = torch.randperm(n, device=device)
-        epoch_loss = 0.0
-        for i in range(steps):
-            idx = perm[i * args.batch_size : (i + 1) * args.batch_size]
-            batch = tensor[idx]
-            recon = model(batch)
-            loss = loss_fn(recon, batch)
-            optim.zero_grad()
-            loss.backward()
-            optim.step()
-            epoch_loss += loss.item()
-        epoch_loss /= steps
+        # One permutation per epoch, cut into a (steps, batch) index tile so
+        # each step is a row view rather than a fresh slice of perm.
+        batches = torch.randperm(n, device=device)[: steps * args.batch_size].view(steps, -1)
+        # Summed on the device and read back once per epoch: loss.item() on
+        # every step would force a host sync per batch.
+        epoch_loss_t = torch.zeros((), dtype=torch.float64, device=device)
+        for idx in batches:
+            batch = tensor.index_select(0, idx)
+            with torch.autocast(
+                device_type=device.type, dtype=amp_dtype, enabled=amp_dtype is not None
+            ):
+                recon = model(batch)
+                loss = loss_fn(recon, batch)
+            optim.zero_grad(set_to_none=True)
+            scaler.scale(loss).backward()
+            scaler.step(optim)
+            scaler.update()
+            epoch_loss_t += loss.detach()
+        epoch_loss = epoch_loss_t.item() / steps
 
         status = {
             "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
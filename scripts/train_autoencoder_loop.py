@@ -5,11 +5,15 @@ Continuous autoencoder + predictor training loop.
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
 import json
-import math
 import os
+import threading
 import time
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterable, Iterator, TextIO
 
 import numpy as np
 import sys
@@ -24,6 +28,18 @@ try:
 except ImportError as exc:  # pragma: no cover
     raise SystemExit("PyTorch is required. Install with: pip install torch") from exc
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional speedup
+    FileSystemEventHandler = object
+    Observer = None
+
 
 FEATURE_NAMES = [
     "close",
@@ -53,28 +69,177 @@ FEATURE_NAMES = [
 ]
 
 
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def iter_feature_rows(path: str) -> Iterable[dict]:
-    with open(path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            yield json.loads(line)
+    # One read() and a bytes split; lines are parsed without a str decode.
+    with open(path, "rb") as handle:
+        buf = handle.read()
+    for line in buf.splitlines():
+        line = line.strip()
+        if line:
+            yield _json_loads(line)
+
+
+_GET_FEATURES = itemgetter(*FEATURE_NAMES)
+_FEATURE_ROW = np.dtype((np.float32, len(FEATURE_NAMES)))
+_CLOSE_COL = FEATURE_NAMES.index("close")
+_LOG_RETURN_COL = FEATURE_NAMES.index("log_return")
+
+
+def _feature_values(rows_iter: Iterable[dict]) -> Iterator[tuple]:
+    # itemgetter pulls all features as one tuple in C; a missing key or a
+    # None value drops the row.
+    for row in rows_iter:
+        try:
+            values = _GET_FEATURES(row)
+        except KeyError:
+            continue
+        if None in values:
+            continue
+        yield values
+
+
+def _rows_to_arrays(rows_iter: Iterable[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    matrix = np.fromiter(_feature_values(rows_iter), dtype=_FEATURE_ROW)
+    # close and log_return are feature columns, so they are sliced from the
+    # matrix instead of collected separately.
+    closes = np.ascontiguousarray(matrix[:, _CLOSE_COL])
+    returns = np.ascontiguousarray(matrix[:, _LOG_RETURN_COL])
+    return matrix, closes, returns
 
 
 def load_matrix(path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    rows = []
-    closes = []
-    returns = []
-    for row in iter_feature_rows(path):
-        values = [row.get(name) for name in FEATURE_NAMES]
-        if any(v is None for v in values):
-            continue
-        rows.append(values)
-        closes.append(row.get("close"))
-        returns.append(row.get("log_return"))
-    matrix = np.array(rows, dtype=np.float32)
-    return matrix, np.array(closes, dtype=np.float32), np.array(returns, dtype=np.float32)
+    return _rows_to_arrays(iter_feature_rows(path))
+
+
+class FeatureCache:
+    """
+    Feature arrays for one JSONL file, extended between retrain cycles.
+
+    Only the bytes past the last parsed line are read. build_features.py
+    rewrites the file in place, so the cache also keeps that last line and
+    starts over when the file was replaced, shrank, or no longer has the
+    same line at the saved offset.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._reset(None)
+
+    def _reset(self, inode: int | None) -> None:
+        self._inode = inode
+        self._offset = 0
+        self._last_line = b""
+        self._arrays = _rows_to_arrays(())
+
+    def load(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        st = os.stat(self.path)
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset(st.st_ino)
+        start = self._offset - len(self._last_line)
+        with open(self.path, "rb") as handle:
+            handle.seek(start)
+            buf = handle.read()
+            if not buf.startswith(self._last_line):
+                self._reset(st.st_ino)
+                start = 0
+                handle.seek(0)
+                buf = handle.read()
+        skip = len(self._last_line)
+        end = buf.rfind(b"\n") + 1
+        rows = [_json_loads(line) for line in buf[skip:end].splitlines() if line.strip()]
+        tail = buf[max(end, skip):].strip()
+        if tail:
+            # An unterminated last line counts once it parses, as in
+            # load_matrix; until then it is left for the next load.
+            try:
+                rows.append(_json_loads(tail))
+                end = len(buf)
+            except ValueError:
+                pass
+        if end > skip:
+            if rows:
+                new = _rows_to_arrays(rows)
+                self._arrays = tuple(
+                    np.concatenate((old, add)) for old, add in zip(self._arrays, new)
+                )
+            self._offset = start + end
+            self._last_line = buf[buf.rfind(b"\n", 0, end - 1) + 1 : end]
+        return self._arrays
+
+
+class FeatureWatch:
+    """Blocks the retrain loop until the features file has changed.
+
+    With watchdog installed a write to the file wakes wait() at once; without
+    it, wait() re-stats the file every poll_s seconds.
+    """
+
+    def __init__(self, path: str, poll_s: float = 1.0) -> None:
+        self.path = os.path.abspath(path)
+        self.poll_s = poll_s
+        self._event = threading.Event()
+        self._observer = None
+
+    def signature(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _watch(self) -> None:
+        directory = os.path.dirname(self.path)
+        if Observer is None or self._observer is not None or not os.path.isdir(directory):
+            return
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_FeatureWatchHandler(self), directory, recursive=False)
+            observer.start()
+            self._observer = observer
+        except Exception:
+            pass
+
+    def notify(self, path: str) -> None:
+        if path == self.path:
+            self._event.set()
+
+    def wait(self, since: tuple[int, int, int] | None, min_wait: float) -> None:
+        """Sleep min_wait seconds, then until the signature differs from since."""
+        # Watching before the sleep means appends made during it still wake us.
+        self._watch()
+        time.sleep(min_wait)
+        while True:
+            self._event.clear()
+            if self.signature() != since:
+                return
+            self._watch()
+            # Events can be missed (e.g. the directory was recreated), so the
+            # watched wait still re-stats every min_wait seconds.
+            self._event.wait(self.poll_s if self._observer is None else max(min_wait, self.poll_s))
+
+
+class _FeatureWatchHandler(FileSystemEventHandler):
+    def __init__(self, watch: FeatureWatch) -> None:
+        super().__init__()
+        self._owner = watch
+
+    # The loop's own reads emit opened/closed_no_write; ignore those.
+    _WRITE_EVENTS = {"created", "modified", "moved", "closed"}
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory or event.event_type not in self._WRITE_EVENTS:
+            return
+        self._owner.notify(os.fsdecode(event.src_path))
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            self._owner.notify(os.fsdecode(dest))
 
 
 class AutoEncoderPredictor(nn.Module):
@@ -105,16 +270,159 @@ class AutoEncoderPredictor(nn.Module):
         return recon, pred
 
 
+class GraphedTrainStep:
+    """
+    One training step (forward, loss, backward, Adam update) as a CUDA graph.
+
+    Each call copies the batch into the captured input buffers and replays
+    the graph, so a step costs one launch instead of one per kernel. The
+    optimizer must be built with capturable=True, every batch must have the
+    captured shape, and a few eager steps on a side stream must run first.
+    """
+
+    def __init__(self, train_losses, optim: torch.optim.Optimizer, xb, yb, amp_dtype) -> None:
+        self.static_x = xb.clone()
+        self.static_y = yb.clone()
+        self.graph = torch.cuda.CUDAGraph()
+        optim.zero_grad(set_to_none=True)
+        with torch.cuda.graph(self.graph):
+            # The autocast weight cache would hold tensors made outside the
+            # capture, so it is off while graphing.
+            with torch.autocast(
+                device_type="cuda", dtype=amp_dtype, enabled=amp_dtype is not None, cache_enabled=False
+            ):
+                self.loss, self.pred_loss = train_losses(self.static_x, self.static_y)
+            self.loss.backward()
+            optim.step()
+
+    def __call__(self, xb: torch.Tensor, yb: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        self.static_x.copy_(xb)
+        self.static_y.copy_(yb)
+        self.graph.replay()
+        return self.loss, self.pred_loss
+
+
+def _to_device(arr: np.ndarray, device: torch.device) -> torch.Tensor:
+    # from_numpy shares the array's memory instead of copying it like
+    # torch.tensor; on CUDA the pinned staging copy lets the transfer run
+    # asynchronously on the copy engine.
+    tensor = torch.from_numpy(np.ascontiguousarray(arr))
+    if device.type == "cuda":
+        return tensor.pin_memory().to(device, non_blocking=True)
+    return tensor.to(device)
+
+
+def standardize(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column z-scores plus the mean and std used (zero std treated as 1).
+
+    The centered copy is made once and reused for both the variance and the
+    result, where mean/std/(x - mean)/std would center the data twice.
+    Values are identical to that sequence.
+    """
+
+    mean = values.mean(axis=0)
+    centered = values - mean
+    std = np.sqrt(np.multiply(centered, centered).sum(axis=0) / values.shape[0])
+    std[std == 0] = 1.0
+    centered /= std
+    return centered, mean, std
+
+
+def build_horizon(
+    pred_deltas: np.ndarray, pred_std: np.ndarray, last_close: float, k: float, steps: int
+) -> list[dict]:
+    """Forecast band per step: cumulative mean and k * sqrt(cumulative variance)."""
+    mu = np.asarray(pred_deltas[:steps], dtype=np.float64)
+    sigma = np.zeros(steps, dtype=np.float64)
+    sigma[: min(len(pred_std), steps)] = pred_std[:steps]
+    # cumsum adds left to right, the same order as a running Python sum.
+    means = last_close + np.cumsum(mu)
+    bands = k * np.sqrt(np.cumsum(sigma * sigma))
+    return [
+        {"step": step, "mu": m, "sigma": s, "mean": mean, "low": low, "high": high}
+        for step, m, s, mean, low, high in zip(
+            range(1, steps + 1),
+            mu.tolist(),
+            sigma.tolist(),
+            means.tolist(),
+            (means - bands).tolist(),
+            (means + bands).tolist(),
+        )
+    ]
+
+
+def _json_dumps(payload: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+# Append handles stay open between writes, most recently used last. The
+# per-minute archive files would otherwise pile up, so the oldest is closed
+# once there are more than this many.
+_MAX_APPEND_HANDLES = 8
+_append_handles: dict[str, TextIO] = {}
+
+
+def _close_append_handles() -> None:
+    while _append_handles:
+        _append_handles.pop(next(iter(_append_handles))).close()
+
+
+atexit.register(_close_append_handles)
+
+
 def write_jsonl(path: str, payload: dict) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload) + "\n")
+    handle = _append_handles.pop(path, None)
+    if handle is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Line buffered: each record reaches the file as one complete line.
+        handle = open(path, "a", encoding="utf-8", buffering=1)
+        if len(_append_handles) >= _MAX_APPEND_HANDLES:
+            _append_handles.pop(next(iter(_append_handles))).close()
+    _append_handles[path] = handle
+    handle.write(_json_dumps(payload) + "\n")
 
 
 def write_json_latest(path: str, payload: dict) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload) + "\n")
+        handle.write(_json_dumps(payload) + "\n")
+
+
+def save_checkpoint(path: str, model: nn.Module, optim: torch.optim.Optimizer) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Written aside and swapped in so a crash mid-save leaves the old one.
+    tmp_path = path + ".tmp"
+    torch.save({"model": model.state_dict(), "optim": optim.state_dict()}, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(
+    path: str, model: nn.Module, optim: torch.optim.Optimizer, device: torch.device
+) -> bool:
+    """
+    Restore state written by save_checkpoint.
+
+    Returns False (leaving a fresh model) when there is no checkpoint or it
+    was saved with different layer sizes.
+    """
+
+    try:
+        state = torch.load(path, map_location=device, weights_only=True)
+    except FileNotFoundError:
+        return False
+    # load_state_dict copies matching tensors before it raises on the rest.
+    fresh = {name: value.clone() for name, value in model.state_dict().items()}
+    try:
+        model.load_state_dict(state["model"])
+        optim.load_state_dict(state["optim"])
+    except (KeyError, RuntimeError, ValueError) as exc:
+        model.load_state_dict(fresh)
+        print("checkpoint", f"path={path}", "ignored", f"reason={type(exc).__name__}")
+        return False
+    return True
 
 
 def main() -> None:
@@ -151,19 +459,69 @@ def main() -> None:
     parser.add_argument("--stale-score-s", type=float, default=300.0)
     parser.add_argument("--stale-candle-s", type=float, default=120.0)
     parser.add_argument("--force-retrain", action="store_true")
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile forward + loss with torch.compile (recompiled each retrain cycle).",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["fp32", "bf16", "fp16"],
+        default="fp32",
+        help="Autocast dtype for training forward/loss; fp16 needs CUDA and uses a grad scaler.",
+    )
+    parser.add_argument(
+        "--cuda-graph",
+        action="store_true",
+        help="Capture each training step as a CUDA graph after a short eager warmup (CUDA, fp32/bf16).",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Keep the model and Adam state across retrain cycles; pair with fewer --epochs.",
+    )
+    parser.add_argument(
+        "--checkpoint-path",
+        default=None,
+        help="With --warm-start, resume from this file at startup and save to it after each retrain.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="Intra-op CPU threads for torch; 0 keeps torch's default (OMP_NUM_THREADS or all cores).",
+    )
     args = parser.parse_args()
     pred_latest_path = args.pred_latest_path or args.pred_path or "data/predictions_latest.jsonl"
 
     device = torch.device("cuda" if args.use_cuda and torch.cuda.is_available() else "cpu")
-
+    if args.precision == "fp16" and device.type != "cuda":
+        raise SystemExit("--precision fp16 requires --use-cuda with a CUDA device.")
+    amp_dtype = {"bf16": torch.bfloat16, "fp16": torch.float16}.get(args.precision)
+    if args.cuda_graph and device.type != "cuda":
+        raise SystemExit("--cuda-graph requires --use-cuda with a CUDA device.")
+    if args.cuda_graph and (args.compile or args.precision == "fp16"):
+        raise SystemExit("--cuda-graph cannot be combined with --compile or --precision fp16.")
+    if args.threads > 0:
+        torch.set_num_threads(args.threads)
+
+    features = FeatureCache(args.features)
+    # Between cycles the loop sleeps retrain_interval and then keeps sleeping
+    # until build_features.py has appended rows, so an idle feed costs no
+    # gate evaluation or feature reload.
+    watch = FeatureWatch(args.features)
+    loader = ThreadPoolExecutor(max_workers=1)
+    model = optim = None
     cycle = 0
     while True:
         cycle += 1
-        matrix, closes, returns = load_matrix(args.features)
-        if matrix.size == 0 or len(closes) < (args.horizon + 1):
-            time.sleep(args.retrain_interval)
-            continue
-
+        # Stat before loading: a write racing the load then just buys one
+        # extra cycle rather than a missed one.
+        seen = watch.signature()
+        # The feature read runs while the gate reads its own files; loading at
+        # cycle start (not ahead of the sleep) keeps the rows current.
+        load_future = loader.submit(features.load)
+        gate = None
         if not args.force_retrain:
             gate = evaluate_retrain_gate(
                 scores_path=args.scores_path,
@@ -180,6 +538,12 @@ def main() -> None:
                 stale_score_s=args.stale_score_s,
                 stale_candle_s=args.stale_candle_s,
             )
+        matrix, closes, returns = load_future.result()
+        if matrix.size == 0 or len(closes) < (args.horizon + 1):
+            watch.wait(seen, args.retrain_interval)
+            continue
+
+        if gate is not None:
             coverage = f"{gate.coverage:.3f}" if gate.coverage is not None else "na"
             mae = f"{gate.mae:.6f}" if gate.mae is not None else "na"
             mae_thr = f"{gate.mae_threshold:.6f}" if gate.mae_threshold is not None else "na"
@@ -196,78 +560,128 @@ def main() -> None:
             if not gate.allow:
                 if args.once:
                     break
-                time.sleep(args.retrain_interval)
+                watch.wait(seen, args.retrain_interval)
                 continue
         else:
             print("retrain_gate", "force=true", "decision=ALLOW", "reason=forced")
 
         # Align X_t -> delta close for each horizon step.
+        # Row i is deltas[i : i + horizon]; the window view builds no rows and
+        # the clip writes the one (n, horizon) copy.
         n = len(closes) - args.horizon
         X = matrix[:n]
-        y = np.stack(
-            [
-                [
-                    closes[i + k] - closes[i + k - 1]
-                    for k in range(1, args.horizon + 1)
-                ]
-                for i in range(n)
-            ],
-            axis=0,
+        deltas = np.diff(closes)
+        y = np.clip(
+            np.lib.stride_tricks.sliding_window_view(deltas, args.horizon),
+            -args.max_delta,
+            args.max_delta,
         )
-        y = np.clip(y, -args.max_delta, args.max_delta)
 
         # Normalize per-feature
-        mean = X.mean(axis=0)
-        std = X.std(axis=0)
-        std[std == 0] = 1.0
-        Xn = (X - mean) / std
+        Xn, mean, std = standardize(X)
 
         # Normalize target deltas per horizon step
-        y_mean = y.mean(axis=0)
-        y_std = y.std(axis=0)
-        y_std[y_std == 0] = 1.0
-        y_norm = (y - y_mean) / y_std
-
-        split = int(n * (1 - args.val_split))
-        X_train, X_val = Xn[:split], Xn[split:]
-        y_train, y_val = y_norm[:split], y_norm[split:]
-
-        model = AutoEncoderPredictor(Xn.shape[1], args.bottleneck, args.horizon).to(device)
-        optim = torch.optim.Adam(model.parameters(), lr=args.lr)
+        y_norm, y_mean, y_std = standardize(y)
+
+        # Layer sizes are fixed for the run (feature count and flags), so a
+        # warm-started model always fits the new cycle's data.
+        if model is None or not args.warm_start:
+            model = AutoEncoderPredictor(Xn.shape[1], args.bottleneck, args.horizon).to(device)
+            optim = torch.optim.Adam(model.parameters(), lr=args.lr, capturable=args.cuda_graph)
+            if args.warm_start and args.checkpoint_path:
+                load_checkpoint(args.checkpoint_path, model, optim, device)
         loss_fn = nn.MSELoss()
 
-        X_train_t = torch.tensor(X_train, device=device)
-        y_train_t = torch.tensor(y_train, device=device)
-        X_val_t = torch.tensor(X_val, device=device)
-        y_val_t = torch.tensor(y_val, device=device)
+        # One upload each; the train/val splits and the end-of-cycle
+        # reconstruction pass all read row views of these tensors.
+        Xn_t = _to_device(Xn, device)
+        y_norm_t = _to_device(y_norm, device)
+        split = int(n * (1 - args.val_split))
+        X_train_t, X_val_t = Xn_t[:split], Xn_t[split:]
+        y_train_t, y_val_t = y_norm_t[:split], y_norm_t[split:]
+
+        def train_losses(xb: torch.Tensor, yb: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+            recon, pred = model(xb)
+            pred_loss = loss_fn(pred, yb)
+            return loss_fn(recon, xb) + pred_loss, pred_loss
+
+        if args.compile:
+            # Batches are always batch_size rows (the remainder is dropped),
+            # so one graph is captured per cycle and replayed every step.
+            train_losses = torch.compile(train_losses, mode="reduce-overhead", fullgraph=True)
+
+        # Weights, optimizer state and validation stay FP32; autocast only
+        # lowers the training matmuls. FP16 gradients need loss scaling.
+        scaler = torch.amp.GradScaler(device.type, enabled=args.precision == "fp16")
+
+        # With --cuda-graph the first steps run eagerly on a side stream
+        # (lazy init must happen outside the capture), then the step is
+        # captured and replayed for the rest of the cycle.
+        graphed = None
+        warmup_left = 3 if args.cuda_graph else -1
+        side_stream = torch.cuda.Stream() if args.cuda_graph else None
 
         steps = max(1, len(X_train_t) // args.batch_size)
         for epoch in range(1, args.epochs + 1):
             model.train()
+            # One gather per epoch into shuffled copies; each step then takes
+            # a contiguous slice (a view) instead of its own indexed gather.
             perm = torch.randperm(len(X_train_t), device=device)
-            epoch_loss = 0.0
-            pred_loss_total = 0.0
+            X_shuffled = X_train_t.index_select(0, perm)
+            y_shuffled = y_train_t.index_select(0, perm)
+            # Summed on the device and read back once per epoch; .item() per
+            # step would sync the host with the device twice per batch.
+            epoch_loss_t = torch.zeros((), dtype=torch.float64, device=device)
+            pred_loss_t = torch.zeros((), dtype=torch.float64, device=device)
             for i in range(steps):
-                idx = perm[i * args.batch_size : (i + 1) * args.batch_size]
-                xb = X_train_t[idx]
-                yb = y_train_t[idx]
-                recon, pred = model(xb)
-                recon_loss = loss_fn(recon, xb)
-                pred_loss = loss_fn(pred, yb)
-                loss = recon_loss + pred_loss
-                optim.zero_grad()
-                loss.backward()
-                optim.step()
-                epoch_loss += loss.item()
-                pred_loss_total += pred_loss.item()
+                batch = slice(i * args.batch_size, (i + 1) * args.batch_size)
+                xb = X_shuffled[batch]
+                yb = y_shuffled[batch]
+                if warmup_left == 0:
+                    torch.cuda.current_stream().wait_stream(side_stream)
+                    graphed = GraphedTrainStep(train_losses, optim, xb, yb, amp_dtype)
+                    warmup_left = -1
+                if graphed is not None:
+                    loss, pred_loss = graphed(xb, yb)
+                    epoch_loss_t += loss.detach()
+                    pred_loss_t += pred_loss.detach()
+                    continue
+                if side_stream is not None:
+                    # The shuffle and the loss accumulators were queued on the
+                    # default stream; the side stream must see them finished.
+                    # The default stream waits back after the step, so none of
+                    # these buffers is freed while the side stream uses it.
+                    side_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(side_stream) if side_stream else contextlib.nullcontext():
+                    with torch.autocast(
+                        device_type=device.type, dtype=amp_dtype, enabled=amp_dtype is not None
+                    ):
+                        loss, pred_loss = train_losses(xb, yb)
+                    optim.zero_grad(set_to_none=True)
+                    scaler.scale(loss).backward()
+                    scaler.step(optim)
+                    scaler.update()
+                    epoch_loss_t += loss.detach()
+                    pred_loss_t += pred_loss.detach()
+                if side_stream is not None:
+                    torch.cuda.current_stream().wait_stream(side_stream)
+                    warmup_left -= 1
+            epoch_loss = epoch_loss_t.item()
+            pred_loss_total = pred_loss_t.item()
 
             # Validation
             model.eval()
-            with torch.no_grad():
+            with torch.inference_mode():
                 recon_v, pred_v = model(X_val_t)
-                val_loss = loss_fn(recon_v, X_val_t).item() + loss_fn(pred_v, y_val_t).item()
-                pred_err = (pred_v - y_val_t).cpu().numpy()
-                pred_std_norm = pred_err.std(axis=0) if pred_err.size else np.zeros(args.horizon)
+                # Reduce on the device and copy back only the two losses and
+                # the horizon-sized spread, not the whole validation error.
+                val_losses = torch.stack([loss_fn(recon_v, X_val_t), loss_fn(pred_v, y_val_t)])
+                if pred_v.shape[0]:
+                    pred_std_norm = (pred_v - y_val_t).std(dim=0, correction=0).cpu().numpy()
+                else:
+                    pred_std_norm = np.zeros(args.horizon)
+                val_recon_loss, val_pred_loss = val_losses.tolist()
+                val_loss = val_recon_loss + val_pred_loss
                 pred_std = np.clip(pred_std_norm * y_std, 0.0, args.max_delta)
 
             status = {
@@ -282,15 +696,19 @@ def main() -> None:
             }
             write_jsonl(args.status_path, status)
 
-        # Reconstruction error stats on recent window.
+        if args.warm_start and args.checkpoint_path:
+            save_checkpoint(args.checkpoint_path, model, optim)
+
+        # Reconstruction error stats on recent window. Only the trailing
+        # 500 rows are run; the same pass yields the forecast, since its last
+        # row is the latest feature row.
         model.eval()
-        with torch.no_grad():
-            recon_all, _ = model(torch.tensor(Xn, device=device))
-            recon_all = recon_all.cpu().numpy()
-        recon_close = recon_all[:, 0] * std[0] + mean[0]
+        with torch.inference_mode():
+            recon_tail, pred_tail = model(Xn_t[-500:])
+            recon_close = recon_tail[:, 0].cpu().numpy() * std[0] + mean[0]
+            pred_norm = pred_tail[-1].cpu().numpy()
         actual_close = matrix[:n, 0]
-        errors = np.abs(actual_close - recon_close[: len(actual_close)])
-        window_errors = errors[-500:] if len(errors) > 500 else errors
+        window_errors = np.abs(actual_close[-len(recon_close):] - recon_close)
         mean_error = float(window_errors.mean()) if window_errors.size else 0.0
         std_error = float(window_errors.std()) if window_errors.size else 0.0
         last_recon = float(recon_close[-1])
@@ -308,34 +726,10 @@ def main() -> None:
         write_jsonl(args.recon_path, recon_payload)
 
         # Forecast using last feature row
-        last_x = (matrix[n - 1] - mean) / std
         last_close = float(closes[n - 1])
-        model.eval()
-        with torch.no_grad():
-            _, pred = model(torch.tensor(last_x, device=device).unsqueeze(0))
-            pred_deltas = pred.squeeze(0).cpu().numpy() * y_std + y_mean
-            pred_deltas = np.clip(pred_deltas, -args.max_delta, args.max_delta)
-
-        horizon = []
-        cum_mu = 0.0
-        cum_var = 0.0
-        for i in range(1, args.horizon + 1):
-            mu = float(pred_deltas[i - 1])
-            sigma = float(pred_std[i - 1]) if len(pred_std) >= i else 0.0
-            cum_mu += mu
-            cum_var += sigma * sigma
-            mean_close = last_close + cum_mu
-            band = args.k * math.sqrt(cum_var)
-            horizon.append(
-                {
-                    "step": i,
-                    "mu": mu,
-                    "sigma": sigma,
-                    "mean": mean_close,
-                    "low": mean_close - band,
-                    "high": mean_close + band,
-                }
-            )
+        pred_deltas = np.clip(pred_norm * y_std + y_mean, -args.max_delta, args.max_delta)
+
+        horizon = build_horizon(pred_deltas, pred_std, last_close, args.k, args.horizon)
 
         pred_payload = {
             "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -355,7 +749,7 @@ def main() -> None:
 
         if args.once:
             break
-        time.sleep(args.retrain_interval)
+        watch.wait(seen, args.retrain_interval)
 
 
 if __name__ == "__main__":
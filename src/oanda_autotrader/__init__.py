@@ -12,12 +12,13 @@ from .config import (
     AccountGroup,
     AppConfig,
     AppSettings,
+    account_groups_signature,
     load_account_groups,
     resolve_account_credentials,
     select_account,
 )
 from .http import OandaHttpClient
-from .async_http import OandaAsyncHttpClient
+from .async_http import OandaAsyncHttpClient, close_shared_sessions
 from .endpoints.accounts import AccountsAPI
 from .endpoints.accounts_async import AccountsAsyncAPI
 from .endpoints.instruments import InstrumentsAPI
@@ -56,11 +57,13 @@ __all__ = [
     "AccountGroup",
     "AppConfig",
     "AppSettings",
+    "account_groups_signature",
     "load_account_groups",
     "resolve_account_credentials",
     "select_account",
     "OandaHttpClient",
     "OandaAsyncHttpClient",
+    "close_shared_sessions",
     "AccountsAPI",
     "AccountsAsyncAPI",
     "InstrumentsAPI",
@@ -18,6 +18,7 @@ from __future__ import annotations
 from typing import Callable
 
 from .config import (
+    AccountGroup,
     AppConfig,
     load_account_groups,
     resolve_account_credentials,
@@ -93,6 +94,17 @@ def build_instruments_client_async(config: AppConfig) -> InstrumentsAsyncAPI:
     return InstrumentsAsyncAPI(http_client)
 
 
+def _load_validated_groups(accounts_path: str) -> dict[str, AccountGroup]:
+    # load_account_groups caches the parse, so each loader below costs one
+    # stat after the first call in a process.
+    groups = load_account_groups(accounts_path)
+    warnings = validate_account_groups(groups)
+    if warnings:
+        # Fail fast so missing/duplicate values are fixed before HTTP calls.
+        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    return groups
+
+
 def load_account_client(
     accounts_path: str, group_name: str, account_name: str
 ) -> AccountsAPI:
@@ -100,11 +112,7 @@ def load_account_client(
     Find an account by group name + account name and return an AccountsAPI client.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        # Fail fast so missing/duplicate values are fixed before HTTP calls.
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     return build_account_client(resolved)
@@ -117,11 +125,7 @@ def load_account_client_async(
     Find an account by group name + account name and return an async AccountsAPI client.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        # Fail fast so missing/duplicate values are fixed before HTTP calls.
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     return build_account_client_async(resolved)
@@ -134,10 +138,7 @@ def load_instruments_client(
     Find an account by group name + account name and return an InstrumentsAPI client.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     return build_instruments_client(resolved)
@@ -150,10 +151,7 @@ def load_instruments_client_async(
     Find an account by group name + account name and return an async InstrumentsAPI client.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     return build_instruments_client_async(resolved)
@@ -166,12 +164,7 @@ def validate_account_connection(
     Validate accounts.yaml + credentials by calling GET /v3/accounts.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        # Treat validation warnings as hard errors for connection checks.
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
-
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     http_client = OandaHttpClient(base_url=resolved.base_url, token=resolved.token)
@@ -206,10 +199,7 @@ def load_stream_client(
     Find an account by group name + account name and return a stream client.
     """
 
-    groups = load_account_groups(accounts_path)
-    warnings = validate_account_groups(groups)
-    if warnings:
-        raise ValueError("accounts.yaml validation warnings: " + "; ".join(warnings))
+    groups = _load_validated_groups(accounts_path)
     group, entry = select_account(groups, group_name, account_name)
     resolved = resolve_account_credentials(group, entry)
     return build_stream_client(resolved)
@@ -14,13 +14,22 @@ Logic flow:
 2) Endpoint methods call request(method, path, ...).
 3) request() builds the full URL, injects headers, and delegates to aiohttp.
 4) JSON response is returned to the caller for downstream processing.
+
+Sessions:
+- `async with client:` gives the client its own session, closed on exit.
+- Otherwise request() borrows a session shared by every client on the same
+  event loop with the same base_url and timeout, so TCP/TLS connections and
+  DNS lookups are pooled across clients. The token travels in a per-request
+  header, never in the session. close_shared_sessions() closes them.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any
+import asyncio
 import logging
+import weakref
 
 import aiohttp
 
@@ -28,6 +37,42 @@ from .rate_limit import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# A session is bound to the loop it was created on, so the pool is per loop;
+# entries go away with their loop.
+_SHARED_SESSIONS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, int], aiohttp.ClientSession]
+] = weakref.WeakKeyDictionary()
+
+
+def _new_session(timeout_seconds: int) -> aiohttp.ClientSession:
+    # Cache DNS and keep idle connections longer than aiohttp's defaults
+    # (10s / 15s) so polls every few seconds reuse the same connection.
+    connector = aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=75)
+    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def _shared_session(base_url: str, timeout_seconds: int) -> aiohttp.ClientSession:
+    sessions = _SHARED_SESSIONS.setdefault(asyncio.get_running_loop(), {})
+    key = (base_url.rstrip("/"), timeout_seconds)
+    session = sessions.get(key)
+    if session is None or session.closed:
+        session = sessions[key] = _new_session(timeout_seconds)
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """
+    Close the sessions shared by clients on the running event loop.
+
+    Call once at shutdown; a later request() opens a fresh session.
+    """
+
+    sessions = _SHARED_SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
 @dataclass
 class OandaAsyncHttpClient:
     """
@@ -44,8 +89,7 @@ class OandaAsyncHttpClient:
 
     async def __aenter__(self) -> "OandaAsyncHttpClient":
         if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            self._session = _new_session(self.timeout_seconds)
         if self._rate_limiter is None and self.requests_per_second is not None:
             self._rate_limiter = AsyncRateLimiter(self.requests_per_second)
         return self
@@ -54,6 +98,13 @@ class OandaAsyncHttpClient:
         await self.close()
 
     async def close(self) -> None:
+        """
+        Close the session this client opened with `async with`.
+
+        A client used without `async with` borrows a shared session, which
+        close() leaves open; close_shared_sessions() closes those.
+        """
+
         if self._session is not None:
             await self._session.close()
             self._session = None
@@ -80,9 +131,7 @@ class OandaAsyncHttpClient:
         - Parsed JSON response as a dict.
         """
 
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+        session = self._session or _shared_session(self.base_url, self.timeout_seconds)
         if self._rate_limiter is None and self.requests_per_second is not None:
             self._rate_limiter = AsyncRateLimiter(self.requests_per_second)
 
@@ -97,7 +146,7 @@ class OandaAsyncHttpClient:
             await self._rate_limiter.wait()
         if self.debug_logging:
             logger.info("HTTP %s %s", method.upper(), url)
-        async with self._session.request(
+        async with session.request(
             method=method.upper(),
             url=url,
             params=params,
@@ -31,11 +31,18 @@ import os
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YAML_LOADER
+
 DEFAULT_PRACTICE_URL = "https://api-fxpractice.oanda.com"
 DEFAULT_LIVE_URL = "https://api-fxtrade.oanda.com"
 DEFAULT_PRACTICE_STREAM_URL = "https://stream-fxpractice.oanda.com"
 DEFAULT_LIVE_STREAM_URL = "https://stream-fxtrade.oanda.com"
 _ENV_LOADED = False
+# realpath -> (mtime_ns, size, groups) of the last parse of each accounts file.
+_GROUPS_CACHE: dict[str, tuple[int, int, dict[str, "AccountGroup"]]] = {}
 
 
 @dataclass(frozen=True)
@@ -247,12 +254,37 @@ def load_account_groups(path: str) -> dict[str, AccountGroup]:
 
     Next:
     - select_account() chooses the specific account for use.
+
+    The parse is cached per file and reused until its mtime or size changes,
+    so resolving several accounts in one process reads the YAML once. The
+    groups are shared between callers and must not be mutated.
     """
 
+    key = os.path.realpath(path)
+    mtime_ns, size = account_groups_signature(key)
+    cached = _GROUPS_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+        return dict(cached[2])
+
     # YAML is intentionally kept small and human-readable.
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
-    return _parse_groups(raw)
+    with open(key, "r", encoding="utf-8") as handle:
+        raw = yaml.load(handle, Loader=_YAML_LOADER) or {}
+    groups = _parse_groups(raw)
+    _GROUPS_CACHE[key] = (mtime_ns, size, groups)
+    return dict(groups)
+
+
+def account_groups_signature(path: str) -> tuple[int, int]:
+    """
+    Return (st_mtime_ns, st_size) of accounts.yaml.
+
+    This changes whenever load_account_groups() would re-parse the file, so
+    callers caching clients built from it can key on it and pick up a
+    rotated token or account without a restart.
+    """
+
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
 
 
 def select_account(
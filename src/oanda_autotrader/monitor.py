@@ -9,24 +9,45 @@ Purpose:
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import time
 
 from .app import load_account_client
+from .config import account_groups_signature
+from .endpoints.accounts import AccountsAPI
 from .metrics import LatencyTracker, export_latency_csv, export_latency_jsonl
 
 
+@lru_cache(maxsize=16)
+def _cached_account_client(
+    accounts_path: str, group_name: str, account_name: str, signature: tuple[int, int]
+) -> AccountsAPI:
+    # Reusing the client keeps its requests.Session, so repeated samples ride
+    # a kept-alive connection instead of paying a TLS handshake each time.
+    # ``signature`` is only part of the key: editing accounts.yaml (a rotated
+    # token, say) builds a new client instead of pinning the old credentials.
+    return load_account_client(accounts_path, group_name, account_name)
+
+
 def measure_account_latency(
     accounts_path: str,
     group_name: str,
     account_name: str,
     *,
     label: str | None = None,
+    client: AccountsAPI | None = None,
 ) -> tuple[dict[str, object], float]:
     """
     Measure latency for GET /v3/accounts and return response + timing.
+
+    Pass ``client`` to sample through an existing client; otherwise one
+    cached client per (accounts_path, group, account) is reused until
+    accounts.yaml changes.
     """
 
-    client = load_account_client(accounts_path, group_name, account_name)
+    if client is None:
+        signature = account_groups_signature(accounts_path)
+        client = _cached_account_client(accounts_path, group_name, account_name, signature)
     start = time.perf_counter()
     response = client.list_accounts()
     elapsed_ms = (time.perf_counter() - start) * 1000.0
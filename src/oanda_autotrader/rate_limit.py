@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from collections import deque
 import asyncio
+import threading
 import time
 
 
@@ -23,17 +24,20 @@ class RateLimiter:
             raise ValueError("max_per_second must be > 0")
         self._max = max_per_second
         self._timestamps: deque[float] = deque()
+        # One client may be shared by worker threads (see run_checks.py).
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
-        now = time.perf_counter()
-        window_start = now - 1.0
-        while self._timestamps and self._timestamps[0] < window_start:
-            self._timestamps.popleft()
-        if len(self._timestamps) >= self._max:
-            sleep_for = 1.0 - (now - self._timestamps[0])
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-        self._timestamps.append(time.perf_counter())
+        with self._lock:
+            now = time.perf_counter()
+            window_start = now - 1.0
+            while self._timestamps and self._timestamps[0] < window_start:
+                self._timestamps.popleft()
+            if len(self._timestamps) >= self._max:
+                sleep_for = 1.0 - (now - self._timestamps[0])
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+            self._timestamps.append(time.perf_counter())
 
 
 class AsyncRateLimiter:
@@ -8,6 +8,7 @@ Purpose:
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -56,6 +57,12 @@ class StreamLatencySample:
 class StreamMetrics:
     """
     In-memory stream metrics for a single stream.
+
+    Only the stream thread mutates the sample deques; the read side
+    (``messages_per_second``, the latency stats and ``snapshot``) copies
+    them with a single ``tuple()`` call and never trims, so a render thread
+    can poll it without a lock. Readers skip samples older than the window
+    themselves, so a stalled stream's rate and latency still age out.
     """
 
     def __init__(self, *, window_seconds: int = 10) -> None:
@@ -79,6 +86,10 @@ class StreamMetrics:
         self.last_effective_ms: float | None = None
         self.clock_offset_ms: float = 0.0
         self.last_outlier: bool | None = None
+        # Bumped whenever the latency samples change; snapshot() reuses its
+        # sorted stats until then instead of re-sorting on every call.
+        self._latency_version = 0
+        self._latency_cache: tuple[tuple[int, int], tuple, tuple] | None = None
 
     def on_event(self, event: dict) -> None:
         event_type = event.get("event")
@@ -107,13 +118,14 @@ class StreamMetrics:
             self._message_ts.popleft()
         while self._latency_samples and self._latency_samples[0].timestamp < window_start:
             self._latency_samples.popleft()
+            self._latency_version += 1
         while len(self._neg_skew_samples) > max(int(self._window_seconds * 10), 10):
             self._neg_skew_samples.popleft()
 
     def messages_per_second(self) -> float:
-        now = time.time()
-        self._trim(now)
-        return len(self._message_ts) / max(self._window_seconds, 1)
+        stamps = tuple(self._message_ts)
+        recent = len(stamps) - bisect_left(stamps, time.time() - self._window_seconds)
+        return recent / max(self._window_seconds, 1)
 
     def record_latency(self, server_time: str | None, received_ts: float) -> None:
         if not server_time:
@@ -144,25 +156,37 @@ class StreamMetrics:
                 timestamp=received_ts,
             )
         )
+        self._latency_version += 1
         self._trim(received_ts)
 
-    def latency_stats(self) -> tuple[float | None, float | None, float | None]:
-        values = [s.milliseconds for s in self._latency_samples if not s.outlier]
+    def _live_latency_samples(self) -> tuple[StreamLatencySample, ...]:
+        cutoff = time.time() - self._window_seconds
+        return tuple(s for s in tuple(self._latency_samples) if s.timestamp >= cutoff)
+
+    @staticmethod
+    def _summarize(
+        values: list[float], last: float | None
+    ) -> tuple[float | None, float | None, float | None]:
         if not values:
             return None, None, None
         values = sorted(values)
         mean = sum(values) / len(values)
         p95_index = max(0, int(round(0.95 * (len(values) - 1))))
-        return self.last_latency_ms, values[p95_index], mean
+        return last, values[p95_index], mean
+
+    def _latency_stats(self, samples) -> tuple[float | None, float | None, float | None]:
+        values = [s.milliseconds for s in samples if not s.outlier]
+        return self._summarize(values, self.last_latency_ms)
+
+    def _effective_latency_stats(self, samples) -> tuple[float | None, float | None, float | None]:
+        values = [s.effective_ms for s in samples if not s.outlier]
+        return self._summarize(values, self.last_effective_ms)
+
+    def latency_stats(self) -> tuple[float | None, float | None, float | None]:
+        return self._latency_stats(self._live_latency_samples())
 
     def effective_latency_stats(self) -> tuple[float | None, float | None, float | None]:
-        values = [s.effective_ms for s in self._latency_samples if not s.outlier]
-        if not values:
-            return None, None, None
-        values = sorted(values)
-        mean = sum(values) / len(values)
-        p95_index = max(0, int(round(0.95 * (len(values) - 1))))
-        return self.last_effective_ms, values[p95_index], mean
+        return self._effective_latency_stats(self._live_latency_samples())
 
     def _update_clock_offset(self, raw_ms: float, *, outlier: bool) -> float:
         if raw_ms < 0.0 and not outlier:
@@ -205,8 +229,15 @@ class StreamMetrics:
             return None
 
     def snapshot(self) -> StreamMetricsSnapshot:
-        latency_last, latency_p95, latency_mean = self.effective_latency_stats()
-        clamped_last, clamped_p95, clamped_mean = self.latency_stats()
+        # Samples only ever leave the live set as time passes, so for a given
+        # version its size identifies it and keys the cached stats.
+        samples = self._live_latency_samples()
+        key = (self._latency_version, len(samples))
+        cached = self._latency_cache
+        if cached is None or cached[0] != key:
+            cached = (key, self._effective_latency_stats(samples), self._latency_stats(samples))
+            self._latency_cache = cached
+        _, (latency_last, latency_p95, latency_mean), (clamped_last, clamped_p95, clamped_mean) = cached
         return StreamMetricsSnapshot(
             messages_total=self.messages_total,
             messages_per_sec=self.messages_per_second(),
@@ -26,6 +26,11 @@ import time
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .models import parse_stream_message, StreamMessage
 
 
@@ -79,12 +84,12 @@ class OandaStreamClient:
                 async with self._session.get(url, params=params, headers=headers) as response:
                     response.raise_for_status()
                     async for raw_line in response.content:
-                        line = raw_line.decode("utf-8").strip()
-                        if not line:
+                        if not raw_line.strip():
                             continue
                         try:
-                            payload = json.loads(line)
-                        except json.JSONDecodeError:
+                            # orjson parses the bytes directly (no decode/strip copy).
+                            payload = orjson.loads(raw_line) if orjson else json.loads(raw_line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
                             # Skip malformed lines to keep stream alive.
                             continue
                         parsed = parser(payload) if parser else parse_stream_message(payload)
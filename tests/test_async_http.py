@@ -1,5 +1,6 @@
 import pytest
 
+from oanda_autotrader import async_http
 from oanda_autotrader.async_http import OandaAsyncHttpClient
 
 
@@ -44,3 +45,31 @@ async def test_async_http_client_sets_headers():
     payload = await client.request("GET", "/v3/accounts")
     assert payload["ok"] is True
     assert dummy.last_headers["Authorization"] == "Bearer secret"
+
+
+@pytest.mark.asyncio
+async def test_clients_without_context_share_one_session(monkeypatch):
+    created = []
+
+    def fake_new_session(timeout_seconds):
+        session = DummySession()
+        session.closed = False
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(async_http, "_new_session", fake_new_session)
+    demo = OandaAsyncHttpClient(base_url="https://example.com/", token="demo")
+    live = OandaAsyncHttpClient(base_url="https://example.com", token="live")
+    await demo.request("GET", "/v3/accounts")
+    await live.request("GET", "/v3/accounts")
+    assert len(created) == 1
+    assert created[0].last_headers["Authorization"] == "Bearer live"
+
+    other = OandaAsyncHttpClient(base_url="https://other.example.com", token="demo")
+    await other.request("GET", "/v3/accounts")
+    assert len(created) == 2
+
+    await async_http.close_shared_sessions()
+    await demo.request("GET", "/v3/accounts")
+    assert len(created) == 3
+    await async_http.close_shared_sessions()
@@ -30,6 +30,26 @@ def test_load_account_groups_parses_yaml(tmp_path: Path) -> None:
     assert groups["demo"].accounts[0].name == "Primary"
 
 
+def test_load_account_groups_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    yaml_path = tmp_path / "accounts.yaml"
+    write_accounts_yaml(yaml_path)
+    parses = []
+    real_load = config.yaml.load
+    monkeypatch.setattr(config.yaml, "load", lambda *a, **k: parses.append(1) or real_load(*a, **k))
+
+    first = config.load_account_groups(str(yaml_path))
+    first.pop("demo")
+    second = config.load_account_groups(str(yaml_path))
+    assert "demo" in second
+    assert len(parses) == 1
+
+    write_accounts_yaml(yaml_path, environment="FXTRADE")
+    assert config.load_account_groups(str(yaml_path))["demo"].environment == "live"
+    assert len(parses) == 2
+
+
 def test_select_account_finds_entry(tmp_path: Path) -> None:
     yaml_path = tmp_path / "accounts.yaml"
     write_accounts_yaml(yaml_path)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
-from scripts.dashboard_pygame import _parse_timestamp, load_latest_prediction
+from scripts.dashboard_pygame import _last_json_line, _parse_timestamp, load_latest_prediction
 
 
 def test_load_latest_prediction_skips_stale(tmp_path: Path) -> None:
@@ -32,3 +33,35 @@ def test_parse_timestamp_nanoseconds() -> None:
     dt = _parse_timestamp("2026-01-01T00:00:10.123456789Z")
     assert dt is not None
     assert dt.year == 2026
+
+
+def test_parse_timestamp_formats() -> None:
+    expected = datetime(2026, 1, 1, 0, 0, 10, 123456, tzinfo=timezone.utc)
+    assert _parse_timestamp("2026-01-01T00:00:10.123456789Z") == expected
+    assert _parse_timestamp("2026-01-01T00:00:10.123456+00:00") == expected
+    assert _parse_timestamp("2026-01-01T00:00:10Z") == expected.replace(microsecond=0)
+    assert _parse_timestamp("2026-01-01T00:00:10.5Z") == expected.replace(microsecond=500000)
+    assert _parse_timestamp("2026-01-01") == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert _parse_timestamp("not-a-timestamp") is None
+    assert _parse_timestamp(None) is None
+
+
+def test_load_latest_prediction_scans_past_tail(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.jsonl"
+    valid = {"ts": "2026-01-01T00:00:10Z", "horizon_secs": 60, "horizon": []}
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(json.dumps(valid) + "\n")
+        for i in range(3000):
+            handle.write(json.dumps({"ts": "2026-01-01T00:00:00Z", "i": i}) + "\n")
+    loaded = load_latest_prediction(str(path))
+    assert loaded == valid
+
+
+def test_last_json_line_skips_trailing_blank_lines(tmp_path: Path) -> None:
+    path = tmp_path / "scores.jsonl"
+    path.write_bytes(b'{"n": 1}\r\n{"n": 2}\r\n  \n\n')
+    assert _last_json_line(str(path)) == {"n": 2}
+    path.write_bytes(b'{"n": 3}')
+    assert _last_json_line(str(path)) == {"n": 3}
+    path.write_bytes(b"\n \n")
+    assert _last_json_line(str(path)) is None
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+import pytest
+
+import scripts.dashboard_pygame as dashboard
+from scripts.dashboard_pygame import (
+    FileChangeNotifier,
+    OverlaySurface,
+    SharedState,
+    _axis_label_blits,
+    _render_text,
+    draw_axis_labels,
+    draw_dashed_line,
+    tail_job,
+)
+
+
+def test_update_tick_rolls_candles() -> None:
+    state = SharedState()
+    state.candle_interval = 5
+    state.update_tick(1.0, 100.0)
+    state.update_tick(1.2, 101.0)
+    state.update_tick(0.9, 102.0)
+    state.update_tick(1.1, 104.9)
+    state.update_tick(1.3, 105.0)
+    assert state.candles_arr.shape == (1, 6)
+    assert state.candles_arr[0].tolist() == [1.0, 1.2, 0.9, 1.1, 4.0, 100.0]
+    assert state.instrument_last_close == 1.1
+    assert state.instrument_last_volume == 4
+
+
+def test_candles_arr_is_bounded_and_copy_on_write() -> None:
+    state = SharedState()
+    state.candle_interval = 1
+    state.max_candles = 3
+    for i in range(5):
+        state.update_tick(float(i), float(i))
+    before = state.candles_arr
+    state.update_tick(9.0, 9.0)
+    assert state.candles_arr is not before
+    assert before[:, 3].tolist() == [1.0, 2.0, 3.0]
+    assert state.candles_arr[:, 3].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_histories_are_bounded() -> None:
+    state = SharedState(max_points=3, max_candles=2)
+    for i in range(5):
+        state.update_latency("live", float(i))
+        state.update_recon({"recon": float(i)})
+        state.update_scores({"coverage": i / 10})
+    assert list(state.live_history) == [2.0, 3.0, 4.0]
+    assert state.snapshot.live_history.tolist() == [2.0, 3.0, 4.0]
+    assert state.live_latency_ms == 4.0
+    assert list(state.recon_history) == [3.0, 4.0]
+    assert state.snapshot.recon_history.tolist() == [3.0, 4.0]
+    assert (state.snapshot.recon_min, state.snapshot.recon_max) == (3.0, 4.0)
+    assert list(state.coverage_history) == [0.3, 0.4]
+
+
+def test_snapshot_is_replaced_not_mutated() -> None:
+    state = SharedState(max_points=3)
+    state.update_latency("live", 1.0)
+    before = state.snapshot
+    state.update_latency("live", 2.0)
+    state.update_summary(5.0, 100.0)
+    assert before.live_history.tolist() == [1.0]
+    assert state.snapshot.live_history.tolist() == [1.0, 2.0]
+    assert state.snapshot.live_pl == 5.0
+    state.candle_interval = 1
+    state.update_tick(1.0, 0.0)
+    state.update_tick(2.0, 1.0)
+    assert state.snapshot.candles is state.candles_arr
+    assert state.snapshot.instrument_last_close == 1.0
+
+
+def test_dirty_flag_set_on_closed_candle_not_on_tick() -> None:
+    state = SharedState()
+    state.candle_interval = 5
+    state.update_tick(1.0, 100.0)
+    state.dirty.clear()
+    state.update_tick(1.1, 101.0)
+    assert not state.dirty.is_set()
+    state.update_tick(1.2, 105.0)
+    assert state.dirty.is_set()
+    state.dirty.clear()
+    state.update_scores({"coverage": 0.5})
+    assert state.dirty.is_set()
+
+
+def test_update_instrument_accepts_dicts_or_array() -> None:
+    state = SharedState(max_candles=2)
+    candles = [{"o": 1.0, "h": 2.0, "l": 0.5, "c": 1.5, "v": 3, "ts": float(i)} for i in range(3)]
+    state.update_instrument(candles, ["a", "b", "c"], 3)
+    from_dicts = state.candles_arr
+    state.update_instrument(np.array([[1.0, 2.0, 0.5, 1.5, 3, float(i)] for i in range(3)]), ["c"], 3)
+    assert from_dicts.tolist() == state.candles_arr.tolist()
+    assert state.candles_arr[:, 5].tolist() == [1.0, 2.0]
+    assert state.instrument_last_close == 1.5
+    assert state.snapshot.instrument_last_ts == "c"
+
+
+def test_update_file_times_only_dirties_on_change() -> None:
+    state = SharedState()
+    state.update_file_times(1.0, 2.0, None)
+    assert state.snapshot.pred_file_mtime == 2.0
+    state.dirty.clear()
+    state.update_file_times(1.0, 2.0, None)
+    assert not state.dirty.is_set()
+
+
+def test_file_notifier_wakes_on_write(tmp_path: Path) -> None:
+    pytest.importorskip("watchdog")
+    path = tmp_path / "recon.jsonl"
+    path.write_text("{}\n", encoding="utf-8")
+    notifier = FileChangeNotifier()
+    wake = threading.Event()
+    notifier.register(str(path), wake)
+    timer = threading.Timer(0.2, lambda: path.write_text('{"recon": 1}\n', encoding="utf-8"))
+    timer.start()
+    start = time.monotonic()
+    assert notifier.wait([str(path)], wake, 10.0)
+    assert time.monotonic() - start < 5.0
+
+
+def test_tail_job_skips_unchanged_file(tmp_path: Path) -> None:
+    path = tmp_path / "recon.jsonl"
+    path.write_text('{"recon": 1.0}\n', encoding="utf-8")
+    seen = []
+    job = tail_job(str(path), seen.append)
+    job()
+    job()
+    assert seen == [{"recon": 1.0}]
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"recon": 2.0}\n')
+    job()
+    assert seen == [{"recon": 1.0}, {"recon": 2.0}]
+
+
+def test_update_predictions_caches_horizon_arrays() -> None:
+    state = SharedState()
+    state.update_predictions(
+        {
+            "horizon": [
+                {"step": 1, "mean": 1.0, "low": 0.9, "high": 1.1},
+                {"step": 2, "mean": 1.2, "low": None, "high": 1.4},
+            ]
+        }
+    )
+    assert state.pred_means.tolist() == [1.0, 1.2]
+    assert state.pred_lows.tolist() == [0.9]
+    assert state.pred_low_min == 0.9
+    assert state.pred_high_max == 1.4
+    assert (state.pred_step1_mean, state.pred_stepN_mean) == (1.0, 1.2)
+
+    state.update_predictions(None)
+    assert state.pred_means.size == 0
+    assert state.pred_low_min is None
+
+
+def test_overlay_surface_clears_previous_draw() -> None:
+    overlay = OverlaySurface()
+    surface = overlay.begin((20, 10))
+    overlay.mark(pygame.draw.rect(surface, (255, 0, 0, 128), pygame.Rect(2, 2, 4, 4)))
+    assert surface.get_at((3, 3)).a == 128
+    again = overlay.begin((20, 10))
+    assert again is surface
+    assert again.get_at((3, 3)).a == 0
+
+
+def test_overlay_surface_holds_keyed_drawing() -> None:
+    overlay = OverlaySurface()
+    assert not overlay.holds((20, 10), "a")
+    overlay.begin((20, 10), "a")
+    assert overlay.holds((20, 10), "a")
+    assert not overlay.holds((20, 10), "b")
+    assert not overlay.holds((30, 10), "a")
+
+
+def test_render_text_reuses_surfaces() -> None:
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    first = _render_text(font, "0s", (180, 180, 180))
+    assert _render_text(font, "0s", (180, 180, 180)) is first
+    assert _render_text(font, "0s", (200, 200, 200)) is not first
+
+
+def test_axis_labels_reuse_blits_below_display_precision() -> None:
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    surface = pygame.Surface((200, 100))
+    rect = pygame.Rect(0, 0, 200, 100)
+    _axis_label_blits.cache_clear()
+    draw_axis_labels(surface, rect, [1.30001, 1.40001], font, span_seconds=60)
+    draw_axis_labels(surface, rect, [1.30002, 1.40002], font, span_seconds=60)
+    assert _axis_label_blits.cache_info().hits == 1
+
+
+def test_draw_dashed_line_inks_alternate_steps() -> None:
+    surface = pygame.Surface((40, 10))
+    draw_dashed_line(surface, [(0, 5), (24, 5), (24, 5)], (255, 255, 255))
+    inked = [x for x in range(30) if surface.get_at((x, 5)).r]
+    assert inked == [0, 1, 2, 3, 4, 5, 6, 12, 13, 14, 15, 16, 17, 18]
+
+
+@pytest.mark.asyncio
+async def test_latency_loop_builds_clients_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[str] = []
+
+    class FakeClient:
+        async def list_accounts(self) -> dict:
+            return {}
+
+    def fake_loader(path: str, group: str, account: str) -> FakeClient:
+        built.append(group)
+        return FakeClient()
+
+    sleeps = 0
+
+    async def fake_sleep(seconds: float) -> None:
+        nonlocal sleeps
+        sleeps += 1
+        if sleeps == 3:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(dashboard, "load_account_client_async", fake_loader)
+    monkeypatch.setattr(dashboard.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(dashboard, "account_groups_signature", lambda path: (1, 100))
+    dashboard._cached_account_client.cache_clear()
+    state = SharedState(max_points=5)
+    with pytest.raises(asyncio.CancelledError):
+        await dashboard.latency_loop(state, 5.0)
+    dashboard._cached_account_client.cache_clear()
+    assert built == ["demo", "live"]
+    assert len(state.practice_history) == 3
+    assert len(state.live_history) == 3
+
+
+@pytest.mark.asyncio
+async def test_supervise_stream_loop_restarts_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def failing_stream(*args) -> None:
+        raise RuntimeError("no accounts.yaml")
+
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+        if len(delays) == 4:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(dashboard, "stream_loop", failing_stream)
+    monkeypatch.setattr(dashboard, "_log_dashboard_event", lambda message: None)
+    monkeypatch.setattr(dashboard.asyncio, "sleep", fake_sleep)
+    state = SharedState()
+    with pytest.raises(asyncio.CancelledError):
+        await dashboard.supervise_stream_loop(state, "live", "Primary", "USD_CAD", backoff_max_seconds=4.0)
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+    snapshot = state.stream_metrics.snapshot()
+    assert snapshot.errors == 4
+    assert snapshot.reconnect_waits == 4
+    assert snapshot.last_error == "no accounts.yaml"
+
+
+def test_env_helpers_treat_blank_as_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OANDA_DASHBOARD_TEST_VALUE", "  ")
+    assert dashboard._env_int("OANDA_DASHBOARD_TEST_VALUE", 5) == 5
+    assert dashboard._env_float("OANDA_DASHBOARD_TEST_VALUE", 1.5) == 1.5
+    assert dashboard._env_bool("OANDA_DASHBOARD_TEST_VALUE", True) is True
+    monkeypatch.setenv("OANDA_DASHBOARD_TEST_VALUE", " 7 ")
+    assert dashboard._env_int("OANDA_DASHBOARD_TEST_VALUE", 5) == 7
+
+
+def test_summary_float_reads_optional_fields() -> None:
+    summary = {"pl": "12.5", "balance": None}
+    assert dashboard._summary_float(dashboard._get_pl, summary) == 12.5
+    assert dashboard._summary_float(dashboard._get_balance, summary) is None
+    assert dashboard._summary_float(dashboard._get_pl, {}) is None
+
+
+def test_stop_async_loop_cancels_tasks_and_closes_shared_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed = []
+
+    async def fake_close_shared_sessions() -> None:
+        closed.append(asyncio.get_running_loop())
+
+    monkeypatch.setattr(dashboard, "close_shared_sessions", fake_close_shared_sessions)
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(asyncio.sleep(3600))
+    runner = threading.Thread(target=loop.run_forever)
+    runner.start()
+    try:
+        dashboard.stop_async_loop(loop, [task])
+        runner.join(timeout=5)
+        assert not runner.is_alive()
+        assert task.cancelled()
+        assert closed == [loop]
+    finally:
+        loop.close()
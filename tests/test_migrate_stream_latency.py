@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts import migrate_stream_latency
+
+
+def test_migrate_keeps_non_finite_floats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    src = tmp_path / "stream_latency.jsonl"
+    dst = tmp_path / "out" / "stream_latency_v2.jsonl"
+    rows = [
+        {"latency_ms": 12.5},
+        {"latency_ms": float("nan"), "mode": "practice"},
+        {"latency_ms": float("inf"), "mode": "live", "instrument": "EUR_USD"},
+    ]
+    src.write_text("".join(json.dumps(row) + "\n" for row in rows) + "\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["migrate_stream_latency.py", "--input", str(src), "--output", str(dst)])
+    migrate_stream_latency.main()
+
+    lines = dst.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert "NaN" in lines[1] and "Infinity" in lines[2]
+    migrated = [json.loads(line) for line in lines]
+    assert migrated[0] == {"latency_ms": 12.5, "mode": "live", "instrument": "USD_CAD"}
+    assert migrated[1]["mode"] == "practice" and migrated[1]["instrument"] == "USD_CAD"
+    assert migrated[1]["latency_ms"] != migrated[1]["latency_ms"]
+    assert migrated[2]["instrument"] == "EUR_USD" and migrated[2]["latency_ms"] == float("inf")
@@ -13,3 +13,35 @@ def test_write_jsonl(tmp_path: Path) -> None:
     _write_jsonl(str(path), payload)
     data = json.loads(path.read_text(encoding="utf-8").strip())
     assert data["ok"] is True
+
+
+def test_measure_account_latency_reuses_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from oanda_autotrader import monitor
+
+    accounts = tmp_path / "accounts.yaml"
+    accounts.write_text("demo: {}\n", encoding="utf-8")
+    built = []
+
+    class FakeClient:
+        def list_accounts(self) -> dict:
+            return {"accounts": []}
+
+    def fake_loader(path: str, group: str, account: str) -> FakeClient:
+        built.append(group)
+        return FakeClient()
+
+    monkeypatch.setattr(monitor, "load_account_client", fake_loader)
+    monitor._cached_account_client.cache_clear()
+    try:
+        for _ in range(3):
+            response, elapsed_ms = monitor.measure_account_latency(str(accounts), "demo", "Primary")
+        assert response == {"accounts": []}
+        assert elapsed_ms >= 0.0
+        assert built == ["demo"]
+
+        # A rewritten accounts.yaml (rotated token) builds a fresh client.
+        accounts.write_text("demo: {token: rotated}\n", encoding="utf-8")
+        monitor.measure_account_latency(str(accounts), "demo", "Primary")
+        assert built == ["demo", "demo"]
+    finally:
+        monitor._cached_account_client.cache_clear()
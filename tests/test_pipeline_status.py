@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.pipeline_status import _last_json_line
+
+
+def test_last_json_line_reads_line_longer_than_window(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.jsonl"
+    last = {"ts": "2026-01-01T00:00:05Z", "pad": "x" * 200_000}
+    path.write_text(json.dumps({"ts": "2026-01-01T00:00:00Z"}) + "\n" + json.dumps(last) + "\n", encoding="utf-8")
+    assert _last_json_line(str(path)) == last
+
+    # The same long line with nothing before it spans the whole file.
+    path.write_text(json.dumps(last), encoding="utf-8")
+    assert _last_json_line(str(path)) == last
+
+
+def test_last_json_line_skips_trailing_blank_lines(tmp_path: Path) -> None:
+    path = tmp_path / "scores.jsonl"
+    path.write_bytes(b'{"n": 1}\r\n{"n": 2}\r\n  \n\n')
+    assert _last_json_line(str(path)) == {"n": 2}
+
+    # A blank tail wider than the first window is widened past, not given up on.
+    path.write_bytes(b'{"n": 3}\n' + b"\n" * 100_000)
+    assert _last_json_line(str(path)) == {"n": 3}
+
+
+def test_last_json_line_empty_missing_or_blank(tmp_path: Path) -> None:
+    path = tmp_path / "monitor.jsonl"
+    path.write_bytes(b"")
+    assert _last_json_line(str(path)) is None
+    path.write_bytes(b"\n \n")
+    assert _last_json_line(str(path)) is None
+    path.write_bytes(b'{"n": 4')
+    assert _last_json_line(str(path)) is None
+    assert _last_json_line(str(tmp_path / "missing.jsonl")) is None
+
+
+def test_last_json_line_reads_non_finite_floats(tmp_path: Path) -> None:
+    path = tmp_path / "monitor.jsonl"
+    path.write_text(json.dumps({"loss": float("nan"), "n": 1}) + "\n", encoding="utf-8")
+    last = _last_json_line(str(path))
+    assert last is not None
+    assert last["n"] == 1
+    assert last["loss"] != last["loss"]
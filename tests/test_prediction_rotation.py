@@ -1,9 +1,29 @@
 from __future__ import annotations
 
 import json
+import math
+import time
 from pathlib import Path
 
-from scripts.train_autoencoder_loop import write_json_latest
+import numpy as np
+import pytest
+import torch
+
+from scripts.train_autoencoder_loop import (
+    FEATURE_NAMES,
+    AutoEncoderPredictor,
+    FeatureCache,
+    FeatureWatch,
+    _append_handles,
+    _close_append_handles,
+    build_horizon,
+    load_checkpoint,
+    save_checkpoint,
+    standardize,
+    load_matrix,
+    write_json_latest,
+    write_jsonl,
+)
 
 
 def test_write_json_latest_overwrites(tmp_path: Path) -> None:
@@ -22,3 +42,128 @@ def test_archive_path_format(tmp_path: Path) -> None:
     archive_path = archive_dir / "predictions_20260101_0101.jsonl"
     archive_path.write_text(json.dumps(payload) + "\n", encoding="utf-8")
     assert archive_path.exists()
+
+
+def _feature_row(close: float) -> str:
+    row = {name: close for name in FEATURE_NAMES}
+    return json.dumps(row) + "\n"
+
+
+def test_feature_cache_matches_full_reload(tmp_path: Path) -> None:
+    path = tmp_path / "usd_cad_features.jsonl"
+    path.write_text(_feature_row(1.0) + _feature_row(1.1), encoding="utf-8")
+    cache = FeatureCache(str(path))
+
+    def assert_matches() -> None:
+        for cached, full in zip(cache.load(), load_matrix(str(path))):
+            assert np.array_equal(cached, full)
+
+    assert_matches()
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(_feature_row(1.2) + '{"close": null}\n' + _feature_row(1.3).rstrip("\n"))
+    assert_matches()
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write("\n" + _feature_row(1.4))
+    assert_matches()
+
+    # build_features rewrites the file in place with different rows.
+    rewritten = "".join(_feature_row(close) for close in (2.0, 2.1, 2.2, 2.3, 2.4, 2.5))
+    path.write_text(rewritten, encoding="utf-8")
+    assert_matches()
+    assert cache.load()[1].tolist() == load_matrix(str(path))[1].tolist()
+
+
+def test_build_horizon_matches_running_sums() -> None:
+    rng = np.random.default_rng(0)
+    pred_deltas = rng.normal(0, 1e-4, 12).astype(np.float32)
+    pred_std = np.abs(rng.normal(0, 1e-4, 12)).astype(np.float32)
+    horizon = build_horizon(pred_deltas, pred_std, 1.36916, 1.5, 12)
+
+    cum_mu = 0.0
+    cum_var = 0.0
+    for i, item in enumerate(horizon, start=1):
+        cum_mu += float(pred_deltas[i - 1])
+        cum_var += float(pred_std[i - 1]) ** 2
+        band = 1.5 * math.sqrt(cum_var)
+        assert item["step"] == i
+        assert item["mean"] == 1.36916 + cum_mu
+        assert (item["low"], item["high"]) == (item["mean"] - band, item["mean"] + band)
+
+    # Missing sigmas count as zero width.
+    short = build_horizon(pred_deltas, pred_std[:2], 1.0, 1.5, 4)
+    assert [item["sigma"] for item in short][2:] == [0.0, 0.0]
+
+
+def test_write_jsonl_reuses_handles_and_caps_them(tmp_path: Path) -> None:
+    paths = [str(tmp_path / "out" / f"predictions_{i}.jsonl") for i in range(12)]
+    for path in paths:
+        write_jsonl(path, {"run": 1})
+    write_jsonl(paths[-1], {"run": 2})
+    try:
+        assert len(_append_handles) <= 8
+        lines = Path(paths[-1]).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["run"] for line in lines] == [1, 2]
+        assert json.loads(Path(paths[0]).read_text(encoding="utf-8")) == {"run": 1}
+    finally:
+        _close_append_handles()
+
+
+def test_standardize_matches_numpy_mean_std() -> None:
+    rng = np.random.default_rng(1)
+    values = (rng.normal(5, 3, (500, 6)) * [1e-4, 1, 10, 1e3, 1, 1]).astype(np.float32)
+    values[:, 4] = 2.0
+    normalized, mean, std = standardize(values)
+    expected_std = values.std(axis=0)
+    expected_std[expected_std == 0] = 1.0
+    assert np.array_equal(mean, values.mean(axis=0))
+    assert np.array_equal(std, expected_std)
+    assert np.array_equal(normalized, (values - mean) / expected_std)
+    assert normalized.dtype == np.float32
+
+
+def test_feature_watch_waits_for_appended_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "usd_cad_features.jsonl"
+    path.write_text("{}\n", encoding="utf-8")
+    watch = FeatureWatch(str(path), poll_s=0.01)
+    seen = watch.signature()
+
+    # A change made before the call returns without waiting on it.
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write("{}\n")
+    appended = watch.signature()
+    assert appended != seen
+    started = time.monotonic()
+    watch.wait(seen, 0.0)
+    assert time.monotonic() - started < 5.0
+
+    # Unchanged rows keep it polling until the signature moves.
+    checks = iter([appended, appended, appended, (0, 0, 0)])
+    calls = []
+    monkeypatch.setattr(watch, "signature", lambda: calls.append(1) or next(checks))
+    watch.wait(appended, 0.0)
+    assert len(calls) == 4
+    assert FeatureWatch(str(tmp_path / "missing.jsonl")).signature() is None
+
+
+def test_checkpoint_round_trip_and_size_mismatch(tmp_path: Path) -> None:
+    path = str(tmp_path / "models" / "ae.pt")
+    model = AutoEncoderPredictor(len(FEATURE_NAMES), 8, 12)
+    optim = torch.optim.Adam(model.parameters(), lr=1e-3)
+    model(torch.randn(4, len(FEATURE_NAMES)))[1].sum().backward()
+    optim.step()
+    save_checkpoint(path, model, optim)
+
+    restored = AutoEncoderPredictor(len(FEATURE_NAMES), 8, 12)
+    restored_optim = torch.optim.Adam(restored.parameters(), lr=1e-3)
+    assert load_checkpoint(path, restored, restored_optim, torch.device("cpu"))
+    for name, value in model.state_dict().items():
+        assert torch.equal(restored.state_dict()[name], value)
+    assert restored_optim.state_dict()["state"].keys() == optim.state_dict()["state"].keys()
+
+    other = AutoEncoderPredictor(len(FEATURE_NAMES), 8, 5)
+    before = {name: value.clone() for name, value in other.state_dict().items()}
+    other_optim = torch.optim.Adam(other.parameters(), lr=1e-3)
+    assert not load_checkpoint(path, other, other_optim, torch.device("cpu"))
+    for name, value in other.state_dict().items():
+        assert torch.equal(before[name], value)
+    assert not load_checkpoint(str(tmp_path / "missing.pt"), other, other_optim, torch.device("cpu"))
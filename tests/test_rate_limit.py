@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -21,3 +22,16 @@ def test_rate_limiter_wait_delays(monkeypatch: pytest.MonkeyPatch) -> None:
     limiter.wait()
     limiter.wait()
     assert called, "Expected sleep to be called for rate limiting"
+
+
+def test_rate_limiter_is_safe_across_threads() -> None:
+    limiter = RateLimiter(1000)
+
+    def burst() -> None:
+        for _ in range(100):
+            limiter.wait()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for future in [pool.submit(burst) for _ in range(8)]:
+            future.result()
+    assert len(limiter._timestamps) == 800
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import scripts.pipeline_status as pipeline_status
+import scripts.readiness_check as readiness_check
+
+
+def _iso(ts: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def write_fresh_pipeline(data_dir: Path, now: float) -> None:
+    (data_dir / "monitor.jsonl").write_text(json.dumps({"ts": _iso(now)}) + "\n", encoding="utf-8")
+    (data_dir / "usd_cad_features.jsonl").write_text("{}\n", encoding="utf-8")
+    (data_dir / "predictions_latest.jsonl").write_text(json.dumps({"ts": _iso(now)}) + "\n", encoding="utf-8")
+    (data_dir / "prediction_scores.jsonl").write_text(
+        json.dumps({"ts": _iso(now - 60), "scored_ts": _iso(now)}) + "\n", encoding="utf-8"
+    )
+    (data_dir / "usd_cad_candles_20260101.jsonl").write_text(
+        json.dumps({"time": _iso(now), "mid": {"c": "1.0"}}) + "\n", encoding="utf-8"
+    )
+
+
+def run_quiet(monkeypatch: pytest.MonkeyPatch, data_dir: Path) -> int:
+    # Readiness flags and pipeline_status flags are mixed on one command line.
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "readiness_check.py",
+            "--quiet",
+            "--features-path",
+            str(data_dir / "usd_cad_features.jsonl"),
+            "--monitor-path",
+            str(data_dir / "monitor.jsonl"),
+            "--pred-path",
+            str(data_dir / "predictions_latest.jsonl"),
+            "--scores-path",
+            str(data_dir / "prediction_scores.jsonl"),
+            "--candles-dir",
+            str(data_dir),
+        ],
+    )
+    with pytest.raises(SystemExit) as exc:
+        readiness_check.main()
+    return exc.value.code
+
+
+def test_quiet_exits_zero_when_everything_is_fresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    write_fresh_pipeline(tmp_path, time.time())
+    assert run_quiet(monkeypatch, tmp_path) == 0
+    assert capsys.readouterr().out == "READY\n"
+
+
+def test_quiet_exits_two_on_stale_or_missing_signal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    now = time.time()
+    write_fresh_pipeline(tmp_path, now)
+    (tmp_path / "predictions_latest.jsonl").write_text(
+        json.dumps({"ts": _iso(now - 3600)}) + "\n", encoding="utf-8"
+    )
+    assert run_quiet(monkeypatch, tmp_path) == 2
+    assert capsys.readouterr().out == "NOT_READY\n"
+
+    # A missing monitor file fails the first probe; the candle scan that
+    # comes last is never reached.
+    write_fresh_pipeline(tmp_path, now)
+    (tmp_path / "monitor.jsonl").unlink()
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("candle directory scanned after a failed probe")
+
+    monkeypatch.setattr(pipeline_status, "_newest_json_line", no_scan)
+    assert run_quiet(monkeypatch, tmp_path) == 2
+    assert capsys.readouterr().out == "NOT_READY\n"
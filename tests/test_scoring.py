@@ -3,7 +3,16 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from scripts.score_predictions import score_once
+import pytest
+
+from scripts.score_predictions import (
+    CandleCache,
+    _candle_second,
+    load_scored_ts,
+    load_scored_ts_index,
+    load_scores,
+    score_once,
+)
 
 
 def write_candle(path: Path, ts: str, close: float) -> None:
@@ -62,3 +71,148 @@ def test_score_once_handles_bad_timestamp(tmp_path: Path) -> None:
     rows = score_path.read_text(encoding="utf-8").strip().splitlines()
     payload = json.loads(rows[0])
     assert payload["coverage"] is None
+
+
+def test_score_once_batches_predictions_and_buckets(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    candle_path = data_dir / "usd_cad_candles_20260101.jsonl"
+    pred_path = tmp_path / "predictions_latest.jsonl"
+    score_path = tmp_path / "prediction_scores.jsonl"
+
+    for second in range(0, 50, 5):
+        write_candle(candle_path, f"2026-01-01T00:00:{second:02d}.000000000Z", 1.0)
+
+    horizon = [{"step": step, "mean": 1.01, "low": 0.99, "high": 1.02} for step in (1, 4, 9)]
+    preds = [
+        {"ts": "2026-01-01T00:00:00Z", "interval_secs": 5, "horizon": horizon},
+        {"ts": "2026-01-01T00:00:00Z", "interval_secs": 5, "horizon": horizon},
+        {"ts": "2026-01-01T00:00:30Z", "interval_secs": 5, "horizon": horizon[:2]},
+    ]
+    pred_path.write_text("".join(json.dumps(p) + "\n" for p in preds), encoding="utf-8")
+
+    scored_ts = {"2025-12-31T00:00:00Z"}
+    score_once(str(pred_path), str(score_path), str(data_dir), scored_ts)
+    rows = [json.loads(line) for line in score_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["ts"] for row in rows] == ["2026-01-01T00:00:00Z", "2026-01-01T00:00:30Z"]
+    assert "2026-01-01T00:00:30Z" in scored_ts
+
+    first = {item["label"]: item for item in rows[0]["buckets"]}
+    assert rows[0]["coverage"] == 1.0
+    assert rows[0]["mae"] == pytest.approx(0.01)
+    assert [first[label]["resolved"] for label in ("1-3", "4-8", "9-12")] == [1, 1, 1]
+
+    second = {item["label"]: item for item in rows[1]["buckets"]}
+    assert [r["actual"] for r in rows[1]["results"]] == [1.0, None]
+    assert rows[1]["results"][1]["hit"] is None
+    assert second["4-8"]["resolved"] == 0
+    assert second["4-8"]["mae"] is None
+
+
+def test_candle_cache_reads_only_appended_lines(tmp_path: Path) -> None:
+    candle_path = tmp_path / "usd_cad_candles_20260101.jsonl"
+    write_candle(candle_path, "1970-01-01T00:00:05.000000000Z", 1.0)
+    cache = CandleCache(str(tmp_path))
+    cache.refresh()
+    secs, closes = cache.index()
+    assert (secs.tolist(), closes.tolist()) == ([5], [1.0])
+
+    write_candle(candle_path, "1970-01-01T00:00:10.000000000Z", 1.1)
+    with open(candle_path, "a", encoding="utf-8") as handle:
+        handle.write('{"time": "1970-01-01T00:00:15.0')
+    cache.refresh()
+    assert cache.index()[0].tolist() == [5, 10]
+
+    with open(candle_path, "a", encoding="utf-8") as handle:
+        handle.write('00000000Z", "mid": {"c": "1.2"}}\n')
+    cache.refresh()
+    assert cache.index()[1].tolist() == [1.0, 1.1, 1.2]
+
+    # An older file arriving later is merged in order; a repeated second
+    # keeps the close read last.
+    write_candle(tmp_path / "usd_cad_candles_20251231.jsonl", "1970-01-01T00:00:10.000000000Z", 2.0)
+    write_candle(tmp_path / "usd_cad_candles_20251231.jsonl", "1970-01-01T00:00:00.000000000Z", 0.9)
+    cache.refresh()
+    secs, closes = cache.index()
+    assert secs.tolist() == [0, 5, 10, 15]
+    assert closes.tolist() == [0.9, 1.0, 2.0, 1.2]
+
+
+def test_candle_cache_rereads_file_rewritten_in_place(tmp_path: Path) -> None:
+    candle_path = tmp_path / "usd_cad_candles_20260101.jsonl"
+    write_candle(candle_path, "1970-01-01T00:00:05.000000000Z", 1.0)
+    cache = CandleCache(str(tmp_path))
+    cache.refresh()
+
+    # Same inode, longer content: the saved offset now falls mid-line.
+    lines = [
+        json.dumps({"time": f"1970-01-01T00:00:{sec:02d}.000000000Z", "mid": {"c": "2.0"}, "pad": "x" * sec})
+        for sec in (5, 10)
+    ]
+    with open(candle_path, "r+", encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n")
+    cache.refresh()
+    secs, closes = cache.index()
+    assert secs.tolist() == [5, 10]
+    assert closes.tolist() == [2.0, 2.0]
+
+    # A replacement file (new inode) is read from the start as well.
+    replacement = tmp_path / "replacement.tmp"
+    write_candle(replacement, "1970-01-01T00:00:05.000000000Z", 3.0)
+    write_candle(replacement, "1970-01-01T00:00:10.000000000Z", 3.0)
+    write_candle(replacement, "1970-01-01T00:00:15.000000000Z", 3.0)
+    replacement.replace(candle_path)
+    cache.refresh()
+    assert cache.index()[1].tolist() == [3.0, 3.0, 3.0]
+
+
+def test_candle_second_only_matches_step_key_layout() -> None:
+    assert _candle_second("1970-01-01T00:01:05.000000000Z") == 65
+    assert _candle_second("1970-01-01 00:01:05.000000000Z") is None
+    assert _candle_second("1970-01-01T00:01:05.500000000Z") is None
+    assert _candle_second("1970-01-01T00:01:05Z") is None
+
+
+def test_load_scored_ts_matches_full_parse(tmp_path: Path) -> None:
+    score_path = tmp_path / "prediction_scores.jsonl"
+    rows = [
+        {"ts": "2026-01-01T00:00:00Z", "coverage": None, "results": []},
+        {"coverage": 1.0, "ts": "2026-01-01T00:00:05Z"},
+        {"ts": 'odd"\\ts'},
+        {"ts": None},
+    ]
+    text = "".join(json.dumps(row) + "\n\n" for row in rows)
+    text += '{"ts":"2026-01-01T00:00:10Z","coverage":null}\n'
+    score_path.write_text(text, encoding="utf-8")
+    assert load_scored_ts(str(score_path)) == {row.get("ts") for row in load_scores(str(score_path))}
+    assert load_scored_ts(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_scored_ts_index_tracks_scores_file(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    pred_path = tmp_path / "predictions_latest.jsonl"
+    score_path = tmp_path / "prediction_scores.jsonl"
+    index_path = str(score_path) + ".idx"
+    score_path.write_text(json.dumps({"ts": "2026-01-01T00:00:00Z"}) + "\n", encoding="utf-8")
+
+    scored_ts = load_scored_ts_index(str(score_path), index_path)
+    assert scored_ts == {"2026-01-01T00:00:00Z"}
+
+    pred = {"ts": "2026-01-01T00:00:05Z", "interval_secs": 5, "horizon": []}
+    pred_path.write_text(json.dumps(pred) + "\n", encoding="utf-8")
+    score_once(str(pred_path), str(score_path), str(data_dir), scored_ts, index_path=index_path)
+    assert Path(index_path).read_text(encoding="utf-8").splitlines() == [
+        "2026-01-01T00:00:00Z",
+        "2026-01-01T00:00:05Z",
+    ]
+    assert load_scored_ts_index(str(score_path), index_path) == scored_ts
+
+
+def test_scored_ts_index_ignored_without_scores_file(tmp_path: Path) -> None:
+    score_path = tmp_path / "prediction_scores.jsonl"
+    index_path = tmp_path / "prediction_scores.jsonl.idx"
+    index_path.write_text("2026-01-01T00:00:00Z\n", encoding="utf-8")
+
+    assert load_scored_ts_index(str(score_path), str(index_path)) == set()
+    assert not index_path.exists()
@@ -1,8 +1,16 @@
 from datetime import datetime, timezone
+import time
 
 from oanda_autotrader.stream_metrics import StreamMetrics
 
 
+def _recent_second() -> tuple[float, str]:
+    # Readers only count samples from the last window of wall-clock time, so
+    # latency fixtures are anchored on the current second.
+    base = float(int(time.time()))
+    return base, datetime.fromtimestamp(base, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
 def test_stream_metrics_counts_messages() -> None:
     metrics = StreamMetrics(window_seconds=10)
     metrics.on_event({"event": "stream_message", "received_ts": 1.0})
@@ -24,8 +32,8 @@ def test_stream_metrics_errors_and_reconnects() -> None:
 
 def test_stream_metrics_latency_parsing() -> None:
     metrics = StreamMetrics(window_seconds=10)
-    base = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()
-    metrics.record_latency("2026-01-01T00:00:00.123456789Z", base + 0.5)
+    base, stamp = _recent_second()
+    metrics.record_latency(f"{stamp}.123456789Z", base + 0.5)
     last, p95, mean = metrics.latency_stats()
     assert last is not None
     assert p95 is not None
@@ -59,12 +67,12 @@ def test_stream_metrics_negative_outlier_clamped() -> None:
 
 def test_stream_metrics_effective_ms_with_offset() -> None:
     metrics = StreamMetrics(window_seconds=10)
-    base = datetime(2026, 1, 1, 0, 0, 10, tzinfo=timezone.utc).timestamp()
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.2)
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.2)
+    base, stamp = _recent_second()
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.2)
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.2)
     assert metrics.clock_offset_ms > 0.0
     assert metrics.last_effective_ms == 0.0
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.16)
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.16)
     eff_last, eff_p95, _ = metrics.effective_latency_stats()
     assert eff_last is not None
     assert eff_p95 is not None
@@ -73,12 +81,12 @@ def test_stream_metrics_effective_ms_with_offset() -> None:
 
 def test_stream_metrics_snapshot_uses_effective_p95() -> None:
     metrics = StreamMetrics(window_seconds=10)
-    base = datetime(2026, 1, 1, 0, 0, 10, tzinfo=timezone.utc).timestamp()
+    base, stamp = _recent_second()
     # Two negatives establish a ~120ms offset.
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.12)
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.12)
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.12)
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.12)
     # Slightly less negative raw yields positive effective.
-    metrics.record_latency("2026-01-01T00:00:10.000000000Z", base - 0.08)
+    metrics.record_latency(f"{stamp}.000000000Z", base - 0.08)
     snap = metrics.snapshot()
     assert snap.latency_p95_ms is not None
     assert snap.latency_p95_ms > 0.0
@@ -90,3 +98,44 @@ def test_stream_metrics_backlog_flag() -> None:
     base = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()
     metrics.record_latency("2026-01-01T00:00:00.000000000Z", base + 5.0)
     assert metrics.last_backlog is True
+
+
+def test_stream_metrics_rate_reads_without_trimming() -> None:
+    metrics = StreamMetrics(window_seconds=10)
+    now = time.time()
+    for ts in (now - 30.0, now - 5.0, now - 1.0):
+        metrics.on_event({"event": "stream_message", "received_ts": ts})
+    metrics._message_ts.appendleft(now - 60.0)
+    assert metrics.messages_per_second() == 0.2
+    assert len(metrics._message_ts) == 3
+
+
+def test_stream_metrics_snapshot_refreshes_latency_stats() -> None:
+    metrics = StreamMetrics(window_seconds=10)
+    base, stamp = _recent_second()
+    metrics.record_latency(f"{stamp}.000000000Z", base + 0.1)
+    first = metrics.snapshot()
+    assert metrics.snapshot().latency_p95_ms == first.latency_p95_ms
+    metrics.record_latency(f"{stamp}.000000000Z", base + 0.3)
+    assert metrics.snapshot().latency_last_ms == metrics.last_effective_ms
+    assert metrics.snapshot().latency_p95_ms > first.latency_p95_ms
+    metrics.on_event({"event": "stream_message", "received_ts": base + 60.0})
+    assert metrics.snapshot().latency_p95_ms is None
+
+
+def test_stream_metrics_latency_ages_out_when_stream_stalls(monkeypatch) -> None:
+    metrics = StreamMetrics(window_seconds=10)
+    base, stamp = _recent_second()
+    metrics.record_latency(f"{stamp}.000000000Z", base + 0.2)
+    assert metrics.snapshot().latency_p95_ms is not None
+
+    # No further messages: the samples are never trimmed, but reads past the
+    # window no longer count them.
+    monkeypatch.setattr(time, "time", lambda: base + 30.0)
+    assert metrics.latency_stats() == (None, None, None)
+    assert metrics.effective_latency_stats() == (None, None, None)
+    snap = metrics.snapshot()
+    assert snap.latency_p95_ms is None
+    assert snap.latency_clamped_mean_ms is None
+    assert snap.messages_per_sec == 0.0
+    assert len(metrics._latency_samples) == 1